@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+"""
+Benchmark Script - Measures hot paths of the scheduler and clearing services
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import discord
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.utils.schedule_table import (
+    KIND_CRON,
+    KIND_INTERVAL,
+    US_PER_SECOND,
+    ScheduleTable,
+)
+
+BENCHMARK_TIMEZONES = [
+    "UTC",
+    "America/New_York",
+    "Europe/Copenhagen",
+    "Asia/Kolkata",
+    "Australia/Sydney",
+    "America/Santiago",
+]
+
+
+def build_random_schedule_table(
+    count: int, now: datetime, seed: int = 0
+) -> ScheduleTable:
+    """Random mix of interval and cron rows resembling real subscriptions"""
+    rng = np.random.default_rng(seed)
+    now_us = int(now.timestamp()) * US_PER_SECOND
+
+    kind = np.where(rng.random(count) < 0.6, KIND_INTERVAL, KIND_CRON)
+    interval_us = rng.integers(1, 7 * 24 * 60, count) * 60 * US_PER_SECOND
+    anchor_us = now_us + rng.integers(-7 * 86400, 7 * 86400, count) * US_PER_SECOND
+    minute = rng.integers(0, 60, count)
+    hour_mask = np.where(
+        rng.random(count) < 0.8,
+        1 << rng.integers(0, 24, count),
+        rng.integers(1, 1 << 24, count),
+    )
+    weekday_mask = np.where(
+        rng.random(count) < 0.7, 0b1111111, rng.integers(1, 1 << 7, count)
+    )
+    tz_index = rng.integers(0, len(BENCHMARK_TIMEZONES), count)
+
+    return ScheduleTable(
+        keys=range(count),
+        kind=kind,
+        interval_us=interval_us,
+        anchor_us=anchor_us,
+        minute=minute,
+        hour_mask=hour_mask,
+        weekday_mask=weekday_mask,
+        tz_index=tz_index,
+        timezones=[ZoneInfo(name) for name in BENCHMARK_TIMEZONES],
+    )
+
+
+def benchmark_schedule_table(args) -> int:
+    now = (
+        datetime.fromisoformat(args.now).astimezone(timezone.utc)
+        if args.now
+        else datetime.now(timezone.utc)
+    )
+
+    print(f"Building schedule table with {args.timers:,} timers...")
+    table = build_random_schedule_table(args.timers, now, args.seed)
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        table.next_fire_times(now)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    print(
+        f"Vectorized pass: best {best * 1000:.1f} ms "
+        f"({best / args.timers * 1e9:.0f} ns per timer)"
+    )
+
+    sample_size = min(args.sample, args.timers)
+    rows = np.random.default_rng(args.seed + 1).choice(
+        args.timers, sample_size, replace=False
+    )
+    triggers = [table._trigger(int(row)) for row in rows]
+    after_now = now + timedelta(microseconds=1)
+    start = time.perf_counter()
+    for trigger in triggers:
+        trigger.get_next_fire_time(None, after_now)
+    per_trigger = (time.perf_counter() - start) / sample_size
+    print(
+        f"APScheduler per trigger: {per_trigger * 1e6:.1f} µs "
+        f"(~{per_trigger * args.timers:.1f} s for {args.timers:,} timers, "
+        f"{per_trigger * args.timers / best:.0f}x slower)"
+    )
+
+    mismatches = table.verify(now, (int(row) for row in rows))
+    print(f"Verified {sample_size:,} rows against APScheduler: {len(mismatches)} mismatches")
+    for key, actual, expected in mismatches[:10]:
+        print(f"  row {key}: table {actual.isoformat()} != apscheduler {expected}")
+
+    return 1 if mismatches else 0
+
+
+def run_scheduler_simulation(args) -> int:
+    from src.simulation import SimulationConfig, run_simulation
+
+    config = SimulationConfig(
+        channels=args.channels,
+        duration_hours=args.hours,
+        start=(
+            datetime.fromisoformat(args.start).astimezone(timezone.utc)
+            if args.start
+            else None
+        ),
+        seed=args.seed,
+        messages_per_hour=args.messages_per_hour,
+        rest_requests_per_second=args.rest_rate,
+        api_latency_seconds=args.api_latency_ms / 1000,
+        verbose=args.verbose,
+    )
+    report = run_simulation(config)
+    output = json.dumps(report, indent=2)
+
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+    return 0
+
+
+async def collect_then_delete(channel, sleep, bulk_cutoff: datetime) -> int:
+    """Reference strategy: read the whole history before deleting anything"""
+    recent_messages, old_messages = [], []
+    last_message = None
+    while True:
+        batch = [
+            message
+            async for message in channel.history(limit=1000, before=last_message)
+        ]
+        for message in batch:
+            if message.created_at > bulk_cutoff:
+                recent_messages.append(message)
+            else:
+                old_messages.append(message)
+        if len(batch) < 1000:
+            break
+        last_message = batch[-1]
+
+    for i in range(0, len(recent_messages), 100):
+        batch = recent_messages[i : i + 100]
+        try:
+            await channel.delete_messages(batch)
+        except discord.HTTPException:
+            # The original fallback: the whole batch one by one
+            for message in batch:
+                await message.delete()
+                await sleep(1.0)
+    for message in old_messages:
+        await message.delete()
+        await sleep(1.0)
+    return len(recent_messages) + len(old_messages)
+
+
+async def measure_clear(args) -> dict:
+    from src.models import Server
+    from src.services.clear_job_scheduler_service import SchedulerService
+    from src.services.message_clearing_service import MessageService
+    from src.simulation import (
+        FakeClock,
+        FakeGuild,
+        FakeRestBudget,
+        FakeTextChannel,
+        SimulatedDataService,
+    )
+    from src.utils.logger import logger
+
+    logger.console_enabled = False
+    logger.db_enabled = False
+
+    clock = FakeClock(datetime(2026, 1, 5, tzinfo=timezone.utc))
+    rest = FakeRestBudget(clock, args.rest_rate, args.api_latency_ms / 1000)
+    guild = FakeGuild(id=1)
+    bulk_cutoff_id = discord.utils.time_snowflake(clock.now() - timedelta(days=13))
+    # Channels of one guild, cleared at the same time
+    channels = [
+        FakeTextChannel(index + 1, guild, clock, rest, messages_per_hour=0)
+        for index in range(args.channels)
+    ]
+    rng = random.Random(0)
+    for channel in channels:
+        channel.prefill(args.messages, timedelta(days=args.days))
+        recent_ids = [
+            message_id for message_id in channel._ids if message_id > bulk_cutoff_id
+        ]
+        channel.bulk_rejected_ids = set(
+            rng.sample(recent_ids, min(args.rejected_messages, len(recent_ids)))
+        )
+
+    data_service = SimulatedDataService()
+    server = Server(str(guild.id), guild.name)
+    for channel in channels:
+        server.add_channel(str(channel.id), "24h", clock.now())
+    data_service.add_simulated_server(server)
+    message_service = MessageService(
+        data_service,
+        SchedulerService(data_service, clock=clock.now, sleep=clock.sleep),
+        clock=clock.now,
+        sleep=clock.sleep,
+    )
+    message_service.pipeline_queue_pages = args.queue_pages
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    started_at = clock.now()
+    wall_start = time.perf_counter()
+
+    async def clear_with_legacy_pass(channel) -> int:
+        deleted = await message_service._perform_message_deletion(channel)
+        # Older messages are deleted by a background pass the clear starts
+        legacy = await message_service.wait_for_legacy_pass(str(channel.id))
+        return deleted + (legacy.deleted_count if legacy else 0)
+
+    async def clear_by_recreating(channel) -> int:
+        result = await message_service.execute_channel_message_clear(channel)
+        if result.recreated_channel_id is None:
+            legacy = await message_service.wait_for_legacy_pass(str(channel.id))
+            return result.deleted_count + (legacy.deleted_count if legacy else 0)
+        return channel.message_count
+
+    if args.strategy == "pipeline":
+        clears = [clear_with_legacy_pass(channel) for channel in channels]
+    elif args.strategy == "recreate":
+        for channel_timer in server.channels.values():
+            channel_timer.allow_recreate = True
+        clears = [clear_by_recreating(channel) for channel in channels]
+    else:
+        bulk_cutoff = clock.now() - timedelta(days=13)
+        clears = [
+            collect_then_delete(channel, clock.sleep, bulk_cutoff) for channel in channels
+        ]
+    deleted = sum(await clock.run_until_complete(asyncio.gather(*clears)))
+    first_delete_at = min(
+        (channel.first_delete_at for channel in channels if channel.first_delete_at),
+        default=None,
+    )
+
+    wall_seconds = time.perf_counter() - wall_start
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {
+        "strategy": args.strategy,
+        "messages": args.messages * args.channels,
+        "deleted": deleted,
+        "api_calls": rest.total_calls,
+        "rate_limited_responses": guild.delete_bucket.rate_limited_responses,
+        "bulk_delete_failures": (
+            sum(message_service.get_bulk_delete_failures().values())
+            if args.strategy != "collect"
+            else None
+        ),
+        "virtual_seconds": round((clock.now() - started_at).total_seconds(), 2),
+        "time_to_first_delete_seconds": (
+            round((first_delete_at - started_at).total_seconds(), 2)
+            if first_delete_at
+            else None
+        ),
+        "peak_traced_mb": round(traced_peak / 2**20, 2),
+        "peak_rss_growth_mb": round((rss_after - rss_before) / 1024, 2),
+        "wall_seconds": round(wall_seconds, 2),
+    }
+
+
+def benchmark_clear_pipeline(args) -> int:
+    if args.strategy != "both":
+        print(json.dumps(asyncio.run(measure_clear(args))))
+        return 0
+
+    # Peak RSS never goes down, so each strategy gets a fresh process
+    for strategy in ("collect", "pipeline"):
+        command = [
+            sys.executable,
+            __file__,
+            "clear-pipeline",
+            "--messages",
+            str(args.messages),
+            "--channels",
+            str(args.channels),
+            "--days",
+            str(args.days),
+            "--rest-rate",
+            str(args.rest_rate),
+            "--api-latency-ms",
+            str(args.api_latency_ms),
+            "--queue-pages",
+            str(args.queue_pages),
+            "--rejected-messages",
+            str(args.rejected_messages),
+            "--strategy",
+            strategy,
+        ]
+        output = subprocess.run(command, capture_output=True, text=True, check=True)
+        report = json.loads(output.stdout.strip().splitlines()[-1])
+        print(f"{strategy}:")
+        for key, value in report.items():
+            if key != "strategy":
+                print(f"  {key}: {value}")
+    return 0
+
+
+def build_message_payloads(count: int, channel_id: int) -> list:
+    """Message JSON shaped like Discord's, with the odd embed and attachment"""
+    base_id = 1_300_000_000_000_000_000
+    payloads = []
+    for index in range(count):
+        author_id = 1000 + index % 50
+        payload = {
+            "id": str(base_id + index),
+            "channel_id": str(channel_id),
+            "author": {
+                "id": str(author_id),
+                "username": f"user{author_id}",
+                "discriminator": "0",
+                "avatar": "a" * 32,
+                "global_name": f"User {author_id}",
+            },
+            "content": f"Message number {index} with a little text in it",
+            "timestamp": "2026-01-05T12:00:00.000000+00:00",
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+        }
+        if index % 10 == 0:
+            payload["embeds"] = [
+                {"type": "rich", "title": "Embed", "description": "x" * 200}
+            ]
+        if index % 25 == 0:
+            payload["attachments"] = [
+                {
+                    "id": str(base_id + count + index),
+                    "filename": "image.png",
+                    "size": 1024,
+                    "url": "https://cdn.example/image.png",
+                    "proxy_url": "https://media.example/image.png",
+                }
+            ]
+        payloads.append(payload)
+    return payloads
+
+
+def benchmark_history_parse(args) -> int:
+    import discord
+
+    from src.utils.message_history import parse_raw_message
+
+    async def build_channel():
+        client = discord.Client(intents=discord.Intents.default())
+        state = client._connection
+        guild = discord.Guild(
+            data={"id": "1", "name": "Benchmark", "roles": [], "emojis": []},
+            state=state,
+        )
+        channel = discord.TextChannel(
+            state=state,
+            guild=guild,
+            data={"id": "2", "type": 0, "name": "bench", "position": 0},
+        )
+        return state, channel
+
+    state, channel = asyncio.run(build_channel())
+    payloads = build_message_payloads(args.messages, channel.id)
+
+    def full_messages(page):
+        return [state.create_message(channel=channel, data=data) for data in page]
+
+    def raw_messages(page):
+        return [parse_raw_message(data) for data in page]
+
+    results = {}
+    for name, parse in (("discord.Message", full_messages), ("RawMessage", raw_messages)):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for i in range(0, len(payloads), 100):
+                parse(payloads[i : i + 100])
+            timings.append(time.perf_counter() - start)
+
+        # Allocations while one page of parsed messages is alive
+        tracemalloc.start()
+        page = parse(payloads[:100])
+        page_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del page
+
+        per_message_us = min(timings) / len(payloads) * 1e6
+        results[name] = per_message_us
+        print(
+            f"{name:>16}: {per_message_us:6.2f} µs per message, "
+            f"{page_bytes / 100:7.0f} bytes per message kept"
+        )
+
+    print(f"Speedup: {results['discord.Message'] / results['RawMessage']:.1f}x")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for ClearTimer Bot internals"
+    )
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    schedule_parser = subparsers.add_parser(
+        "schedule-table", help="Vectorized next-fire-time computation"
+    )
+    schedule_parser.add_argument(
+        "--timers", type=int, default=1_000_000, help="Number of timers to generate"
+    )
+    schedule_parser.add_argument(
+        "--sample",
+        type=int,
+        default=2000,
+        help="Rows to time and verify against APScheduler",
+    )
+    schedule_parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed passes over the table"
+    )
+    schedule_parser.add_argument(
+        "--now", type=str, help="Reference time in ISO format (default: now)"
+    )
+    schedule_parser.add_argument("--seed", type=int, default=0)
+    schedule_parser.set_defaults(func=benchmark_schedule_table)
+
+    simulate_parser = subparsers.add_parser(
+        "simulate", help="Replay synthetic subscriptions on a fake clock"
+    )
+    simulate_parser.add_argument(
+        "--channels", type=int, default=1000, help="Number of subscribed channels"
+    )
+    simulate_parser.add_argument(
+        "--hours", type=float, default=24.0, help="Simulated duration in hours"
+    )
+    simulate_parser.add_argument(
+        "--start", type=str, help="Simulated start time in ISO format (default: now)"
+    )
+    simulate_parser.add_argument(
+        "--messages-per-hour",
+        type=float,
+        default=30.0,
+        help="Messages posted per channel per hour",
+    )
+    simulate_parser.add_argument(
+        "--rest-rate",
+        type=float,
+        default=50.0,
+        help="Shared REST requests per second",
+    )
+    simulate_parser.add_argument(
+        "--api-latency-ms", type=float, default=150.0, help="Latency of each API call"
+    )
+    simulate_parser.add_argument("--seed", type=int, default=0)
+    simulate_parser.add_argument("--output", type=str, help="Also write JSON here")
+    simulate_parser.add_argument(
+        "--verbose", action="store_true", help="Show bot log output"
+    )
+    simulate_parser.set_defaults(func=run_scheduler_simulation)
+
+    pipeline_parser = subparsers.add_parser(
+        "clear-pipeline", help="Memory and time-to-first-delete of a large clear"
+    )
+    pipeline_parser.add_argument(
+        "--messages", type=int, default=200_000, help="Messages in each channel"
+    )
+    pipeline_parser.add_argument(
+        "--channels",
+        type=int,
+        default=1,
+        help="Channels in one guild cleared at the same time",
+    )
+    pipeline_parser.add_argument(
+        "--days",
+        type=float,
+        default=10.0,
+        help="Age of the oldest message (over 13 days is deleted one by one)",
+    )
+    pipeline_parser.add_argument(
+        "--rest-rate", type=float, default=50.0, help="REST requests per second"
+    )
+    pipeline_parser.add_argument(
+        "--api-latency-ms", type=float, default=150.0, help="Latency of each API call"
+    )
+    pipeline_parser.add_argument(
+        "--queue-pages", type=int, default=4, help="History pages buffered ahead"
+    )
+    pipeline_parser.add_argument(
+        "--rejected-messages",
+        type=int,
+        default=0,
+        help="Recent messages per channel that bulk delete refuses",
+    )
+    pipeline_parser.add_argument(
+        "--strategy",
+        choices=("pipeline", "collect", "recreate", "both"),
+        default="both",
+        help="Clear strategy to measure",
+    )
+    pipeline_parser.set_defaults(func=benchmark_clear_pipeline)
+
+    parse_parser = subparsers.add_parser(
+        "history-parse", help="Cost of turning history payloads into messages"
+    )
+    parse_parser.add_argument(
+        "--messages", type=int, default=100_000, help="Payloads to parse"
+    )
+    parse_parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed passes over the payloads"
+    )
+    parse_parser.set_defaults(func=benchmark_history_parse)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
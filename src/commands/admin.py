@@ -283,8 +283,17 @@ class AdminCommands(
         translator = await get_translator(str(interaction.guild.id), self.data_service)
 
         try:
+            old_timezones = self.data_service.get_timezones_list()
+            old_server_timezones = {
+                server_id: server.timezone
+                for server_id, server in self.data_service._servers_cache.items()
+            }
             await self.data_service.reload_all_caches()
             await self.data_service.reload_timezones_cache()
+            # Running jobs still use the zones their triggers were built with
+            await self.bot.timezone_rescheduler.reschedule_after_reload(
+                old_timezones, old_server_timezones
+            )
 
             servers_count = len(self.data_service._servers_cache)
             blacklist_count = len(self.data_service._blacklist_cache)
@@ -271,11 +271,13 @@ class GeneralCommands(commands.Cog):
             server = await self.data_service.add_server(interaction.guild)
 
         await self.data_service.set_server_timezone(server_id, timezone)
+        # Fixed-time timers without their own timezone move to the new one
+        rescheduled = await self.bot.timezone_rescheduler.reschedule_server(server_id)
 
         translator = await get_translator(server_id, self.data_service)
         from src.components.timezone import TimezoneChangeSuccessView
 
-        view = TimezoneChangeSuccessView(timezone, translator)
+        view = TimezoneChangeSuccessView(timezone, translator, rescheduled)
         await interaction.response.send_message(view=view)
 
     @timezone_group.command(
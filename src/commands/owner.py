@@ -50,6 +50,14 @@ class OwnerCommands(
         guild_only=True,
     )
 
+    scheduler_group = app_commands.Group(
+        name="scheduler",
+        description=get_command_description("owner.scheduler"),
+        parent=None,
+        auto_locale_strings=False,
+        guild_only=True,
+    )
+
     @admin_group.command(
         name="list",
         description=get_command_description("owner.admin.list"),
@@ -289,6 +297,103 @@ class OwnerCommands(
             )
             await interaction.followup.send(view=view)
 
+    @scheduler_group.command(
+        name="stats",
+        description=get_command_description("owner.scheduler.stats"),
+        auto_locale_strings=False,
+    )
+    @app_commands.describe(
+        channel_id="Channel ID to show recent clear runs for (optional)"
+    )
+    async def scheduler_stats(
+        self, interaction: discord.Interaction, channel_id: Optional[str] = None
+    ):
+        await interaction.response.defer(ephemeral=True)
+
+        if not await self._check_owner_permission(interaction):
+            return
+
+        if interaction.guild:
+            translator = await get_translator(
+                str(interaction.guild.id), self.data_service
+            )
+
+        try:
+            scheduler_service = self.bot.scheduler_service
+            stats = scheduler_service.get_scheduler_statistics()
+            history = []
+            if channel_id:
+                channel = self.bot.get_channel(int(channel_id))
+                server_id = (
+                    str(channel.guild.id)
+                    if channel and getattr(channel, "guild", None)
+                    else str(interaction.guild.id)
+                )
+                history = scheduler_service.get_channel_execution_history(
+                    server_id, channel_id
+                )
+
+            from src.components.owner import SchedulerStatsView
+
+            view = SchedulerStatsView(stats, history, translator, channel_id)
+            await interaction.followup.send(view=view)
+
+        except Exception as e:
+            logger.error(LogArea.COMMANDS, f"Error getting scheduler stats: {e}")
+            from src.components.errors import ErrorView
+
+            view = ErrorView(
+                "❌ **Failed to Get Scheduler Stats**",
+                f"An error occurred: {str(e)}",
+                translator,
+            )
+            await interaction.followup.send(view=view)
+
+    @scheduler_group.command(
+        name="channels",
+        description=get_command_description("owner.scheduler.channels"),
+        auto_locale_strings=False,
+    )
+    @app_commands.describe(
+        hours="How many hours of clear runs to include (default 24)",
+        server_id="Only include channels of this server (optional)",
+    )
+    async def scheduler_channels(
+        self,
+        interaction: discord.Interaction,
+        hours: app_commands.Range[int, 1, 24 * 90] = 24,
+        server_id: Optional[str] = None,
+    ):
+        await interaction.response.defer(ephemeral=True)
+
+        if not await self._check_owner_permission(interaction):
+            return
+
+        if interaction.guild:
+            translator = await get_translator(
+                str(interaction.guild.id), self.data_service
+            )
+
+        try:
+            clear_ledger = self.bot.message_service.clear_ledger
+            summaries = await clear_ledger.summarize_channels(hours, server_id)
+
+            from src.components.owner import ClearLedgerView
+
+            view = ClearLedgerView(summaries, hours, translator, server_id)
+            await interaction.followup.send(view=view)
+
+        except Exception as e:
+            logger.error(LogArea.COMMANDS, f"Error getting clear ledger: {e}")
+            from src.components.errors import ErrorView
+
+            view = ErrorView(
+                "❌ **Failed to Get Clear Runs**",
+                f"An error occurred: {str(e)}",
+                translator,
+            )
+            await interaction.followup.send(view=view)
+
     async def _delayed_shutdown(self):
         """Gracefully shutdown the bot after a delay"""
         await asyncio.sleep(2)
@@ -1,12 +1,14 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from discord.ext.commands import Bot
 
+from src.models import ChannelGroup, ChannelTimer, GROUP_NAME_PATTERN
 from src.utils.schedule_parser import ScheduleParseError
+from src.utils.channel_target_parser import parse_text_channels
 from src.utils.ignore_target_parser import (
     identify_and_validate_multiple_ignore_targets,
     validate_and_add_multiple_ignore_targets,
@@ -61,7 +63,8 @@ class SubscriptionCommands(commands.Cog):
         channel_id = str(message.channel.id)
 
         server = await self.data_service.get_server(server_id)
-        if not server or channel_id not in server.channels:
+        channel_timer = server.get_ignore_rules(channel_id) if server else None
+        if channel_timer is None:
             await interaction.response.send_message(
                 translator.get(
                     "validation.not_subscribed", channel=message.channel.mention
@@ -70,10 +73,9 @@ class SubscriptionCommands(commands.Cog):
             )
             return
 
-        channel_timer = server.channels[channel_id]
         message_id = str(message.id)
 
-        if message_id in channel_timer.ignored.messages:
+        if channel_timer.is_message_ignored(message_id):
             channel_timer.remove_ignored_message(message_id)
             await self.data_service.save_servers()
 
@@ -128,17 +130,17 @@ class SubscriptionCommands(commands.Cog):
         channel_id = str(channel.id)
 
         server = await self.data_service.get_server(server_id)
-        if not server or channel_id not in server.channels:
+        channel_timer = server.get_ignore_rules(channel_id) if server else None
+        if channel_timer is None:
             await interaction.response.send_message(
                 translator.get("validation.not_subscribed", channel=channel.mention),
                 ephemeral=True,
             )
             return
 
-        channel_timer = server.channels[channel_id]
         user_id = str(user.id)
 
-        if user_id in channel_timer.ignored.users:
+        if channel_timer.is_user_ignored(user_id):
             channel_timer.remove_ignored_user(user_id)
             await self.data_service.save_servers()
 
@@ -170,6 +172,68 @@ class SubscriptionCommands(commands.Cog):
         guild_only=True,
     )
 
+    async def _delete_view_message(
+        self, channel: discord.TextChannel, view_message_id: str
+    ) -> None:
+        try:
+            # Try cache first
+            cache_key = f"discord:msg:{channel.id}:{view_message_id}"
+            message = await self.data_service._cache.get(cache_key)
+
+            if not message:
+                message = await channel.fetch_message(int(view_message_id))
+                # Cache briefly since we're about to delete it
+                await self.data_service._cache.set(
+                    cache_key, message, cache_level="memory", ttl=60
+                )
+
+            await message.delete()
+            # Invalidate cache after deletion
+            await self.data_service._cache.invalidate(cache_key)
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as e:
+            logger.warning(
+                LogArea.COMMANDS,
+                f"Failed to delete view message {view_message_id}: {e}",
+            )
+
+    async def _resolve_target_channels(
+        self,
+        interaction: discord.Interaction,
+        category: Optional[discord.CategoryChannel],
+        channels: Optional[str],
+        translator,
+    ) -> Optional[List[discord.TextChannel]]:
+        """Text channels of a category or a channel list, None once an error was sent"""
+        from src.components.subscription import SubscriptionErrorView
+
+        if (category is None) == (channels is None):
+            view = SubscriptionErrorView(
+                translator.get("commands.subscription.group.no_members"), translator
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return None
+
+        if category is not None:
+            return list(category.text_channels)
+
+        target_channels, invalid = parse_text_channels(channels, interaction.guild)
+        if invalid or not target_channels:
+            view = SubscriptionErrorView(
+                translator.get(
+                    "commands.subscription.group.invalid_channels",
+                    channels=", ".join(f"`{entry}`" for entry in invalid),
+                )
+                if invalid
+                else translator.get("commands.subscription.group.no_members"),
+                translator,
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return None
+
+        return target_channels
+
     @subscription_group.command(
         name="add",
         description=get_command_description("subscription.add"),
@@ -349,28 +413,7 @@ class SubscriptionCommands(commands.Cog):
             if channel_id in server.channels:
                 view_message_id = server.channels[channel_id].view_message_id
                 if view_message_id:
-                    try:
-                        # Try cache first
-                        cache_key = f"discord:msg:{channel.id}:{view_message_id}"
-                        message = await self.data_service._cache.get(cache_key)
-
-                        if not message:
-                            message = await channel.fetch_message(int(view_message_id))
-                            # Cache briefly since we're about to delete it
-                            await self.data_service._cache.set(
-                                cache_key, message, cache_level="memory", ttl=60
-                            )
-
-                        await message.delete()
-                        # Invalidate cache after deletion
-                        await self.data_service._cache.invalidate(cache_key)
-                    except discord.NotFound:
-                        pass
-                    except discord.HTTPException as e:
-                        logger.warning(
-                            LogArea.COMMANDS,
-                            f"Failed to delete view message {view_message_id}: {e}",
-                        )
+                    await self._delete_view_message(channel, view_message_id)
 
             server.remove_channel(channel_id)
             await self.data_service.save_servers()
@@ -460,20 +503,48 @@ class SubscriptionCommands(commands.Cog):
             server_id, channel_id
         )
 
-        if not next_run_time:
+        pause = self.scheduler_service.get_channel_pause(server_id, channel_id)
+
+        server = await self.data_service.get_server(server_id)
+
+        if not next_run_time and pause is None:
+            group = server.get_channel_group(channel_id) if server else None
+            if group is not None:
+                from src.components.subscription import GroupMemberInfoView
+
+                view = GroupMemberInfoView(
+                    channel,
+                    group,
+                    self.scheduler_service.get_group_next_clear_time(
+                        server_id, group.name
+                    ),
+                    translator,
+                )
+                await interaction.response.send_message(view=view)
+                return
+
             from src.components.subscription import ChannelNotSubscribedView
 
             view = ChannelNotSubscribedView(channel, translator)
             await interaction.response.send_message(view=view, ephemeral=True)
             return
 
-        server = await self.data_service.get_server(server_id)
         timer_info = server.get_channel(channel_id) if server else None
 
         # Subscription info display
         from src.components.subscription import SubscriptionInfoView
 
-        view = SubscriptionInfoView(channel, next_run_time, timer_info, translator)
+        legacy_progress = self.bot.message_service.get_legacy_progress(channel_id)
+        profile = self.bot.message_service.get_channel_profile(channel_id)
+        view = SubscriptionInfoView(
+            channel,
+            next_run_time,
+            timer_info,
+            translator,
+            legacy_progress,
+            profile,
+            pause,
+        )
         await interaction.response.send_message(view=view)
 
     @subscription_group.command(
@@ -532,14 +603,8 @@ class SubscriptionCommands(commands.Cog):
         await interaction.response.defer(ephemeral=False)
 
         server = await self.data_service.get_server(server_id)
-        current_ignored_messages = []
-        current_ignored_users = []
         old_view_message_id = None
         if server and channel_id in server.channels:
-            current_ignored_messages = list(
-                server.channels[channel_id].ignored.messages
-            )
-            current_ignored_users = list(server.channels[channel_id].ignored.users)
             old_view_message_id = server.channels[channel_id].view_message_id
 
         # Remove old job first
@@ -550,14 +615,8 @@ class SubscriptionCommands(commands.Cog):
 
         # Update in data service
         if server:
-            server.channels[channel_id].timer = timer_to_store
-            server.channels[channel_id].next_run_time = next_run_time
-
-            # Restore ignored messages and users
-            for msg_id in current_ignored_messages:
-                server.channels[channel_id].add_ignored_message(msg_id)
-            for user_id in current_ignored_users:
-                server.channels[channel_id].add_ignored_user(user_id)
+            # Ignored messages and users are kept
+            server.channels[channel_id].reschedule(timer_to_store, next_run_time)
 
             # Add new ignored targets if provided (messages or users)
             added_targets = await validate_and_add_multiple_ignore_targets(
@@ -575,30 +634,7 @@ class SubscriptionCommands(commands.Cog):
             if view:
                 # Delete old view message if it exists
                 if old_view_message_id:
-                    try:
-                        # Try cache first
-                        cache_key = f"discord:msg:{channel.id}:{old_view_message_id}"
-                        old_message = await self.data_service._cache.get(cache_key)
-
-                        if not old_message:
-                            old_message = await channel.fetch_message(
-                                int(old_view_message_id)
-                            )
-                            # Cache briefly since we're about to delete it
-                            await self.data_service._cache.set(
-                                cache_key, old_message, cache_level="memory", ttl=60
-                            )
-
-                        await old_message.delete()
-                        # Invalidate cache after deletion
-                        await self.data_service._cache.invalidate(cache_key)
-                    except discord.NotFound:
-                        pass
-                    except discord.HTTPException as e:
-                        logger.warning(
-                            LogArea.COMMANDS,
-                            f"Failed to delete view message {old_view_message_id}: {e}",
-                        )
+                    await self._delete_view_message(channel, old_view_message_id)
 
                 view_message = await channel.send(view=timer_view)
                 server.channels[channel_id].view_message_id = str(view_message.id)
@@ -688,7 +724,7 @@ class SubscriptionCommands(commands.Cog):
             ValidationCheck.BLACKLIST: True,
             ValidationCheck.USER_PERMISSIONS: True,
             ValidationCheck.BOT_PERMISSIONS: True,
-            ValidationCheck.CHANNEL_SUBSCRIBED: True,
+            ValidationCheck.CHANNEL_CLEARED: True,
         }
 
         is_valid, error_msg, channel = await self.validator.validate_command(
@@ -719,15 +755,14 @@ class SubscriptionCommands(commands.Cog):
             return
 
         server = await self.data_service.get_server(server_id)
-        if not server or channel_id not in server.channels:
+        channel_timer = server.get_ignore_rules(channel_id) if server else None
+        if channel_timer is None:
             from src.components.subscription import NoSubscriptionDataView
 
             view = NoSubscriptionDataView(channel, translator)
             await interaction.followup.send(view=view, ephemeral=True)
             return
 
-        channel_timer = server.channels[channel_id]
-
         # Process all targets
         added_users = []
         removed_users = []
@@ -738,7 +773,7 @@ class SubscriptionCommands(commands.Cog):
         for entity_id, entity_type, display_info in validated_targets:
             if entity_type == "user":
                 # Handle user toggle
-                if entity_id in channel_timer.ignored.users:
+                if channel_timer.is_user_ignored(entity_id):
                     # Remove the user
                     channel_timer.remove_ignored_user(entity_id)
                     removed_users.append(entity_id)
@@ -752,7 +787,7 @@ class SubscriptionCommands(commands.Cog):
                     message_authors[entity_id] = display_info
 
                 # Handle message toggle
-                if entity_id in channel_timer.ignored.messages:
+                if channel_timer.is_message_ignored(entity_id):
                     # Remove the message
                     channel_timer.remove_ignored_message(entity_id)
                     removed_messages.append(entity_id)
@@ -808,68 +843,33 @@ class SubscriptionCommands(commands.Cog):
             return
 
         server_id = str(interaction.guild.id)
-        channel_id = str(channel.id)
         translator = await get_translator(server_id, self.data_service)
 
         # Defer the response as clearing might take time
         await interaction.response.defer(ephemeral=True)
 
-        server = await self.data_service.get_server(server_id)
-        ignored_messages = []
-        ignored_users = []
-        view_message_id = None
-        if server and channel_id in server.channels:
-            channel_timer = server.channels[channel_id]
-            ignored_messages = list(channel_timer.ignored.messages)
-            ignored_users = list(channel_timer.ignored.users)
-            view_message_id = channel_timer.view_message_id
-
-        # Add view message to ignored list if it exists
-        if view_message_id:
-            ignored_messages.append(view_message_id)
-
-        # Trigger the clear using MessageService directly
-        from src.services.message_clearing_service import MessageService
-
-        message_service = MessageService(
-            self.bot.data_service, self.bot.scheduler_service
-        )
-        deleted_count = await message_service._perform_message_deletion(
-            channel, set(ignored_messages), set(ignored_users)
+        # Goes through the bot's MessageService so a clear already running in
+        # this channel is shared instead of repeated; the timer view message
+        # is kept and refreshed by the clear itself
+        result = await self.bot.message_service.execute_channel_message_clear(
+            channel
         )
-
-        # Update view message if it exists
-        if view_message_id:
-            next_run_time = self.scheduler_service.get_channel_next_clear_time(
-                server_id, channel_id
+        deleted_count = result.deleted_count
+        if result.recreated_channel_id:
+            channel = (
+                interaction.guild.get_channel(int(result.recreated_channel_id))
+                or channel
             )
-            if next_run_time and server and channel_id in server.channels:
-                try:
-                    view_message = await channel.fetch_message(int(view_message_id))
-                    from src.components.subscription import TimerViewMessage
-
-                    timer_view = TimerViewMessage(
-                        channel,
-                        server.channels[channel_id].timer,
-                        next_run_time,
-                        translator,
-                    )
-                    await view_message.edit(view=timer_view)
-                    # Update the next run time in data service
-                    server.channels[channel_id].next_run_time = next_run_time
-                    await self.data_service.save_servers()
-                except discord.NotFound:
-                    # View message was deleted, clear the ID
-                    server.channels[channel_id].view_message_id = None
-                    await self.data_service.save_servers()
-                except Exception:
-                    pass  # Silently ignore other errors
 
         # Send result
         from src.components.subscription import ManualClearSuccessView
 
         view = ManualClearSuccessView(deleted_count, channel, translator)
-        await interaction.followup.send(view=view, ephemeral=True)
+        try:
+            await interaction.followup.send(view=view, ephemeral=True)
+        except discord.NotFound:
+            # The command was used in a channel that was just recreated
+            pass
 
     @subscription_group.command(
         name="skip",
@@ -924,11 +924,12 @@ class SubscriptionCommands(commands.Cog):
             self.scheduler_service.scheduler.modify_job(
                 job.id, next_run_time=new_next_run_time
             )
+            self.scheduler_service.refresh_prestage(server_id, channel_id)
 
             # Update in data service
             server = await self.data_service.get_server(server_id)
             if server and channel_id in server.channels:
-                server.channels[channel_id].next_run_time = new_next_run_time
+                server.channels[channel_id].skip_until = new_next_run_time
 
                 # Update view message if it exists
                 view_message_id = server.channels[channel_id].view_message_id
@@ -962,6 +963,609 @@ class SubscriptionCommands(commands.Cog):
             view = NextTimeNotFoundView(channel, translator)
             await interaction.response.send_message(view=view, ephemeral=True)
 
+    @subscription_group.command(
+        name="recreate",
+        description=get_command_description("subscription.recreate"),
+        auto_locale_strings=False,
+    )
+    @app_commands.default_permissions(manage_channels=True)
+    @app_commands.describe(
+        enabled="Recreate the channel when clearing its old messages would take thousands of requests",
+        target_channel="Channel to configure (defaults to current channel)",
+    )
+    async def subscription_recreate(
+        self,
+        interaction: discord.Interaction,
+        enabled: bool,
+        target_channel: Optional[discord.TextChannel] = None,
+    ):
+        # Recreating deletes the channel, so it takes channel management rights
+        checks = {
+            ValidationCheck.BLACKLIST: True,
+            ValidationCheck.USER_PERMISSIONS: "manage_channels",
+            ValidationCheck.BOT_PERMISSIONS: True,
+            ValidationCheck.CHANNEL_SUBSCRIBED: True,
+        }
+
+        is_valid, error_msg, channel = await self.validator.validate_command(
+            interaction, target_channel, checks
+        )
+
+        if not is_valid:
+            await self.validator.send_validation_error(interaction, error_msg)
+            return
+
+        server_id = str(interaction.guild.id)
+        channel_id = str(channel.id)
+        translator = await get_translator(server_id, self.data_service)
+
+        server = await self.data_service.get_server(server_id)
+        server.channels[channel_id].allow_recreate = enabled
+        await self.data_service.save_servers()
+
+        from src.components.subscription import RecreateSettingView
+
+        threshold = self.bot.message_service.recreate_threshold
+        view = RecreateSettingView(channel, enabled, threshold, translator)
+        await interaction.response.send_message(view=view, ephemeral=True)
+
+    @subscription_group.command(
+        name="pins",
+        description=get_command_description("subscription.pins"),
+        auto_locale_strings=False,
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    @app_commands.describe(
+        keep="Keep pinned messages when the channel is cleared",
+        target_channel="Channel to configure (defaults to current channel)",
+    )
+    async def subscription_pins(
+        self,
+        interaction: discord.Interaction,
+        keep: bool,
+        target_channel: Optional[discord.TextChannel] = None,
+    ):
+        checks = {
+            ValidationCheck.BLACKLIST: True,
+            ValidationCheck.USER_PERMISSIONS: True,
+            ValidationCheck.BOT_PERMISSIONS: True,
+            ValidationCheck.CHANNEL_SUBSCRIBED: True,
+        }
+
+        is_valid, error_msg, channel = await self.validator.validate_command(
+            interaction, target_channel, checks
+        )
+
+        if not is_valid:
+            await self.validator.send_validation_error(interaction, error_msg)
+            return
+
+        server_id = str(interaction.guild.id)
+        channel_id = str(channel.id)
+        translator = await get_translator(server_id, self.data_service)
+
+        server = await self.data_service.get_server(server_id)
+        server.channels[channel_id].keep_pinned = keep
+        await self.data_service.save_servers()
+
+        from src.components.subscription import KeepPinsSettingView
+
+        view = KeepPinsSettingView(channel, keep, translator)
+        await interaction.response.send_message(view=view, ephemeral=True)
+
+    group_subscription_group = app_commands.Group(
+        name="group",
+        description=get_command_description("subscription.group"),
+        parent=subscription_group,
+        auto_locale_strings=False,
+    )
+
+    @group_subscription_group.command(
+        name="add",
+        description=get_command_description("subscription.group.add"),
+        auto_locale_strings=False,
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    @app_commands.describe(
+        name="Name of the group (lowercase letters, numbers, - and _)",
+        timer="Timer format, the same as for /subscription add",
+        category="Clear every text channel in this category, including new ones",
+        channels="Channel mentions or IDs to clear instead of a category",
+        keep_pins="Keep pinned messages when the channels are cleared",
+    )
+    async def subscription_group_add(
+        self,
+        interaction: discord.Interaction,
+        name: str,
+        timer: str,
+        category: Optional[discord.CategoryChannel] = None,
+        channels: Optional[str] = None,
+        keep_pins: Optional[bool] = False,
+    ):
+        checks = {
+            ValidationCheck.BLACKLIST: True,
+            ValidationCheck.USER_PERMISSIONS: True,
+        }
+
+        is_valid, error_msg, _ = await self.validator.validate_command(
+            interaction, None, checks
+        )
+
+        if not is_valid:
+            await self.validator.send_validation_error(interaction, error_msg)
+            return
+
+        server_id = str(interaction.guild.id)
+        translator = await get_translator(server_id, self.data_service)
+
+        from src.components.subscription import SubscriptionErrorView
+
+        name = name.strip().lower()
+        if not GROUP_NAME_PATTERN.match(name):
+            view = SubscriptionErrorView(
+                translator.get("commands.subscription.group.invalid_name"), translator
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        member_channels = await self._resolve_target_channels(
+            interaction, category, channels, translator
+        )
+        if member_channels is None:
+            return
+
+        server = await self.data_service.get_server(server_id)
+        if not server:
+            server = await self.data_service.add_server(interaction.guild)
+
+        existing = server.get_group(name) or (
+            server.get_category_group(str(category.id)) if category else None
+        )
+        if existing is not None:
+            view = SubscriptionErrorView(
+                translator.get(
+                    "commands.subscription.group.exists", name=existing.name
+                ),
+                translator,
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        # A channel is cleared by at most one group
+        grouped = []
+        for channel in member_channels:
+            other = server.get_member_group(str(channel.id))
+            if other is not None:
+                grouped.append(f"{channel.mention} (**{other.name}**)")
+        if grouped:
+            view = SubscriptionErrorView(
+                translator.get(
+                    "commands.subscription.group.already_grouped",
+                    channels=", ".join(grouped),
+                ),
+                translator,
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        try:
+            trigger, next_run_time = self.schedule_parser.parse_schedule_expression(
+                timer, server_id
+            )
+        except ScheduleParseError as e:
+            from src.components.subscription import InvalidTimerView
+
+            view = InvalidTimerView(str(e), translator)
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        group = ChannelGroup(
+            name=name,
+            timer=timer.strip(),
+            anchor_time=next_run_time,
+            category_id=str(category.id) if category else None,
+            keep_pinned=bool(keep_pins),
+        )
+        for channel in member_channels:
+            group.add_member(str(channel.id))
+        server.add_group(group)
+
+        # One write and one job for the whole group
+        await self.data_service.save_servers()
+        self.scheduler_service.create_group_clear_job(
+            server_id, name, trigger, interaction.guild, next_run_time
+        )
+
+        me = interaction.guild.me
+        missing_permissions = [
+            channel
+            for channel in member_channels
+            if not (
+                channel.permissions_for(me).manage_messages
+                and channel.permissions_for(me).read_message_history
+            )
+        ]
+        own_subscription = [
+            channel for channel in member_channels if str(channel.id) in server.channels
+        ]
+
+        from src.components.subscription import GroupSubscriptionSuccessView
+
+        view = GroupSubscriptionSuccessView(
+            group,
+            category,
+            next_run_time,
+            missing_permissions,
+            own_subscription,
+            translator,
+        )
+        await interaction.response.send_message(view=view)
+
+    @group_subscription_group.command(
+        name="remove",
+        description=get_command_description("subscription.group.remove"),
+        auto_locale_strings=False,
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    @app_commands.describe(name="Name of the group to remove")
+    async def subscription_group_remove(
+        self, interaction: discord.Interaction, name: str
+    ):
+        checks = {
+            ValidationCheck.BLACKLIST: True,
+            ValidationCheck.USER_PERMISSIONS: True,
+        }
+
+        is_valid, error_msg, _ = await self.validator.validate_command(
+            interaction, None, checks
+        )
+
+        if not is_valid:
+            await self.validator.send_validation_error(interaction, error_msg)
+            return
+
+        server_id = str(interaction.guild.id)
+        translator = await get_translator(server_id, self.data_service)
+
+        name = name.strip().lower()
+        group = await self.data_service.remove_group_subscription(server_id, name)
+        if group is None:
+            from src.components.subscription import SubscriptionErrorView
+
+            view = SubscriptionErrorView(
+                translator.get("commands.subscription.group.not_found", name=name),
+                translator,
+            )
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        self.scheduler_service.remove_group_clear_job(server_id, name)
+
+        from src.components.subscription import GroupUnsubscribeSuccessView
+
+        view = GroupUnsubscribeSuccessView(group, translator)
+        await interaction.response.send_message(view=view)
+
+    @subscription_group_remove.autocomplete("name")
+    async def group_name_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> List[app_commands.Choice[str]]:
+        server = await self.data_service.get_server(str(interaction.guild.id))
+        if not server:
+            return []
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name in sorted(server.groups)
+            if current.lower() in name
+        ][:25]
+
+    @group_subscription_group.command(
+        name="list",
+        description=get_command_description("subscription.group.list"),
+        auto_locale_strings=False,
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    async def subscription_group_list(self, interaction: discord.Interaction):
+        checks = {
+            ValidationCheck.BLACKLIST: True,
+            ValidationCheck.USER_PERMISSIONS: True,
+        }
+
+        is_valid, error_msg, _ = await self.validator.validate_command(
+            interaction, None, checks
+        )
+
+        if not is_valid:
+            await self.validator.send_validation_error(interaction, error_msg)
+            return
+
+        server_id = str(interaction.guild.id)
+        translator = await get_translator(server_id, self.data_service)
+        server = await self.data_service.get_server(server_id)
+
+        from src.components.subscription import GroupListView
+
+        view = GroupListView(
+            interaction.guild,
+            server.groups if server else {},
+            self.scheduler_service,
+            translator,
+        )
+        await interaction.response.send_message(view=view)
+
+    bulk_subscription_group = app_commands.Group(
+        name="bulk",
+        description=get_command_description("subscription.bulk"),
+        parent=subscription_group,
+        auto_locale_strings=False,
+    )
+
+    @bulk_subscription_group.command(
+        name="add",
+        description=get_command_description("subscription.bulk.add"),
+        auto_locale_strings=False,
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    @app_commands.describe(
+        timer="Timer format, the same as for /subscription add",
+        category="Subscribe every text channel in this category",
+        channels="Channel mentions or IDs to subscribe instead of a category",
+    )
+    async def subscription_bulk_add(
+        self,
+        interaction: discord.Interaction,
+        timer: str,
+        category: Optional[discord.CategoryChannel] = None,
+        channels: Optional[str] = None,
+    ):
+        checks = {
+            ValidationCheck.BLACKLIST: True,
+            ValidationCheck.USER_PERMISSIONS: True,
+        }
+
+        is_valid, error_msg, _ = await self.validator.validate_command(
+            interaction, None, checks
+        )
+
+        if not is_valid:
+            await self.validator.send_validation_error(interaction, error_msg)
+            return
+
+        server_id = str(interaction.guild.id)
+        translator = await get_translator(server_id, self.data_service)
+
+        target_channels = await self._resolve_target_channels(
+            interaction, category, channels, translator
+        )
+        if target_channels is None:
+            return
+
+        # One trigger is shared by all the new jobs
+        try:
+            trigger, next_run_time = self.schedule_parser.parse_schedule_expression(
+                timer, server_id
+            )
+        except ScheduleParseError as e:
+            from src.components.subscription import InvalidTimerView
+
+            view = InvalidTimerView(str(e), translator)
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        timer_to_store = timer.strip()
+        server = await self.data_service.get_server(server_id)
+        if not server:
+            server = await self.data_service.add_server(interaction.guild)
+
+        added, subscribed, missing_permissions = [], [], []
+        for channel in target_channels:
+            if str(channel.id) in server.channels:
+                subscribed.append(channel)
+            elif self.validator.get_missing_bot_permissions(channel):
+                missing_permissions.append(channel)
+            else:
+                added.append(channel)
+
+        if added:
+            # Saved before the jobs exist, the same as a single subscription
+            await self.data_service.apply_channel_subscriptions(
+                server_id,
+                [
+                    ChannelTimer(str(channel.id), timer_to_store, next_run_time)
+                    for channel in added
+                ],
+                [],
+            )
+            self.scheduler_service.create_channel_clear_jobs(
+                server_id, trigger, added, next_run_time
+            )
+
+        from src.components.subscription import BulkSubscriptionSummaryView
+
+        view = BulkSubscriptionSummaryView(
+            "add",
+            added,
+            {
+                "subscribed": subscribed,
+                "missing_permissions": missing_permissions,
+            },
+            translator,
+            timer=timer_to_store,
+            next_run_time=next_run_time,
+        )
+        await interaction.response.send_message(view=view)
+
+    @bulk_subscription_group.command(
+        name="update",
+        description=get_command_description("subscription.bulk.update"),
+        auto_locale_strings=False,
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    @app_commands.describe(
+        timer="New timer format, the same as for /subscription update",
+        category="Update every subscribed text channel in this category",
+        channels="Channel mentions or IDs to update instead of a category",
+    )
+    async def subscription_bulk_update(
+        self,
+        interaction: discord.Interaction,
+        timer: str,
+        category: Optional[discord.CategoryChannel] = None,
+        channels: Optional[str] = None,
+    ):
+        checks = {
+            ValidationCheck.BLACKLIST: True,
+            ValidationCheck.USER_PERMISSIONS: True,
+        }
+
+        is_valid, error_msg, _ = await self.validator.validate_command(
+            interaction, None, checks
+        )
+
+        if not is_valid:
+            await self.validator.send_validation_error(interaction, error_msg)
+            return
+
+        server_id = str(interaction.guild.id)
+        translator = await get_translator(server_id, self.data_service)
+
+        target_channels = await self._resolve_target_channels(
+            interaction, category, channels, translator
+        )
+        if target_channels is None:
+            return
+
+        try:
+            trigger, next_run_time = self.schedule_parser.parse_schedule_expression(
+                timer, server_id
+            )
+        except ScheduleParseError as e:
+            from src.components.subscription import InvalidTimerView
+
+            view = InvalidTimerView(str(e), translator)
+            await interaction.response.send_message(view=view, ephemeral=True)
+            return
+
+        timer_to_store = timer.strip()
+        server = await self.data_service.get_server(server_id)
+        subscriptions = server.channels if server else {}
+
+        updated, not_subscribed, missing_permissions = [], [], []
+        channel_timers = []
+        for channel in target_channels:
+            channel_timer = subscriptions.get(str(channel.id))
+            if channel_timer is None:
+                not_subscribed.append(channel)
+            elif self.validator.get_missing_bot_permissions(channel):
+                missing_permissions.append(channel)
+            else:
+                # Ignored messages, users and the view message are kept
+                rescheduled = ChannelTimer.from_dict(
+                    channel_timer.channel_id, channel_timer.to_dict()
+                )
+                rescheduled.reschedule(timer_to_store, next_run_time)
+                channel_timers.append(rescheduled)
+                updated.append(channel)
+
+        if updated:
+            updated_ids = [str(channel.id) for channel in updated]
+            self.scheduler_service.remove_channel_clear_jobs(server_id, updated_ids)
+            await self.data_service.apply_channel_subscriptions(
+                server_id, channel_timers, []
+            )
+            self.scheduler_service.create_channel_clear_jobs(
+                server_id, trigger, updated, next_run_time
+            )
+
+        from src.components.subscription import BulkSubscriptionSummaryView
+
+        view = BulkSubscriptionSummaryView(
+            "update",
+            updated,
+            {
+                "not_subscribed": not_subscribed,
+                "missing_permissions": missing_permissions,
+            },
+            translator,
+            timer=timer_to_store,
+            next_run_time=next_run_time,
+        )
+        await interaction.response.send_message(view=view)
+
+        # Edited after replying, there can be one per channel
+        for channel, channel_timer in zip(updated, channel_timers):
+            if channel_timer.view_message_id:
+                await self.bot.message_service._refresh_timer_view_message(channel)
+
+    @bulk_subscription_group.command(
+        name="remove",
+        description=get_command_description("subscription.bulk.remove"),
+        auto_locale_strings=False,
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    @app_commands.describe(
+        category="Unsubscribe every text channel in this category",
+        channels="Channel mentions or IDs to unsubscribe instead of a category",
+    )
+    async def subscription_bulk_remove(
+        self,
+        interaction: discord.Interaction,
+        category: Optional[discord.CategoryChannel] = None,
+        channels: Optional[str] = None,
+    ):
+        checks = {
+            ValidationCheck.BLACKLIST: True,
+            ValidationCheck.USER_PERMISSIONS: True,
+        }
+
+        is_valid, error_msg, _ = await self.validator.validate_command(
+            interaction, None, checks
+        )
+
+        if not is_valid:
+            await self.validator.send_validation_error(interaction, error_msg)
+            return
+
+        server_id = str(interaction.guild.id)
+        translator = await get_translator(server_id, self.data_service)
+
+        target_channels = await self._resolve_target_channels(
+            interaction, category, channels, translator
+        )
+        if target_channels is None:
+            return
+
+        server = await self.data_service.get_server(server_id)
+        subscriptions = server.channels if server else {}
+
+        removed, not_subscribed = [], []
+        view_message_ids = {}
+        for channel in target_channels:
+            channel_timer = subscriptions.get(str(channel.id))
+            if channel_timer is None:
+                not_subscribed.append(channel)
+                continue
+            removed.append(channel)
+            if channel_timer.view_message_id:
+                view_message_ids[channel] = channel_timer.view_message_id
+
+        if removed:
+            removed_ids = [str(channel.id) for channel in removed]
+            self.scheduler_service.remove_channel_clear_jobs(server_id, removed_ids)
+            await self.data_service.apply_channel_subscriptions(
+                server_id, [], removed_ids
+            )
+
+        from src.components.subscription import BulkSubscriptionSummaryView
+
+        view = BulkSubscriptionSummaryView(
+            "remove", removed, {"not_subscribed": not_subscribed}, translator
+        )
+        await interaction.response.send_message(view=view)
+
+        for channel, view_message_id in view_message_ids.items():
+            await self._delete_view_message(channel, view_message_id)
+
 
 async def setup(bot) -> None:
     await bot.add_cog(SubscriptionCommands(bot))
@@ -400,6 +400,53 @@ class ShardStatusCompleteView(discord.ui.LayoutView):
             translator.get("commands.owner.shard.status.process_id", pid=pid) + "\n\n"
         )
 
+        health = bot.scheduler_service.get_health_status()
+        health_title = translator.get("commands.owner.shard.status.health.title")
+        content += f"**{health_title}**\n"
+        content += (
+            translator.get(
+                "commands.owner.shard.status.health.mode",
+                mode=translator.get(
+                    f"commands.owner.shard.status.health.modes.{health['mode']}"
+                ),
+            )
+            + "\n"
+        )
+        content += (
+            translator.get(
+                "commands.owner.shard.status.health.errors",
+                rate=f"{health['error_rate'] * 100:.1f}",
+                requests=health["requests"],
+                window=health["window_seconds"],
+            )
+            + "\n"
+        )
+        if health["deferred_clears"] or health["deferred_work"]:
+            content += (
+                translator.get(
+                    "commands.owner.shard.status.health.deferred",
+                    clears=health["deferred_clears"],
+                    work=health["deferred_work"],
+                )
+                + "\n"
+            )
+        last_change = health["last_change"]
+        if last_change is not None:
+            content += (
+                translator.get(
+                    "commands.owner.shard.status.health.last_change",
+                    previous=translator.get(
+                        f"commands.owner.shard.status.health.modes.{last_change.previous.value}"
+                    ),
+                    mode=translator.get(
+                        f"commands.owner.shard.status.health.modes.{last_change.mode.value}"
+                    ),
+                    time=f"<t:{int(last_change.changed_at.timestamp())}:R>",
+                )
+                + "\n"
+            )
+        content += "\n"
+
         available_commands = translator.get(
             "commands.owner.shard.status.available_commands"
         )
@@ -421,6 +468,159 @@ class ShardStatusCompleteView(discord.ui.LayoutView):
         self.add_item(container)
 
 
+class SchedulerStatsView(discord.ui.LayoutView):
+    """View for scheduler execution telemetry"""
+
+    def __init__(self, stats: dict, history: list, translator, channel_id=None):
+        super().__init__()
+
+        title = translator.get("commands.owner.scheduler.stats.title")
+        content = f"⏱️ **{title}**\n\n"
+
+        content += (
+            translator.get(
+                "commands.owner.scheduler.stats.jobs",
+                count=stats["current_queue_size"],
+                running=stats["running_tasks"],
+            )
+            + "\n"
+        )
+        content += (
+            translator.get(
+                "commands.owner.scheduler.stats.runs",
+                completed=stats["total_tasks_completed"],
+                idle=stats["total_runs_idle"],
+                failed=stats["total_tasks_failed"],
+                skipped=stats["total_runs_skipped"],
+            )
+            + "\n"
+        )
+        content += (
+            translator.get(
+                "commands.owner.scheduler.stats.overlapping",
+                joined=stats["total_clears_joined"],
+                followed_up=stats["total_clears_followed_up"],
+            )
+            + "\n"
+        )
+        content += (
+            translator.get(
+                "commands.owner.scheduler.stats.deleted",
+                count=stats["total_messages_deleted"],
+                api_calls=stats["total_api_calls"],
+            )
+            + "\n"
+        )
+        content += (
+            translator.get(
+                "commands.owner.scheduler.stats.retries",
+                scheduled=stats["total_retries_scheduled"],
+                succeeded=stats["total_retries_succeeded"],
+                exhausted=stats["total_retries_exhausted"],
+                pending=stats["pending_retries"],
+            )
+            + "\n"
+        )
+        content += (
+            translator.get(
+                "commands.owner.scheduler.stats.paused",
+                count=stats["paused_jobs"],
+            )
+            + "\n\n"
+        )
+
+        for key in ("lateness", "duration"):
+            histogram = stats[f"{key}_seconds"]
+            label = translator.get(f"commands.owner.scheduler.stats.{key}")
+            content += f"**{label}**\n"
+            content += (
+                translator.get(
+                    "commands.owner.scheduler.stats.percentiles",
+                    p50=histogram["p50"],
+                    p95=histogram["p95"],
+                    p99=histogram["p99"],
+                    max=histogram["max"],
+                    count=histogram["count"],
+                )
+                + "\n\n"
+            )
+
+        if channel_id:
+            header = translator.get(
+                "commands.owner.scheduler.stats.channel_history",
+                channel_id=channel_id,
+            )
+            content += f"**{header}**\n"
+            if history:
+                for record in reversed(history):
+                    content += (
+                        translator.get(
+                            "commands.owner.scheduler.stats.history_item",
+                            timestamp=int(record.started_at.timestamp()),
+                            outcome=record.outcome,
+                            deleted=record.deleted_count,
+                            duration=f"{record.duration_seconds:.2f}",
+                            lateness=f"{record.lateness_seconds:.2f}",
+                        )
+                        + "\n"
+                    )
+            else:
+                content += translator.get(
+                    "commands.owner.scheduler.stats.no_history"
+                )
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content.rstrip()),
+            accent_color=discord.Color.blue().value,
+        )
+        self.add_item(container)
+
+
+class ClearLedgerView(discord.ui.LayoutView):
+    """View for the channels whose clears took the longest"""
+
+    def __init__(self, summaries: list, hours: int, translator, server_id=None):
+        super().__init__()
+
+        title = translator.get("commands.owner.scheduler.channels.title", hours=hours)
+        content = f"📒 **{title}**\n"
+        if server_id:
+            content += (
+                translator.get(
+                    "commands.owner.scheduler.channels.server", server_id=server_id
+                )
+                + "\n"
+            )
+        content += "\n"
+
+        if summaries:
+            for summary in summaries:
+                content += (
+                    translator.get(
+                        "commands.owner.scheduler.channels.item",
+                        channel_id=summary["channel_id"],
+                        runs=summary["runs"],
+                        failed=summary["failed"],
+                        total=f"{summary['total_seconds']:.1f}",
+                        max=f"{summary['max_seconds']:.1f}",
+                        scanned=summary["scanned"],
+                        bulk=summary["bulk_deleted"],
+                        single=summary["single_deleted"],
+                        kept=summary["kept"],
+                        rate_limited=summary["rate_limited"],
+                    )
+                    + "\n"
+                )
+        else:
+            content += translator.get("commands.owner.scheduler.channels.empty")
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content.rstrip()),
+            accent_color=discord.Color.blue().value,
+        )
+        self.add_item(container)
+
+
 class ShardRestartView(discord.ui.LayoutView):
     """View for restarting all shards"""
 
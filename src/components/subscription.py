@@ -3,8 +3,9 @@ View components for subscription commands with full localization
 """
 
 import discord
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
+from src.models import ChannelClearProfile, ChannelGroup, ClearCheckpoint, PausedJob
 from src.utils.footer import add_footer
 
 
@@ -216,9 +217,12 @@ class SubscriptionInfoView(discord.ui.LayoutView):
     def __init__(
         self,
         channel: discord.TextChannel,
-        next_run_time: datetime,
+        next_run_time: Optional[datetime],
         timer_info,
         translator,
+        legacy_progress: Optional[ClearCheckpoint] = None,
+        profile: Optional[ChannelClearProfile] = None,
+        pause: Optional[PausedJob] = None,
     ):
         super().__init__()
 
@@ -229,19 +233,27 @@ class SubscriptionInfoView(discord.ui.LayoutView):
         lines.append(f"**{channel_label}:** {channel.mention}")
 
         if timer_info:
-            timestamp = int(next_run_time.timestamp())
             lines.append(translator.get("commands.subscription.info.subscribed"))
             lines.append(
                 translator.get(
                     "commands.subscription.info.timer", timer=timer_info.timer
                 )
             )
-            lines.append(
-                translator.get(
-                    "commands.subscription.info.next_clear",
-                    time=f"<t:{timestamp}:f> (<t:{timestamp}:R>)",
+            if pause is not None:
+                lines.append(
+                    translator.get(
+                        f"commands.subscription.info.paused.{pause.reason.value}",
+                        time=f"<t:{int(pause.paused_at.timestamp())}:R>",
+                    )
+                )
+            elif next_run_time is not None:
+                timestamp = int(next_run_time.timestamp())
+                lines.append(
+                    translator.get(
+                        "commands.subscription.info.next_clear",
+                        time=f"<t:{timestamp}:f> (<t:{timestamp}:R>)",
+                    )
                 )
-            )
 
             # Show ignored entities
             if hasattr(timer_info, "ignored"):
@@ -259,6 +271,25 @@ class SubscriptionInfoView(discord.ui.LayoutView):
                             count=len(timer_info.ignored.users),
                         )
                     )
+
+            # A first clear of a long history keeps going in the background
+            if legacy_progress:
+                lines.append(
+                    translator.get(
+                        "commands.subscription.info.legacy_progress",
+                        deleted=legacy_progress.deleted_count,
+                    )
+                )
+
+            if profile and profile.clears:
+                lines.append(
+                    translator.get(
+                        "commands.subscription.info.clear_profile",
+                        messages=round(profile.messages_per_clear),
+                        legacy_share=round(profile.legacy_share * 100),
+                        duration=f"{profile.last_duration_seconds:.1f}",
+                    )
+                )
         else:
             lines.append(translator.get("validation.not_subscribed_status"))
 
@@ -493,6 +524,78 @@ class NextTimeNotFoundView(discord.ui.LayoutView):
         self.add_item(container)
 
 
+class RecreateSettingView(discord.ui.LayoutView):
+    """View for the channel recreate setting"""
+
+    def __init__(
+        self, channel: discord.TextChannel, enabled: bool, threshold: int, translator
+    ):
+        super().__init__()
+
+        if enabled:
+            content = translator.get(
+                "commands.subscription.recreate.enabled",
+                channel=channel.mention,
+                threshold=threshold,
+            )
+        else:
+            content = translator.get(
+                "commands.subscription.recreate.disabled", channel=channel.mention
+            )
+
+        content = add_footer(content, translator)
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content),
+            accent_color=discord.Color.green().value,
+        )
+        self.add_item(container)
+
+
+class KeepPinsSettingView(discord.ui.LayoutView):
+    """View for the keep pinned messages setting"""
+
+    def __init__(self, channel: discord.TextChannel, keep: bool, translator):
+        super().__init__()
+
+        if keep:
+            content = translator.get(
+                "commands.subscription.pins.kept", channel=channel.mention
+            )
+        else:
+            content = translator.get(
+                "commands.subscription.pins.cleared", channel=channel.mention
+            )
+
+        content = add_footer(content, translator)
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content),
+            accent_color=discord.Color.green().value,
+        )
+        self.add_item(container)
+
+
+class RecreatedChannelNoticeView(discord.ui.LayoutView):
+    """Notice posted in a recreated channel when kept messages were lost"""
+
+    def __init__(self, lost_count: int, translator):
+        super().__init__()
+
+        content = add_footer(
+            translator.get(
+                "subscription.recreated_notice.lost_messages", count=lost_count
+            ),
+            translator,
+        )
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content),
+            accent_color=discord.Color.orange().value,
+        )
+        self.add_item(container)
+
+
 class MultipleIgnoreEntityView(discord.ui.LayoutView):
     """View for multiple ignore entity toggle result"""
 
@@ -645,6 +748,270 @@ class UpdateSuccessWithMultipleIgnoresView(discord.ui.LayoutView):
         self.add_item(container)
 
 
+def _describe_group_members(group: ChannelGroup, translator) -> str:
+    if group.category_id:
+        return translator.get(
+            "commands.subscription.group.members.category",
+            category=f"<#{group.category_id}>",
+            count=len(group.members),
+        )
+    return translator.get(
+        "commands.subscription.group.members.channels", count=len(group.members)
+    )
+
+
+def _mention_channels(channels: List[discord.TextChannel], limit: int = 20) -> str:
+    mentions = ", ".join(channel.mention for channel in channels[:limit])
+    if len(channels) > limit:
+        mentions += f" (+{len(channels) - limit})"
+    return mentions
+
+
+class GroupSubscriptionSuccessView(discord.ui.LayoutView):
+    """View for group subscription success message"""
+
+    def __init__(
+        self,
+        group: ChannelGroup,
+        category: Optional[discord.CategoryChannel],
+        next_run_time: datetime,
+        missing_permissions: List[discord.TextChannel],
+        own_subscription: List[discord.TextChannel],
+        translator,
+    ):
+        super().__init__()
+
+        timestamp = int(next_run_time.timestamp())
+
+        lines = [
+            translator.get(
+                "commands.subscription.group.add.success",
+                name=group.name,
+                members=_describe_group_members(group, translator),
+                timer=group.timer,
+            ),
+            "",
+            translator.get(
+                "commands.subscription.info.next_clear",
+                time=f"<t:{timestamp}:f> (<t:{timestamp}:R>)",
+            ),
+        ]
+
+        if missing_permissions:
+            lines.append("")
+            lines.append(
+                translator.get(
+                    "commands.subscription.group.add.missing_permissions",
+                    channels=_mention_channels(missing_permissions),
+                )
+            )
+
+        if own_subscription:
+            lines.append("")
+            lines.append(
+                translator.get(
+                    "commands.subscription.group.add.own_subscription",
+                    channels=_mention_channels(own_subscription),
+                )
+            )
+
+        content = add_footer("\n".join(lines), translator)
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content),
+            accent_color=discord.Color.green().value,
+        )
+        self.add_item(container)
+
+
+class SubscriptionErrorView(discord.ui.LayoutView):
+    """View for subscription errors given as a translated message"""
+
+    def __init__(self, message: str, translator):
+        super().__init__()
+
+        content = add_footer(message, translator)
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content),
+            accent_color=discord.Color.red().value,
+        )
+        self.add_item(container)
+
+
+class GroupUnsubscribeSuccessView(discord.ui.LayoutView):
+    """View for group unsubscribe success"""
+
+    def __init__(self, group: ChannelGroup, translator):
+        super().__init__()
+
+        content = add_footer(
+            translator.get(
+                "commands.subscription.group.remove.success",
+                name=group.name,
+                count=len(group.members),
+            ),
+            translator,
+        )
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content),
+            accent_color=discord.Color.green().value,
+        )
+        self.add_item(container)
+
+
+class GroupListView(discord.ui.LayoutView):
+    """View for listing the group subscriptions of a server"""
+
+    def __init__(
+        self, guild: discord.Guild, groups: dict, scheduler_service, translator
+    ):
+        super().__init__()
+
+        title = translator.get("commands.subscription.group.list.title")
+        lines = [f"**{title}**", ""]
+
+        if not groups:
+            lines.append(translator.get("commands.subscription.group.list.empty"))
+        else:
+            for name, group in sorted(groups.items()):
+                next_run_time = scheduler_service.get_group_next_clear_time(
+                    str(guild.id), name
+                )
+                if next_run_time:
+                    next_clear = f"<t:{int(next_run_time.timestamp())}:R>"
+                else:
+                    next_clear = translator.get("common.unknown")
+
+                lines.append(
+                    translator.get(
+                        "commands.subscription.group.list.item",
+                        name=name,
+                        members=_describe_group_members(group, translator),
+                        timer=group.timer,
+                        next_clear=next_clear,
+                    )
+                )
+
+        content = add_footer("\n".join(lines), translator)
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content),
+            accent_color=discord.Color.blue().value,
+        )
+        self.add_item(container)
+
+
+class GroupMemberInfoView(discord.ui.LayoutView):
+    """View for subscription info of a channel cleared by a group"""
+
+    def __init__(
+        self,
+        channel: discord.TextChannel,
+        group: ChannelGroup,
+        next_run_time: Optional[datetime],
+        translator,
+    ):
+        super().__init__()
+
+        if next_run_time:
+            timestamp = int(next_run_time.timestamp())
+            next_clear = f"<t:{timestamp}:f> (<t:{timestamp}:R>)"
+        else:
+            next_clear = translator.get("common.unknown")
+
+        lines = [
+            translator.get(
+                "commands.subscription.group.member_of",
+                channel=channel.mention,
+                name=group.name,
+                timer=group.timer,
+                time=next_clear,
+            )
+        ]
+
+        member = group.members[str(channel.id)]
+        if member.ignored.messages:
+            lines.append(
+                translator.get(
+                    "commands.subscription.info.ignored_messages",
+                    count=len(member.ignored.messages),
+                )
+            )
+        if member.ignored.users:
+            lines.append(
+                translator.get(
+                    "commands.subscription.info.ignored_users",
+                    count=len(member.ignored.users),
+                )
+            )
+
+        content = add_footer("\n".join(lines), translator)
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content),
+            accent_color=discord.Color.blue().value,
+        )
+        self.add_item(container)
+
+
+class BulkSubscriptionSummaryView(discord.ui.LayoutView):
+    """View summarizing a bulk subscription change"""
+
+    def __init__(
+        self,
+        action: str,
+        changed: List[discord.TextChannel],
+        skipped: Dict[str, List[discord.TextChannel]],
+        translator,
+        timer: Optional[str] = None,
+        next_run_time: Optional[datetime] = None,
+    ):
+        super().__init__()
+
+        if changed:
+            lines = [
+                translator.get(
+                    f"commands.subscription.bulk.{action}.success",
+                    count=len(changed),
+                    channels=_mention_channels(changed),
+                    timer=timer,
+                )
+            ]
+            if next_run_time:
+                timestamp = int(next_run_time.timestamp())
+                lines.append("")
+                lines.append(
+                    translator.get(
+                        "commands.subscription.info.next_clear",
+                        time=f"<t:{timestamp}:f> (<t:{timestamp}:R>)",
+                    )
+                )
+        else:
+            lines = [translator.get("commands.subscription.bulk.unchanged")]
+
+        for reason, channels in skipped.items():
+            if channels:
+                lines.append("")
+                lines.append(
+                    translator.get(
+                        f"commands.subscription.bulk.skipped.{reason}",
+                        channels=_mention_channels(channels),
+                    )
+                )
+
+        content = add_footer("\n".join(lines), translator)
+
+        container = discord.ui.Container(
+            discord.ui.TextDisplay(content=content),
+            accent_color=(
+                discord.Color.green() if changed else discord.Color.yellow()
+            ).value,
+        )
+        self.add_item(container)
+
+
 # Timer view message
 class TimerViewMessage(discord.ui.LayoutView):
     """Persistent view message for timer display"""
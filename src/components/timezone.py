@@ -10,10 +10,14 @@ from src.utils.footer import add_footer
 class TimezoneChangeSuccessView(discord.ui.LayoutView):
     """View for successful timezone change"""
 
-    def __init__(self, timezone: str, translator):
+    def __init__(self, timezone: str, translator, rescheduled: int = 0):
         super().__init__()
 
         message = translator.get("commands.timezone.change.success", timezone=timezone)
+        if rescheduled:
+            message += "\n\n" + translator.get(
+                "commands.timezone.change.rescheduled", count=rescheduled
+            )
         content = add_footer(message, translator)
 
         container = discord.ui.Container(
@@ -30,11 +30,49 @@ class GlobalConfig:
     missed_clear_notification_timeout: float = (
         0.0  # Seconds before deleting missed clear notifications (0.0 = never delete)
     )
+    clear_pipeline_queue_pages: int = 4  # History pages fetched ahead of deletion
+    clear_legacy_messages: bool = True  # Also delete messages too old for bulk delete
+    clear_single_delete_max_rate: float = 5.0  # Single deletes per second per server
+    legacy_delete_workers: int = 4  # Workers draining the shard's legacy deletions
+    legacy_delete_shard_rate: float = 20.0  # Single deletes per second per shard
+    legacy_delete_channel_buffer: int = 200  # Message ids buffered per channel
+    clear_recreate_threshold: int = 5000  # Estimated old messages before recreating
+    clear_prestage_lead_time: float = 300.0  # Seconds fixed-time clears read ahead
+    clear_prestage_max_messages: int = 50000  # Message ids staged across the shard
+    channel_profile_flush_interval: int = 300  # Seconds between clear profile saves
+    ignored_compaction_interval: int = 3600  # Seconds between stale ignored id checks
+    ignored_compaction_batch: int = 100  # Ignored ids checked per compaction run
+    ignored_compaction_rate: float = 1.0  # Ignored id checks per second
+    clear_ledger_retention_days: int = 30  # Days clear runs are kept in the ledger
+    clear_ledger_batch_size: int = 500  # Clear runs buffered before a ledger write
+    clear_ledger_flush_interval: int = 60  # Seconds between ledger writes
+    clear_forbidden_pause_threshold: int = 3  # Refused clears before a job pauses
 
     # Scheduler Settings
     max_restart_attempts: int = 3
     restart_cooldown: int = 30
     cache_cleanup_interval: int = 900
+    scheduler_history_size: int = 20  # Recent clear runs kept per channel
+    scheduler_histogram_samples: int = 1000  # Samples kept for percentile stats
+    scheduler_heartbeat_interval: int = 60  # Seconds between liveness writes
+    group_clear_concurrency: int = 4  # Channels of a group subscription cleared at once
+    view_refresh_rate: float = 1.0  # Timer view edits per second after a reschedule
+
+    # Clear Retry Settings
+    clear_retry_max_attempts: int = 3
+    clear_retry_base_delay: float = 30.0  # Seconds before the first retry
+    clear_retry_max_delay: float = 1800.0  # Upper bound on the backoff delay
+    clear_retry_min_spacing: float = 2.0  # Seconds between retries shard-wide
+
+    # Shard Health Settings
+    shard_health_window: int = 60  # Seconds of REST responses in the error rate
+    shard_health_min_requests: int = 20  # Responses before the error rate counts
+    shard_health_slow_rate: float = 0.1  # Error share that slows clear dispatch
+    shard_health_defer_rate: float = 0.25  # Error share that defers view edits
+    shard_health_shed_rate: float = 0.5  # Error share that holds back new clears
+    shard_health_recovery_interval: int = 120  # Healthy seconds per mode step down
+    shard_health_dispatch_interval: float = 2.0  # Seconds between degraded clears
+    shard_health_check_interval: int = 15  # Seconds between idle mode checks
 
     # Support Links
     support_server_url: str = "https://biast12.com/botsupport"
@@ -79,6 +117,77 @@ class GlobalConfig:
                 str(self.missed_clear_notification_timeout),
             )
         )
+        self.clear_pipeline_queue_pages = int(
+            os.getenv(
+                "CLEAR_PIPELINE_QUEUE_PAGES", str(self.clear_pipeline_queue_pages)
+            )
+        )
+        self.clear_legacy_messages = (
+            os.getenv("CLEAR_LEGACY_MESSAGES", "true").lower() == "true"
+        )
+        self.clear_single_delete_max_rate = float(
+            os.getenv(
+                "CLEAR_SINGLE_DELETE_MAX_RATE", str(self.clear_single_delete_max_rate)
+            )
+        )
+        self.legacy_delete_workers = int(
+            os.getenv("LEGACY_DELETE_WORKERS", str(self.legacy_delete_workers))
+        )
+        self.legacy_delete_shard_rate = float(
+            os.getenv("LEGACY_DELETE_SHARD_RATE", str(self.legacy_delete_shard_rate))
+        )
+        self.legacy_delete_channel_buffer = int(
+            os.getenv(
+                "LEGACY_DELETE_CHANNEL_BUFFER", str(self.legacy_delete_channel_buffer)
+            )
+        )
+        self.clear_recreate_threshold = int(
+            os.getenv("CLEAR_RECREATE_THRESHOLD", str(self.clear_recreate_threshold))
+        )
+        self.clear_prestage_lead_time = float(
+            os.getenv("CLEAR_PRESTAGE_LEAD_TIME", str(self.clear_prestage_lead_time))
+        )
+        self.clear_prestage_max_messages = int(
+            os.getenv(
+                "CLEAR_PRESTAGE_MAX_MESSAGES", str(self.clear_prestage_max_messages)
+            )
+        )
+        self.channel_profile_flush_interval = int(
+            os.getenv(
+                "CHANNEL_PROFILE_FLUSH_INTERVAL",
+                str(self.channel_profile_flush_interval),
+            )
+        )
+        self.ignored_compaction_interval = int(
+            os.getenv(
+                "IGNORED_COMPACTION_INTERVAL", str(self.ignored_compaction_interval)
+            )
+        )
+        self.ignored_compaction_batch = int(
+            os.getenv("IGNORED_COMPACTION_BATCH", str(self.ignored_compaction_batch))
+        )
+        self.ignored_compaction_rate = float(
+            os.getenv("IGNORED_COMPACTION_RATE", str(self.ignored_compaction_rate))
+        )
+        self.clear_ledger_retention_days = int(
+            os.getenv(
+                "CLEAR_LEDGER_RETENTION_DAYS", str(self.clear_ledger_retention_days)
+            )
+        )
+        self.clear_ledger_batch_size = int(
+            os.getenv("CLEAR_LEDGER_BATCH_SIZE", str(self.clear_ledger_batch_size))
+        )
+        self.clear_ledger_flush_interval = int(
+            os.getenv(
+                "CLEAR_LEDGER_FLUSH_INTERVAL", str(self.clear_ledger_flush_interval)
+            )
+        )
+        self.clear_forbidden_pause_threshold = int(
+            os.getenv(
+                "CLEAR_FORBIDDEN_PAUSE_THRESHOLD",
+                str(self.clear_forbidden_pause_threshold),
+            )
+        )
 
         # Scheduler Settings
         self.max_restart_attempts = int(
@@ -90,6 +199,75 @@ class GlobalConfig:
         self.cache_cleanup_interval = int(
             os.getenv("CACHE_CLEANUP_INTERVAL", str(self.cache_cleanup_interval))
         )
+        self.scheduler_history_size = int(
+            os.getenv("SCHEDULER_HISTORY_SIZE", str(self.scheduler_history_size))
+        )
+        self.scheduler_histogram_samples = int(
+            os.getenv(
+                "SCHEDULER_HISTOGRAM_SAMPLES", str(self.scheduler_histogram_samples)
+            )
+        )
+        self.scheduler_heartbeat_interval = int(
+            os.getenv(
+                "SCHEDULER_HEARTBEAT_INTERVAL", str(self.scheduler_heartbeat_interval)
+            )
+        )
+        self.group_clear_concurrency = int(
+            os.getenv("GROUP_CLEAR_CONCURRENCY", str(self.group_clear_concurrency))
+        )
+        self.view_refresh_rate = float(
+            os.getenv("VIEW_REFRESH_RATE", str(self.view_refresh_rate))
+        )
+
+        # Clear Retry Settings
+        self.clear_retry_max_attempts = int(
+            os.getenv("CLEAR_RETRY_MAX_ATTEMPTS", str(self.clear_retry_max_attempts))
+        )
+        self.clear_retry_base_delay = float(
+            os.getenv("CLEAR_RETRY_BASE_DELAY", str(self.clear_retry_base_delay))
+        )
+        self.clear_retry_max_delay = float(
+            os.getenv("CLEAR_RETRY_MAX_DELAY", str(self.clear_retry_max_delay))
+        )
+        self.clear_retry_min_spacing = float(
+            os.getenv("CLEAR_RETRY_MIN_SPACING", str(self.clear_retry_min_spacing))
+        )
+
+        # Shard Health Settings
+        self.shard_health_window = int(
+            os.getenv("SHARD_HEALTH_WINDOW", str(self.shard_health_window))
+        )
+        self.shard_health_min_requests = int(
+            os.getenv(
+                "SHARD_HEALTH_MIN_REQUESTS", str(self.shard_health_min_requests)
+            )
+        )
+        self.shard_health_slow_rate = float(
+            os.getenv("SHARD_HEALTH_SLOW_RATE", str(self.shard_health_slow_rate))
+        )
+        self.shard_health_defer_rate = float(
+            os.getenv("SHARD_HEALTH_DEFER_RATE", str(self.shard_health_defer_rate))
+        )
+        self.shard_health_shed_rate = float(
+            os.getenv("SHARD_HEALTH_SHED_RATE", str(self.shard_health_shed_rate))
+        )
+        self.shard_health_recovery_interval = int(
+            os.getenv(
+                "SHARD_HEALTH_RECOVERY_INTERVAL",
+                str(self.shard_health_recovery_interval),
+            )
+        )
+        self.shard_health_dispatch_interval = float(
+            os.getenv(
+                "SHARD_HEALTH_DISPATCH_INTERVAL",
+                str(self.shard_health_dispatch_interval),
+            )
+        )
+        self.shard_health_check_interval = int(
+            os.getenv(
+                "SHARD_HEALTH_CHECK_INTERVAL", str(self.shard_health_check_interval)
+            )
+        )
 
         # Support Links
         self.support_server_url = os.getenv(
@@ -1,12 +1,14 @@
 import discord
 from discord.ext import commands, tasks
 from datetime import datetime, timezone
+from typing import Optional
 
-from src.models import BotConfig
+from src.models import BotConfig, PauseReason
 from src.services.server_data_service import DataService
 from src.services.database_connection_manager import db_manager
 from src.services.clear_job_scheduler_service import SchedulerService
 from src.services.message_clearing_service import MessageService
+from src.services.timezone_reschedule_service import TimezoneRescheduleService
 from src.utils.logger import logger, LogArea
 
 
@@ -38,6 +40,11 @@ class ClearTimerBot(commands.Bot):
         self.scheduler_service = SchedulerService(self.data_service)
         self.message_service = MessageService(self.data_service, self.scheduler_service)
         self.message_service.set_bot(self)  # Set the bot instance
+        self.timezone_rescheduler = TimezoneRescheduleService(
+            self.data_service,
+            self.scheduler_service,
+            self.message_service._refresh_timer_view_message,
+        )
 
         self.activity_dots = 0
 
@@ -47,6 +54,9 @@ class ClearTimerBot(commands.Bot):
         self.scheduler_service.register_missed_clear_notification_callback(
             self.message_service.send_missed_clear_notification
         )
+        self.scheduler_service.register_prestage_callback(
+            self.message_service.prestage_clear
+        )
 
     @tasks.loop(seconds=2.0)
     async def rotate_activity(self):
@@ -55,7 +65,7 @@ class ClearTimerBot(commands.Bot):
         total_subscriptions = 0
         all_servers = await self.data_service.get_all_servers()
         for server in all_servers.values():
-            total_subscriptions += len(server.channels)
+            total_subscriptions += server.count_cleared_channels()
 
         activity = discord.CustomActivity(
             name=f"🧹 Cleaning up {total_subscriptions} channels{dots}"
@@ -98,10 +108,14 @@ class ClearTimerBot(commands.Bot):
             await self._sync_server_cleanup_status()
             await self._update_server_names()
             await self._cleanup_deleted_channels()
+            await self._sync_group_members()
 
             await self.scheduler_service.start()
             await self.scheduler_service.initialize_all_scheduled_jobs(self)
             logger.info(LogArea.SCHEDULER, "Scheduler jobs initialized")
+            await self.message_service.load_channel_profiles()
+            self.message_service.schedule_maintenance_jobs()
+            await self.message_service.resume_checkpointed_clears()
 
             await self._update_all_view_messages()
             await self.data_service.cleanup_old_removed_servers()
@@ -176,6 +190,10 @@ class ClearTimerBot(commands.Bot):
         if self.rotate_activity.is_running():
             self.rotate_activity.cancel()
 
+        await self.message_service.stop_legacy_passes()
+        await self.message_service.save_channel_profiles()
+        await self.message_service.clear_ledger.flush()
+        await self.timezone_rescheduler.stop()
         await self.scheduler_service.shutdown()
         logger.info(LogArea.STARTUP, "Scheduler service shut down")
 
@@ -249,6 +267,30 @@ class ClearTimerBot(commands.Bot):
             LogArea.DISCORD, f"Bot removed from server: {guild.name} (ID: {server_id})"
         )
 
+    async def on_guild_unavailable(self, guild: discord.Guild) -> None:
+        """Hold the server's clears while Discord has an outage"""
+        paused = self.scheduler_service.pause_guild_jobs(
+            str(guild.id), PauseReason.GUILD_UNAVAILABLE
+        )
+        if paused:
+            logger.warning(
+                LogArea.DISCORD,
+                f"Server {guild.id} became unavailable, paused {paused} clear jobs",
+            )
+
+    async def on_guild_available(self, guild: discord.Guild) -> None:
+        """Resume the clears held during an outage"""
+        resumed = self.scheduler_service.resume_guild_jobs(
+            str(guild.id), PauseReason.GUILD_UNAVAILABLE
+        )
+        if resumed:
+            logger.info(
+                LogArea.DISCORD,
+                f"Server {guild.id} is available again, resumed {resumed} clear jobs",
+            )
+            # Permissions may have changed while the events were missed
+            await self.message_service.sync_channel_permissions(guild)
+
     async def _update_server_names(self) -> None:
         """Update server names for all connected guilds on startup"""
         updated_count = 0
@@ -335,14 +377,139 @@ class ClearTimerBot(commands.Bot):
                         server_id, channel_id
                     )
 
-    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
-        """Handle when a channel is deleted"""
-        if not isinstance(channel, discord.TextChannel):
+    async def _sync_group_members(self) -> None:
+        """Match group members to the channels that exist after being offline"""
+        all_servers = await self.data_service.get_all_servers()
+        changed = False
+
+        for server_id, server in all_servers.items():
+            guild = self.get_guild(int(server_id))
+            if not guild:
+                continue
+
+            for group in list(server.groups.values()):
+                if group.category_id:
+                    category = guild.get_channel(int(group.category_id))
+                    if not isinstance(category, discord.CategoryChannel):
+                        server.remove_group(group.name)
+                        changed = True
+                        logger.info(
+                            LogArea.CLEANUP,
+                            f"Removed group {group.name} of deleted category {group.category_id} in server {guild.name}",
+                        )
+                        continue
+                    current = {str(channel.id) for channel in category.text_channels}
+                else:
+                    current = {
+                        channel_id
+                        for channel_id in group.members
+                        if isinstance(
+                            guild.get_channel(int(channel_id)), discord.TextChannel
+                        )
+                    }
+
+                for channel_id in set(group.members) - current:
+                    group.remove_member(channel_id)
+                    changed = True
+                for channel_id in current - set(group.members):
+                    # Stays with the group it already belongs to
+                    if server.get_member_group(channel_id) is not None:
+                        continue
+                    group.add_member(channel_id)
+                    changed = True
+
+        if changed:
+            await self.data_service.save_servers()
+
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        """Add a new channel to the group of its category"""
+        if isinstance(channel, discord.TextChannel) and channel.category_id:
+            await self._follow_category_group(channel, None, channel.category_id)
+
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ) -> None:
+        """Move a channel between category groups when it changes category"""
+        if (
+            isinstance(after, discord.TextChannel)
+            and before.category_id != after.category_id
+        ):
+            await self._follow_category_group(
+                after, before.category_id, after.category_id
+            )
+
+        if before.overwrites != after.overwrites:
+            if isinstance(after, discord.CategoryChannel):
+                await self.message_service.sync_channel_permissions(after.guild)
+            elif isinstance(after, discord.TextChannel):
+                await self.message_service.sync_channel_permissions(
+                    after.guild, [str(after.id)]
+                )
+
+    async def on_guild_role_update(
+        self, before: discord.Role, after: discord.Role
+    ) -> None:
+        """Pause or resume clears when one of the bot's roles changes"""
+        if before.permissions != after.permissions and after in after.guild.me.roles:
+            await self.message_service.sync_channel_permissions(after.guild)
+
+    async def on_member_update(
+        self, before: discord.Member, after: discord.Member
+    ) -> None:
+        """Pause or resume clears when the bot gains or loses roles"""
+        # Sent for the bot's own member even without the members intent
+        if after.id == self.user.id and before.roles != after.roles:
+            await self.message_service.sync_channel_permissions(after.guild)
+
+    async def _follow_category_group(
+        self,
+        channel: discord.TextChannel,
+        old_category_id: Optional[int],
+        new_category_id: Optional[int],
+    ) -> None:
+        server_id = str(channel.guild.id)
+        channel_id = str(channel.id)
+        server = await self.data_service.get_server(server_id)
+        if not server or not server.groups:
             return
 
+        old_group = (
+            server.get_category_group(str(old_category_id))
+            if old_category_id
+            else None
+        )
+        if old_group and await self.data_service.remove_group_member(
+            server_id, old_group.name, channel_id
+        ):
+            self.scheduler_service.forget_group_member(server_id, channel_id)
+
+        new_group = (
+            server.get_category_group(str(new_category_id))
+            if new_category_id
+            else None
+        )
+        if new_group:
+            await self.data_service.add_group_member(
+                server_id, new_group.name, channel_id
+            )
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """Handle when a channel is deleted"""
         server_id = str(channel.guild.id)
         channel_id = str(channel.id)
 
+        if isinstance(channel, discord.CategoryChannel):
+            server = await self.data_service.get_server(server_id)
+            group = server.get_category_group(channel_id) if server else None
+            if group and await self.data_service.remove_group_subscription(
+                server_id, group.name
+            ):
+                self.scheduler_service.remove_group_clear_job(server_id, group.name)
+            return
+
+        if not isinstance(channel, discord.TextChannel):
+            return
+
         server = await self.data_service.get_server(server_id)
         if server and channel_id in server.channels:
             if await self.data_service.remove_channel_subscription(
@@ -351,6 +518,13 @@ class ClearTimerBot(commands.Bot):
                 job_id = f"{server_id}_{channel_id}"
                 await self.scheduler_service.cancel_job_by_id(job_id)
 
+        if server:
+            for group in list(server.groups.values()):
+                if await self.data_service.remove_group_member(
+                    server_id, group.name, channel_id
+                ):
+                    self.scheduler_service.forget_group_member(server_id, channel_id)
+
     async def _cleanup_server_channels(self, guild: discord.Guild) -> None:
         """Clean up deleted channels when bot rejoins a server"""
         server_id = str(guild.id)
@@ -1,4 +1,11 @@
-from .channel_subscription import ChannelTimer, Server, IgnoredEntities
+from .channel_subscription import (
+    ChannelTimer,
+    ChannelGroup,
+    GroupMember,
+    GROUP_NAME_PATTERN,
+    Server,
+    IgnoredEntities,
+)
 
 from .database_models import (
     CollectionName,
@@ -11,7 +18,28 @@ from .database_models import (
 
 from .cache import CacheLevel, CacheEntry, CacheStats, GlobalCacheStats
 
-from .scheduler import TaskStatus, ScheduledTask, SchedulerStats
+from .scheduler import (
+    TaskStatus,
+    PauseReason,
+    PausedJob,
+    HealthMode,
+    HealthModeChange,
+    ScheduledTask,
+    SchedulerStats,
+    RollingHistogram,
+    ClearExecutionRecord,
+    RescheduledJob,
+)
+
+from .clearing import (
+    ChannelClearProfile,
+    ChannelHighWaterMark,
+    ClearCheckpoint,
+    ClearOutcome,
+    ClearResult,
+    ClearRunRecord,
+    IgnoreFilter,
+)
 
 from .config import LogLevel, Environment, BotConfig
 
@@ -20,6 +48,9 @@ from .errors import LogArea
 __all__ = [
     # Timer models
     "ChannelTimer",
+    "ChannelGroup",
+    "GroupMember",
+    "GROUP_NAME_PATTERN",
     "Server",
     "IgnoredEntities",
     # Database models
@@ -36,8 +67,23 @@ __all__ = [
     "GlobalCacheStats",
     # Scheduler models
     "TaskStatus",
+    "PauseReason",
+    "PausedJob",
+    "HealthMode",
+    "HealthModeChange",
     "ScheduledTask",
     "SchedulerStats",
+    "RollingHistogram",
+    "ClearExecutionRecord",
+    "RescheduledJob",
+    # Clearing models
+    "ClearOutcome",
+    "ClearResult",
+    "ClearRunRecord",
+    "ChannelClearProfile",
+    "ChannelHighWaterMark",
+    "ClearCheckpoint",
+    "IgnoreFilter",
     # Config models
     "LogLevel",
     "Environment",
@@ -1,76 +1,227 @@
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, Any, Set, Union
+
+from .clearing import IgnoreFilter
 
 
 @dataclass
 class IgnoredEntities:
-    """Container for ignored messages and users"""
+    """Container for ignored messages and users
+
+    Ids are held as ints for clears to test against, and stored as lists of
+    strings like every other id in the database.
+    """
 
-    messages: List[str] = field(default_factory=list)
-    users: List[str] = field(default_factory=list)
+    messages: Set[int] = field(default_factory=set)
+    users: Set[int] = field(default_factory=set)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"messages": self.messages, "users": self.users}
+        return {
+            "messages": [str(message_id) for message_id in sorted(self.messages)],
+            "users": [str(user_id) for user_id in sorted(self.users)],
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "IgnoredEntities":
-        return cls(messages=data.get("messages", []), users=data.get("users", []))
+        return cls(
+            messages={int(message_id) for message_id in data.get("messages", [])},
+            users={int(user_id) for user_id in data.get("users", [])},
+        )
+
+
+class _IgnoreRules:
+    """Toggling of the ignored messages and users of a cleared channel"""
+
+    ignored: IgnoredEntities
+
+    def is_message_ignored(self, message_id: str) -> bool:
+        return int(message_id) in self.ignored.messages
+
+    def is_user_ignored(self, user_id: str) -> bool:
+        return int(user_id) in self.ignored.users
+
+    def add_ignored_message(self, message_id: str) -> bool:
+        if self.is_message_ignored(message_id):
+            return False
+        self.ignored.messages.add(int(message_id))
+        return True
+
+    def remove_ignored_message(self, message_id: str) -> bool:
+        if not self.is_message_ignored(message_id):
+            return False
+        self.ignored.messages.discard(int(message_id))
+        return True
+
+    def add_ignored_user(self, user_id: str) -> bool:
+        if self.is_user_ignored(user_id):
+            return False
+        self.ignored.users.add(int(user_id))
+        return True
+
+    def remove_ignored_user(self, user_id: str) -> bool:
+        if not self.is_user_ignored(user_id):
+            return False
+        self.ignored.users.discard(int(user_id))
+        return True
 
 
 @dataclass
-class ChannelTimer:
+class ChannelTimer(_IgnoreRules):
+    """Stored schedule for a channel, next run times are derived from the trigger"""
+
     channel_id: str
     timer: str
-    next_run_time: datetime
+    anchor_time: datetime
+    skip_until: Optional[datetime] = None
     ignored: IgnoredEntities = field(default_factory=IgnoredEntities)
     view_message_id: Optional[str] = None
+    allow_recreate: bool = False
+    keep_pinned: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         data = {
             "timer": self.timer,
-            "next_run_time": self.next_run_time.isoformat(),
+            "anchor_time": self.anchor_time.isoformat(),
             "ignored": self.ignored.to_dict(),
         }
+        if self.skip_until:
+            data["skip_until"] = self.skip_until.isoformat()
         if self.view_message_id:
             data["view_message_id"] = self.view_message_id
+        if self.allow_recreate:
+            data["allow_recreate"] = True
+        if self.keep_pinned:
+            data["keep_pinned"] = True
         return data
 
     @classmethod
     def from_dict(cls, channel_id: str, data: Dict[str, Any]) -> "ChannelTimer":
         ignored = IgnoredEntities.from_dict(data.get("ignored", {}))
+        # Documents written before anchors existed only carry the last known
+        # next run time, which is still a valid fire time to anchor on
+        anchor_time = data.get("anchor_time") or data["next_run_time"]
+        skip_until = data.get("skip_until")
 
         return cls(
             channel_id=channel_id,
             timer=data["timer"],
-            next_run_time=datetime.fromisoformat(data["next_run_time"]),
+            anchor_time=datetime.fromisoformat(anchor_time),
+            skip_until=datetime.fromisoformat(skip_until) if skip_until else None,
             ignored=ignored,
             view_message_id=data.get("view_message_id"),
+            allow_recreate=data.get("allow_recreate", False),
+            keep_pinned=data.get("keep_pinned", False),
         )
 
-    def add_ignored_message(self, message_id: str) -> bool:
-        if message_id not in self.ignored.messages:
-            self.ignored.messages.append(message_id)
-            return True
-        return False
+    def reschedule(self, timer: str, anchor_time: datetime) -> None:
+        """Replace the schedule, dropping any pending skip"""
+        self.timer = timer
+        self.anchor_time = anchor_time
+        self.skip_until = None
 
-    def remove_ignored_message(self, message_id: str) -> bool:
-        if message_id in self.ignored.messages:
-            self.ignored.messages.remove(message_id)
-            return True
-        return False
+    def compile_ignore_filter(self) -> IgnoreFilter:
+        """The ignored entities and the timer view message as one clear filter"""
+        message_ids = set(self.ignored.messages)
+        if self.view_message_id:
+            message_ids.add(int(self.view_message_id))
+        return IgnoreFilter(
+            message_ids=frozenset(message_ids),
+            user_ids=frozenset(self.ignored.users),
+            fetch_pinned=self.keep_pinned,
+        )
 
-    def add_ignored_user(self, user_id: str) -> bool:
-        if user_id not in self.ignored.users:
-            self.ignored.users.append(user_id)
-            return True
-        return False
 
-    def remove_ignored_user(self, user_id: str) -> bool:
-        if user_id in self.ignored.users:
-            self.ignored.users.remove(user_id)
-            return True
-        return False
+@dataclass
+class GroupMember(_IgnoreRules):
+    """A channel cleared by a group subscription, with its own ignore lists"""
+
+    channel_id: str
+    ignored: IgnoredEntities = field(default_factory=IgnoredEntities)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ignored": self.ignored.to_dict()}
+
+    @classmethod
+    def from_dict(cls, channel_id: str, data: Dict[str, Any]) -> "GroupMember":
+        return cls(
+            channel_id=channel_id,
+            ignored=IgnoredEntities.from_dict(data.get("ignored", {})),
+        )
+
+
+# Group names are used as keys of the server document
+GROUP_NAME_PATTERN = re.compile(r"^[a-z0-9_-]{1,32}$")
+
+
+@dataclass
+class ChannelGroup:
+    """One schedule shared by the text channels of a category or an explicit list
+
+    A category group's members follow the category as channels are created,
+    moved or deleted.
+    """
+
+    name: str
+    timer: str
+    anchor_time: datetime
+    category_id: Optional[str] = None
+    members: Dict[str, GroupMember] = field(default_factory=dict)
+    skip_until: Optional[datetime] = None
+    keep_pinned: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "timer": self.timer,
+            "anchor_time": self.anchor_time.isoformat(),
+            "members": {
+                channel_id: member.to_dict()
+                for channel_id, member in self.members.items()
+            },
+        }
+        if self.category_id:
+            data["category_id"] = self.category_id
+        if self.skip_until:
+            data["skip_until"] = self.skip_until.isoformat()
+        if self.keep_pinned:
+            data["keep_pinned"] = True
+        return data
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "ChannelGroup":
+        skip_until = data.get("skip_until")
+        return cls(
+            name=name,
+            timer=data["timer"],
+            anchor_time=datetime.fromisoformat(data["anchor_time"]),
+            category_id=data.get("category_id"),
+            members={
+                channel_id: GroupMember.from_dict(channel_id, member_data)
+                for channel_id, member_data in data.get("members", {}).items()
+            },
+            skip_until=datetime.fromisoformat(skip_until) if skip_until else None,
+            keep_pinned=data.get("keep_pinned", False),
+        )
+
+    def add_member(self, channel_id: str) -> bool:
+        if channel_id in self.members:
+            return False
+        self.members[channel_id] = GroupMember(channel_id)
+        return True
+
+    def remove_member(self, channel_id: str) -> bool:
+        return self.members.pop(channel_id, None) is not None
+
+    def compile_ignore_filter(self, channel_id: str) -> IgnoreFilter:
+        member = self.members.get(channel_id)
+        if member is None:
+            return IgnoreFilter(fetch_pinned=self.keep_pinned)
+        return IgnoreFilter(
+            message_ids=frozenset(member.ignored.messages),
+            user_ids=frozenset(member.ignored.users),
+            fetch_pinned=self.keep_pinned,
+        )
 
 
 @dataclass
@@ -78,11 +229,12 @@ class Server:
     server_id: str
     server_name: str
     channels: Dict[str, ChannelTimer] = field(default_factory=dict)
+    groups: Dict[str, ChannelGroup] = field(default_factory=dict)
     timezone: Optional[str] = None
     language: Optional[str] = None
 
-    def add_channel(self, channel_id: str, timer: str, next_run_time: datetime) -> None:
-        self.channels[channel_id] = ChannelTimer(channel_id, timer, next_run_time)
+    def add_channel(self, channel_id: str, timer: str, anchor_time: datetime) -> None:
+        self.channels[channel_id] = ChannelTimer(channel_id, timer, anchor_time)
 
     def remove_channel(self, channel_id: str) -> bool:
         if channel_id in self.channels:
@@ -93,6 +245,60 @@ class Server:
     def get_channel(self, channel_id: str) -> Optional[ChannelTimer]:
         return self.channels.get(channel_id)
 
+    def add_group(self, group: ChannelGroup) -> None:
+        self.groups[group.name] = group
+
+    def remove_group(self, name: str) -> bool:
+        return self.groups.pop(name, None) is not None
+
+    def get_group(self, name: str) -> Optional[ChannelGroup]:
+        return self.groups.get(name)
+
+    def get_channel_group(self, channel_id: str) -> Optional[ChannelGroup]:
+        """The group a channel is cleared by, unless it has its own subscription"""
+        if channel_id in self.channels:
+            return None
+        return self.get_member_group(channel_id)
+
+    def get_member_group(self, channel_id: str) -> Optional[ChannelGroup]:
+        """The group a channel belongs to, a channel is in at most one"""
+        for group in self.groups.values():
+            if channel_id in group.members:
+                return group
+        return None
+
+    def get_category_group(self, category_id: str) -> Optional[ChannelGroup]:
+        for group in self.groups.values():
+            if group.category_id == category_id:
+                return group
+        return None
+
+    def is_channel_cleared(self, channel_id: str) -> bool:
+        return channel_id in self.channels or any(
+            channel_id in group.members for group in self.groups.values()
+        )
+
+    def get_ignore_rules(
+        self, channel_id: str
+    ) -> Optional[Union[ChannelTimer, GroupMember]]:
+        """Whatever holds the ignore lists of a cleared channel"""
+        if channel_id in self.channels:
+            return self.channels[channel_id]
+        group = self.get_channel_group(channel_id)
+        return group.members[channel_id] if group else None
+
+    def get_ignore_rules_path(self, channel_id: str) -> Optional[str]:
+        """Where ``get_ignore_rules`` is stored in the server document"""
+        if channel_id in self.channels:
+            return f"channels.{channel_id}"
+        group = self.get_channel_group(channel_id)
+        return f"groups.{group.name}.members.{channel_id}" if group else None
+
+    def count_cleared_channels(self) -> int:
+        return len(self.channels) + sum(
+            len(group.members) for group in self.groups.values()
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "server_name": self.server_name or "",
@@ -100,6 +306,7 @@ class Server:
                 channel_id: timer.to_dict()
                 for channel_id, timer in self.channels.items()
             },
+            "groups": {name: group.to_dict() for name, group in self.groups.items()},
             "timezone": self.timezone,
             "language": self.language,
         }
@@ -116,4 +323,6 @@ class Server:
             server.channels[channel_id] = ChannelTimer.from_dict(
                 channel_id, channel_data
             )
+        for name, group_data in data.get("groups", {}).items():
+            server.groups[name] = ChannelGroup.from_dict(name, group_data)
         return server
@@ -0,0 +1,328 @@
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Optional, Dict, Any, FrozenSet, Iterable, List, Sequence, Set, TypeVar
+from enum import Enum
+
+
+class ClearOutcome(Enum):
+    COMPLETED = "completed"
+    SKIPPED = "skipped"
+    IDLE = "idle"
+    FAILED = "failed"
+    TRANSIENT_ERROR = "transient_error"
+    CHANNEL_UNAVAILABLE = "channel_unavailable"
+
+
+@dataclass
+class ClearResult:
+    """Summary of a single channel clear run"""
+
+    channel_id: str
+    guild_id: str
+    outcome: ClearOutcome = ClearOutcome.COMPLETED
+    scanned_count: int = 0
+    deleted_count: int = 0
+    bulk_deleted_count: int = 0
+    single_deleted_count: int = 0
+    # Scanned messages that were ignored and stayed
+    kept_count: int = 0
+    pages_fetched: int = 0
+    api_calls: int = 0
+    bulk_delete_failures: int = 0
+    # Single deletes Discord answered with a 429
+    rate_limited: int = 0
+    # Set when the channel was replaced by a clone instead of cleared
+    recreated_channel_id: Optional[str] = None
+    # Ignored messages the scan should have come across but did not
+    unseen_ignored_ids: List[int] = field(default_factory=list)
+    error_message: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.outcome in (
+            ClearOutcome.COMPLETED,
+            ClearOutcome.SKIPPED,
+            ClearOutcome.IDLE,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "channel_id": self.channel_id,
+            "guild_id": self.guild_id,
+            "outcome": self.outcome.value,
+            "scanned_count": self.scanned_count,
+            "deleted_count": self.deleted_count,
+            "bulk_deleted_count": self.bulk_deleted_count,
+            "single_deleted_count": self.single_deleted_count,
+            "kept_count": self.kept_count,
+            "pages_fetched": self.pages_fetched,
+            "api_calls": self.api_calls,
+            "bulk_delete_failures": self.bulk_delete_failures,
+            "rate_limited": self.rate_limited,
+            "recreated_channel_id": self.recreated_channel_id,
+            "unseen_ignored_ids": [
+                str(message_id) for message_id in self.unseen_ignored_ids
+            ],
+            "error_message": self.error_message,
+        }
+
+
+_Message = TypeVar("_Message")
+
+
+@dataclass(frozen=True)
+class IgnoreFilter:
+    """Everything one clear keeps, compiled once before the history is read
+
+    Ids are ints like those of fetched messages, so each scanned message
+    costs two set lookups and no string building.
+    """
+
+    message_ids: FrozenSet[int] = frozenset()
+    user_ids: FrozenSet[int] = frozenset()
+    # Pinned messages are kept too but still have to be fetched
+    fetch_pinned: bool = False
+
+    def with_pinned_messages(self, message_ids: Iterable[int]) -> "IgnoreFilter":
+        return replace(
+            self,
+            message_ids=self.message_ids | frozenset(message_ids),
+            fetch_pinned=False,
+        )
+
+    def deletable(
+        self, messages: Sequence[_Message], seen_ignored: Optional[Set[int]] = None
+    ) -> List[_Message]:
+        """The messages, anything with ``id`` and ``author_id``, that may go
+
+        Kept message ids found among them are added to ``seen_ignored``.
+        """
+        message_ids = self.message_ids
+        user_ids = self.user_ids
+        deletable = [
+            message
+            for message in messages
+            if message.id not in message_ids and message.author_id not in user_ids
+        ]
+        if seen_ignored is not None and len(deletable) < len(messages):
+            seen_ignored.update(
+                message.id for message in messages if message.id in message_ids
+            )
+        return deletable
+
+    def unseen_message_ids(
+        self,
+        seen_ignored: Set[int],
+        after_id: int = 0,
+        before_id: Optional[int] = None,
+    ) -> List[int]:
+        """Kept message ids in a fully scanned id range that were not found"""
+        return sorted(
+            message_id
+            for message_id in self.message_ids - seen_ignored
+            if message_id > after_id and (before_id is None or message_id < before_id)
+        )
+
+
+@dataclass(frozen=True)
+class ChannelHighWaterMark:
+    """Newest message a channel had when its last successful clear started"""
+
+    last_message_id: int
+    kept: IgnoreFilter
+
+    def covers(
+        self, last_message_id: Optional[int], ignore_filter: IgnoreFilter
+    ) -> bool:
+        """Whether a clear now would find nothing the last one left behind
+
+        Un-ignoring a message or user makes kept messages deletable again, so
+        the mark only holds while everything kept is still ignored.
+        """
+        return (
+            last_message_id is not None
+            and last_message_id <= self.last_message_id
+            and self.kept.message_ids <= ignore_filter.message_ids
+            and self.kept.user_ids <= ignore_filter.user_ids
+        )
+
+
+@dataclass
+class ClearCheckpoint:
+    """Progress of a legacy pass, saved between pages so it can be resumed
+
+    The legacy pass reads history newest first, so everything between the
+    bulk delete cutoff and ``before_id`` has already been handled.
+    """
+
+    channel_id: str
+    guild_id: str
+    before_id: int
+    started_at: datetime
+    updated_at: datetime
+    deleted_count: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "_id": self.channel_id,
+            "guild_id": self.guild_id,
+            "before_id": str(self.before_id),
+            "started_at": self.started_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "deleted_count": self.deleted_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ClearCheckpoint":
+        return cls(
+            channel_id=data["_id"],
+            guild_id=data["guild_id"],
+            before_id=int(data["before_id"]),
+            started_at=datetime.fromisoformat(data["started_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            deleted_count=data.get("deleted_count", 0),
+        )
+
+
+@dataclass
+class ChannelClearProfile:
+    """How recent clears of a channel went, used to tune the next one
+
+    Averages are exponentially weighted so a channel that changes pace is
+    picked up within a few clears.
+    """
+
+    channel_id: str
+    guild_id: str
+    clears: int = 0
+    messages_per_clear: float = 0.0
+    # Part of the messages deleted that was too old for bulk delete
+    legacy_share: float = 0.0
+    last_duration_seconds: float = 0.0
+    rate_limited: int = 0
+    # Nothing older than the bulk delete cutoff was left at this moment
+    legacy_clean_at: Optional[datetime] = None
+
+    SMOOTHING = 0.3
+
+    def _average(self, current: float, sample: float, first: bool) -> float:
+        if first:
+            return sample
+        return current + self.SMOOTHING * (sample - current)
+
+    def record_clear(
+        self, deleted_count: int, duration_seconds: float, rate_limited: int
+    ) -> None:
+        self.clears += 1
+        self.messages_per_clear = self._average(
+            self.messages_per_clear, deleted_count, first=self.clears == 1
+        )
+        self.last_duration_seconds = duration_seconds
+        self.rate_limited = rate_limited
+
+    def record_legacy_pass(self, deleted_count: int, clean_at: datetime) -> None:
+        total = deleted_count + self.messages_per_clear
+        share = deleted_count / total if total else 0.0
+        self.legacy_share = self._average(
+            self.legacy_share, share, first=self.legacy_clean_at is None
+        )
+        self.legacy_clean_at = clean_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "_id": self.channel_id,
+            "guild_id": self.guild_id,
+            "clears": self.clears,
+            "messages_per_clear": round(self.messages_per_clear, 1),
+            "legacy_share": round(self.legacy_share, 3),
+            "last_duration_seconds": round(self.last_duration_seconds, 2),
+        }
+        if self.rate_limited:
+            data["rate_limited"] = self.rate_limited
+        if self.legacy_clean_at:
+            data["legacy_clean_at"] = self.legacy_clean_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChannelClearProfile":
+        legacy_clean_at = data.get("legacy_clean_at")
+        return cls(
+            channel_id=data["_id"],
+            guild_id=data["guild_id"],
+            clears=data.get("clears", 0),
+            messages_per_clear=data.get("messages_per_clear", 0.0),
+            legacy_share=data.get("legacy_share", 0.0),
+            last_duration_seconds=data.get("last_duration_seconds", 0.0),
+            rate_limited=data.get("rate_limited", 0),
+            legacy_clean_at=(
+                datetime.fromisoformat(legacy_clean_at) if legacy_clean_at else None
+            ),
+        )
+
+
+@dataclass
+class ClearRunRecord:
+    """One clear run as written to the clear ledger"""
+
+    channel_id: str
+    guild_id: str
+    started_at: datetime
+    duration_seconds: float
+    outcome: ClearOutcome
+    scanned_count: int = 0
+    bulk_deleted_count: int = 0
+    single_deleted_count: int = 0
+    kept_count: int = 0
+    pages_fetched: int = 0
+    rate_limited: int = 0
+    # A background pass over messages too old for bulk delete
+    legacy: bool = False
+
+    # Counters left out of the document while zero
+    COUNTERS = (
+        "scanned_count",
+        "bulk_deleted_count",
+        "single_deleted_count",
+        "kept_count",
+        "pages_fetched",
+        "rate_limited",
+    )
+
+    @classmethod
+    def from_result(
+        cls,
+        result: ClearResult,
+        started_at: datetime,
+        duration_seconds: float,
+        legacy: bool = False,
+    ) -> "ClearRunRecord":
+        return cls(
+            channel_id=result.channel_id,
+            guild_id=result.guild_id,
+            started_at=started_at,
+            duration_seconds=duration_seconds,
+            outcome=result.outcome,
+            scanned_count=result.scanned_count,
+            bulk_deleted_count=result.bulk_deleted_count,
+            single_deleted_count=result.single_deleted_count,
+            kept_count=result.kept_count,
+            pages_fetched=result.pages_fetched,
+            rate_limited=result.rate_limited,
+            legacy=legacy,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Time-series document, ``started_at`` stays a datetime for Mongo"""
+        data: Dict[str, Any] = {
+            "started_at": self.started_at,
+            "channel": {"guild_id": self.guild_id, "channel_id": self.channel_id},
+            "duration_seconds": round(self.duration_seconds, 3),
+            "outcome": self.outcome.value,
+        }
+        for counter in self.COUNTERS:
+            value = getattr(self, counter)
+            if value:
+                data[counter] = value
+        if self.legacy:
+            data["legacy"] = True
+        return data
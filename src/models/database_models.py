@@ -10,6 +10,9 @@ class CollectionName(Enum):
     REMOVED_SERVERS = "removed_servers"
     ERRORS = "errors"
     CONFIG = "config"
+    CLEAR_CHECKPOINTS = "clear_checkpoints"
+    CHANNEL_PROFILES = "channel_profiles"
+    CLEAR_LEDGER = "clear_ledger"
 
 
 @dataclass
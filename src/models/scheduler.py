@@ -1,8 +1,13 @@
+import math
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Deque, Union
 from enum import Enum
 
+from .channel_subscription import ChannelGroup, ChannelTimer
+from .clearing import ClearOutcome
+
 
 class TaskStatus(Enum):
     PENDING = "pending"
@@ -12,6 +17,25 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class PauseReason(Enum):
+    GUILD_UNAVAILABLE = "guild_unavailable"
+    MISSING_PERMISSIONS = "missing_permissions"
+    FORBIDDEN = "forbidden"
+
+
+class HealthMode(Enum):
+    """How far the scheduler backs off from Discord, mildest first"""
+
+    NORMAL = "normal"
+    SLOWED = "slowed"
+    DEFERRING = "deferring"
+    SHEDDING = "shedding"
+
+    @property
+    def level(self) -> int:
+        return list(HealthMode).index(self)
+
+
 @dataclass
 class ScheduledTask:
     task_id: str
@@ -107,14 +131,114 @@ class ScheduledTask:
         )
 
 
+@dataclass
+class RollingHistogram:
+    """Bounded window of recent samples with percentile summaries"""
+
+    max_samples: int = 1000
+    samples: Deque[float] = field(default_factory=deque)
+    total_count: int = 0
+
+    def __post_init__(self):
+        self.samples = deque(self.samples, maxlen=self.max_samples)
+
+    def record(self, value: float) -> None:
+        self.samples.append(value)
+        self.total_count += 1
+
+    def percentile(self, percent: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        # Nearest-rank percentile
+        rank = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+        return ordered[min(rank, len(ordered) - 1)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.total_count,
+            "window": len(self.samples),
+            "p50": round(self.percentile(50), 3),
+            "p95": round(self.percentile(95), 3),
+            "p99": round(self.percentile(99), 3),
+            "max": round(max(self.samples), 3) if self.samples else 0.0,
+        }
+
+
+@dataclass
+class ClearExecutionRecord:
+    """Outcome of a single scheduled clear run"""
+
+    job_id: str
+    channel_id: str
+    guild_id: str
+    scheduled_time: datetime
+    started_at: datetime
+    duration_seconds: float
+    deleted_count: int = 0
+    api_calls: int = 0
+    status: TaskStatus = TaskStatus.COMPLETED
+    outcome: str = "completed"
+
+    @property
+    def lateness_seconds(self) -> float:
+        return max((self.started_at - self.scheduled_time).total_seconds(), 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "channel_id": self.channel_id,
+            "guild_id": self.guild_id,
+            "scheduled_time": self.scheduled_time.isoformat(),
+            "started_at": self.started_at.isoformat(),
+            "lateness_seconds": round(self.lateness_seconds, 3),
+            "duration_seconds": round(self.duration_seconds, 3),
+            "deleted_count": self.deleted_count,
+            "api_calls": self.api_calls,
+            "status": self.status.value,
+            "outcome": self.outcome,
+        }
+
+
 @dataclass
 class SchedulerStats:
     total_tasks_scheduled: int = 0
     total_tasks_completed: int = 0
     total_tasks_failed: int = 0
     total_tasks_cancelled: int = 0
+    total_runs_skipped: int = 0
+    total_runs_idle: int = 0
+    total_clears_joined: int = 0
+    total_clears_followed_up: int = 0
+    total_messages_deleted: int = 0
+    total_api_calls: int = 0
+    total_retries_scheduled: int = 0
+    total_retries_succeeded: int = 0
+    total_retries_exhausted: int = 0
+    total_runs_deferred: int = 0
     average_execution_time_seconds: float = 0.0
     current_queue_size: int = 0
+    pending_retries: int = 0
+    lateness_seconds: RollingHistogram = field(default_factory=RollingHistogram)
+    duration_seconds: RollingHistogram = field(default_factory=RollingHistogram)
+
+    def record_execution(self, record: ClearExecutionRecord) -> None:
+        if record.status == TaskStatus.FAILED:
+            self.total_tasks_failed += 1
+        else:
+            self.total_tasks_completed += 1
+
+        executed = self.total_tasks_completed + self.total_tasks_failed
+        self.average_execution_time_seconds += (
+            record.duration_seconds - self.average_execution_time_seconds
+        ) / executed
+
+        if record.outcome == ClearOutcome.IDLE.value:
+            self.total_runs_idle += 1
+        self.total_messages_deleted += record.deleted_count
+        self.total_api_calls += record.api_calls
+        self.lateness_seconds.record(record.lateness_seconds)
+        self.duration_seconds.record(record.duration_seconds)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -122,9 +246,22 @@ class SchedulerStats:
             "total_tasks_completed": self.total_tasks_completed,
             "total_tasks_failed": self.total_tasks_failed,
             "total_tasks_cancelled": self.total_tasks_cancelled,
+            "total_runs_skipped": self.total_runs_skipped,
+            "total_runs_idle": self.total_runs_idle,
+            "total_clears_joined": self.total_clears_joined,
+            "total_clears_followed_up": self.total_clears_followed_up,
+            "total_messages_deleted": self.total_messages_deleted,
+            "total_api_calls": self.total_api_calls,
+            "total_retries_scheduled": self.total_retries_scheduled,
+            "total_retries_succeeded": self.total_retries_succeeded,
+            "total_retries_exhausted": self.total_retries_exhausted,
+            "total_runs_deferred": self.total_runs_deferred,
             "average_execution_time_seconds": self.average_execution_time_seconds,
             "current_queue_size": self.current_queue_size,
-            "success_rate": f"{(self.total_tasks_completed / max(self.total_tasks_scheduled, 1)) * 100:.2f}%",
+            "pending_retries": self.pending_retries,
+            "lateness_seconds": self.lateness_seconds.to_dict(),
+            "duration_seconds": self.duration_seconds.to_dict(),
+            "success_rate": f"{(self.total_tasks_completed / max(self.total_tasks_completed + self.total_tasks_failed, 1)) * 100:.2f}%",
         }
 
     @classmethod
@@ -134,8 +271,55 @@ class SchedulerStats:
             total_tasks_completed=data.get("total_tasks_completed", 0),
             total_tasks_failed=data.get("total_tasks_failed", 0),
             total_tasks_cancelled=data.get("total_tasks_cancelled", 0),
+            total_runs_skipped=data.get("total_runs_skipped", 0),
+            total_runs_idle=data.get("total_runs_idle", 0),
+            total_clears_joined=data.get("total_clears_joined", 0),
+            total_clears_followed_up=data.get("total_clears_followed_up", 0),
+            total_messages_deleted=data.get("total_messages_deleted", 0),
+            total_api_calls=data.get("total_api_calls", 0),
+            total_retries_scheduled=data.get("total_retries_scheduled", 0),
+            total_retries_succeeded=data.get("total_retries_succeeded", 0),
+            total_retries_exhausted=data.get("total_retries_exhausted", 0),
+            total_runs_deferred=data.get("total_runs_deferred", 0),
             average_execution_time_seconds=data.get(
                 "average_execution_time_seconds", 0.0
             ),
             current_queue_size=data.get("current_queue_size", 0),
+            pending_retries=data.get("pending_retries", 0),
         )
+
+
+@dataclass
+class PausedJob:
+    """A clear job held back while its guild or permissions are gone"""
+
+    reason: PauseReason
+    paused_at: datetime
+    # Next run the job had when paused, a catch-up run follows if it passed
+    next_run_time: Optional[datetime] = None
+
+
+@dataclass
+class RescheduledJob:
+    """A fixed-time job moved onto a rebuilt trigger after a timezone change"""
+
+    job_id: str
+    server_id: str
+    # Where the schedule lives in the server document, "channels.<id>" or "groups.<name>"
+    schedule_path: str
+    schedule: Union[ChannelTimer, ChannelGroup]
+    # First fire of the rebuilt trigger, a pending skip may hold the job longer
+    anchor_time: datetime
+    # Set for channel jobs, group jobs have no timer view message
+    channel_id: Optional[str] = None
+
+
+@dataclass
+class HealthModeChange:
+    """A step of the shard between health modes"""
+
+    previous: HealthMode
+    mode: HealthMode
+    changed_at: datetime
+    # Share of the window's responses that were 5xx or 429 at the time
+    error_rate: float
@@ -1,14 +1,60 @@
+import asyncio
+import random
+import time
 import pytz
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Dict, Any, TYPE_CHECKING
+from typing import (
+    Optional,
+    Awaitable,
+    Callable,
+    Dict,
+    Any,
+    Deque,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 import discord
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.job import Job
+from apscheduler.events import (
+    EVENT_JOB_ADDED,
+    EVENT_JOB_REMOVED,
+    EVENT_JOB_SUBMITTED,
+    EVENT_JOB_MAX_INSTANCES,
+    JobEvent,
+    JobSubmissionEvent,
+)
 
-from src.models import ChannelTimer, ScheduledTask, SchedulerStats
+from src.models import (
+    ChannelGroup,
+    ChannelTimer,
+    ScheduledTask,
+    SchedulerStats,
+    RollingHistogram,
+    ClearExecutionRecord,
+    ClearOutcome,
+    ClearResult,
+    HealthMode,
+    PausedJob,
+    PauseReason,
+    RescheduledJob,
+    Server,
+    TaskStatus,
+)
 from src.services.server_data_service import DataService
-from src.utils.schedule_parser import ScheduleExpressionParser
+from src.utils.schedule_parser import ScheduleExpressionParser, ScheduleParseError
+from src.utils.schedule_table import ScheduleTable
+from src.utils.shard_health import ShardHealthMonitor
 from src.utils.logger import logger, LogArea
 from src.config import get_global_config
 
@@ -17,15 +63,83 @@ if TYPE_CHECKING:
 
 
 class SchedulerService:
-    def __init__(self, data_service: DataService):
+    def __init__(
+        self,
+        data_service: DataService,
+        clock: Optional[Callable[[], datetime]] = None,
+        sleep: Optional[Callable[[float], Awaitable[None]]] = None,
+    ):
         self.data_service = data_service
         self.scheduler = AsyncIOScheduler()
+        self._clock = clock or (lambda: datetime.now(pytz.UTC))
+        self._sleep = sleep or asyncio.sleep
         self.schedule_parser = ScheduleExpressionParser(
-            data_service.get_timezone, data_service.get_timezone_for_server
+            data_service.get_timezone,
+            data_service.get_timezone_for_server,
+            clock=self._clock,
         )
         self._clear_callback: Optional[Callable] = None
         self._notify_callback: Optional[Callable] = None
-        self._stats = SchedulerStats()
+        self._prestage_callback: Optional[Callable] = None
+
+        config = get_global_config()
+        self._stats = SchedulerStats(
+            lateness_seconds=RollingHistogram(
+                max_samples=config.scheduler_histogram_samples
+            ),
+            duration_seconds=RollingHistogram(
+                max_samples=config.scheduler_histogram_samples
+            ),
+        )
+        self._history_size = config.scheduler_history_size
+        self._retry_max_attempts = config.clear_retry_max_attempts
+        self._retry_base_delay = config.clear_retry_base_delay
+        self._retry_max_delay = config.clear_retry_max_delay
+        self._retry_min_spacing = timedelta(seconds=config.clear_retry_min_spacing)
+        self._prestage_lead = timedelta(seconds=config.clear_prestage_lead_time)
+        self._next_retry_slot = self._clock()
+        self._tasks: Dict[str, ScheduledTask] = {}
+        self._submitted_run_times: Dict[str, datetime] = {}
+        self._execution_history: Dict[str, Deque[ClearExecutionRecord]] = {}
+        self._heartbeat_key: Optional[str] = None
+        self._heartbeat_interval = config.scheduler_heartbeat_interval
+        self._group_concurrency = config.group_clear_concurrency
+        self._group_jobs: Set[str] = set()
+        # Channel job id of each channel a group job cleared, to its group job id
+        self._group_members: Dict[str, str] = {}
+        # Jobs on a fixed-time trigger per server, to their schedule's path in
+        # the server document; only these move when a timezone changes
+        self._timezone_jobs: Dict[str, Dict[str, str]] = {}
+        # Jobs held back until their guild or permissions come back
+        self._paused_jobs: Dict[str, PausedJob] = {}
+
+        self.health = ShardHealthMonitor(
+            window_seconds=config.shard_health_window,
+            min_requests=config.shard_health_min_requests,
+            slow_rate=config.shard_health_slow_rate,
+            defer_rate=config.shard_health_defer_rate,
+            shed_rate=config.shard_health_shed_rate,
+            recovery_interval=config.shard_health_recovery_interval,
+            clock=self._clock,
+            on_mode_change=self._on_health_mode_change,
+        )
+        self._health_check_interval = config.shard_health_check_interval
+        self._dispatch_interval = timedelta(
+            seconds=config.shard_health_dispatch_interval
+        )
+        self._next_dispatch_slot = self._clock()
+        # Work held back by the shard's health, to the mode it waits out
+        self._deferred_work: Dict[
+            str, Tuple[HealthMode, Callable[[], Awaitable[None]]]
+        ] = {}
+        self._deferred_worker: Optional[asyncio.Task] = None
+
+        self.scheduler.add_listener(
+            self._on_job_submitted, EVENT_JOB_SUBMITTED | EVENT_JOB_MAX_INSTANCES
+        )
+        self.scheduler.add_listener(
+            self._on_job_changed, EVENT_JOB_ADDED | EVENT_JOB_REMOVED
+        )
 
     def register_channel_clear_callback(self, callback: Callable) -> None:
         self._clear_callback = callback
@@ -33,6 +147,9 @@ class SchedulerService:
     def register_missed_clear_notification_callback(self, callback: Callable) -> None:
         self._notify_callback = callback
 
+    def register_prestage_callback(self, callback: Callable) -> None:
+        self._prestage_callback = callback
+
     async def _perform_periodic_cache_cleanup(self) -> None:
         cache = self.data_service._cache
 
@@ -52,25 +169,132 @@ class SchedulerService:
             self.scheduler.start()
 
     async def shutdown(self) -> None:
+        if self._deferred_worker is not None and not self._deferred_worker.done():
+            self._deferred_worker.cancel()
         if self.scheduler.running:
             self.scheduler.shutdown(wait=True)
+            await self._write_heartbeat()
 
-    async def initialize_all_scheduled_jobs(self, bot) -> None:
+    async def _write_heartbeat(self) -> None:
+        if self._heartbeat_key is None:
+            return
+
+        try:
+            await self.data_service.save_scheduler_heartbeat(
+                self._heartbeat_key, self._clock()
+            )
+        except Exception as e:
+            logger.warning(LogArea.SCHEDULER, f"Failed to write scheduler heartbeat: {e}")
+
+    async def initialize_all_scheduled_jobs(self, bot: "ClearTimerBot") -> None:
         servers = await self.data_service.get_all_servers()
 
+        # Runs are only reported as missed if they fell after the last moment
+        # this shard's scheduler was known to be alive
+        self._heartbeat_key = f"shard_{bot.shard_id or 0}"
+        last_seen = await self.data_service.get_scheduler_heartbeat(
+            self._heartbeat_key
+        )
+
         current_guild_ids = {str(guild.id) for guild in bot.guilds}
 
+        restorable = []
+        restorable_groups = []
         for server_id, server in servers.items():
             if server_id not in current_guild_ids:
                 continue
 
+            for name, group in server.groups.items():
+                job_id = self._create_group_job_identifier(server_id, name)
+                self._stats.total_tasks_scheduled += 1
+
+                try:
+                    trigger, _ = self.schedule_parser.parse_schedule_expression(
+                        group.timer, server_id
+                    )
+                except Exception as e:
+                    logger.error(
+                        LogArea.SCHEDULER, f"Error parsing timer for job {job_id}: {e}"
+                    )
+                    continue
+
+                restorable_groups.append(
+                    (job_id, group, trigger, bot.get_guild(int(server_id)))
+                )
+
             for channel_id, channel_timer in server.channels.items():
-                await self._create_scheduled_clear_job(
-                    bot=bot,
-                    server_id=server_id,
-                    channel_id=channel_id,
-                    channel_timer=channel_timer,
+                job_id = self._create_job_identifier(server_id, channel_id)
+                self._stats.total_tasks_scheduled += 1
+
+                try:
+                    trigger, _ = self.schedule_parser.parse_schedule_expression(
+                        channel_timer.timer, server_id
+                    )
+                except Exception as e:
+                    logger.error(
+                        LogArea.SCHEDULER, f"Error parsing timer for job {job_id}: {e}"
+                    )
+                    continue
+
+                channel = bot.get_channel(int(channel_id))
+                if not channel:
+                    logger.warning(
+                        LogArea.SCHEDULER,
+                        f"Channel {channel_id} not found for job {job_id}",
+                    )
+                    continue
+
+                restorable.append((job_id, channel_timer, trigger, channel))
+
+        # Work out every next run and missed run count in one pass
+        now = self._clock()
+        table = ScheduleTable.from_triggers(
+            (
+                job_id,
+                trigger,
+                self._missed_run_reference(trigger, schedule, last_seen),
+            )
+            for job_id, schedule, trigger, _ in restorable + restorable_groups
+        )
+        fire_times = table.as_datetimes(now)
+
+        for job_id, channel_timer, trigger, channel in restorable:
+            next_run_time, runs_missed = fire_times[job_id]
+            if channel_timer.skip_until and channel_timer.skip_until > now:
+                next_run_time, runs_missed = channel_timer.skip_until, 0
+            if next_run_time is None:
+                logger.warning(
+                    LogArea.SCHEDULER, f"Job {job_id} has no future run, not restored"
                 )
+                continue
+            await self._create_scheduled_clear_job(
+                job_id, channel_timer, trigger, channel, next_run_time, runs_missed
+            )
+
+        for job_id, group, trigger, guild in restorable_groups:
+            next_run_time, runs_missed = fire_times[job_id]
+            if group.skip_until and group.skip_until > now:
+                next_run_time, runs_missed = group.skip_until, 0
+            if next_run_time is None:
+                logger.warning(
+                    LogArea.SCHEDULER, f"Job {job_id} has no future run, not restored"
+                )
+                continue
+            if runs_missed > 0:
+                logger.info(
+                    LogArea.SCHEDULER,
+                    f"Job {job_id} missed {runs_missed} runs while offline",
+                )
+            self._add_group_job(job_id, group.name, trigger, guild, next_run_time)
+
+        await self._write_heartbeat()
+        self.scheduler.add_job(
+            self._write_heartbeat,
+            "interval",
+            seconds=self._heartbeat_interval,
+            id="scheduler_heartbeat",
+            replace_existing=True,
+        )
 
         self.scheduler.add_job(
             self.data_service.cleanup_old_removed_servers,
@@ -90,180 +314,932 @@ class SchedulerService:
             replace_existing=True,
         )
 
+        # Recovery is only noticed when the mode is checked, which a shard
+        # holding back its clears otherwise rarely does
+        self.scheduler.add_job(
+            self._check_shard_health,
+            "interval",
+            seconds=self._health_check_interval,
+            id="shard_health",
+            replace_existing=True,
+        )
+
+    @staticmethod
+    def _missed_run_reference(
+        trigger: BaseTrigger,
+        channel_timer: Union[ChannelTimer, ChannelGroup],
+        last_seen: Optional[datetime],
+    ) -> datetime:
+        """Anchor for the schedule table so it only counts runs missed after ``last_seen``
+
+        Without a heartbeat the stored anchor is treated as the first run that
+        could have been missed. A skipped run is never reported as missed.
+        """
+        anchor = channel_timer.anchor_time
+        just_before = timedelta(microseconds=1)
+        since = last_seen or anchor - just_before
+        if channel_timer.skip_until:
+            since = max(since, channel_timer.skip_until - just_before)
+
+        if isinstance(trigger, IntervalTrigger):
+            # Last run on the anchor's grid at or before ``since``
+            interval = trigger.interval
+            runs = (since - anchor) // interval
+            return anchor + interval * max(runs, -1)
+
+        return max(since, anchor - just_before)
+
     async def _create_scheduled_clear_job(
         self,
-        bot: "ClearTimerBot",
-        server_id: str,
-        channel_id: str,
+        job_id: str,
         channel_timer: ChannelTimer,
+        trigger: BaseTrigger,
+        channel: discord.TextChannel,
+        next_run_time: datetime,
+        runs_missed: int,
     ) -> None:
-        job_id = self._create_job_identifier(server_id, channel_id)
-
-        self._stats.total_tasks_scheduled += 1
-
-        try:
-            trigger, _ = self.schedule_parser.parse_schedule_expression(
-                channel_timer.timer, server_id
-            )
-        except Exception as e:
-            logger.error(
-                LogArea.SCHEDULER, f"Error parsing timer for job {job_id}: {e}"
+        if runs_missed > 0:
+            logger.info(
+                LogArea.SCHEDULER,
+                f"Job {job_id} missed {runs_missed} runs while offline",
             )
-            return
-
-        channel = bot.get_channel(int(channel_id))
-        if not channel:
-            logger.warning(
-                LogArea.SCHEDULER, f"Channel {channel_id} not found for job {job_id}"
-            )
-            return
-
-        # Calculate the proper next run time based on the interval
-        now = datetime.now(pytz.UTC)
-        stored_next_run = channel_timer.next_run_time
+            if self._notify_callback:
+                await self.run_or_defer(
+                    f"{job_id}_notify",
+                    lambda: self._notify_callback(channel, job_id),
+                )
 
-        # Check if this is an interval trigger
-        from apscheduler.triggers.interval import IntervalTrigger
+        self._track_task(
+            job_id, str(channel.guild.id), channel_timer.channel_id, next_run_time
+        )
 
-        if isinstance(trigger, IntervalTrigger):
-            # For interval triggers, calculate based on when it should have run
-            if stored_next_run < now:
-                # Calculate how many intervals have passed
-                interval_seconds = trigger.interval.total_seconds()
-                time_passed = (now - stored_next_run).total_seconds()
-                intervals_missed = int(time_passed // interval_seconds)
-
-                # Calculate the next run time that maintains the original schedule
-                actual_next_run = stored_next_run + timedelta(
-                    seconds=interval_seconds * (intervals_missed + 1)
-                )
+        self.scheduler.add_job(
+            self._run_scheduled_clear,
+            trigger,
+            args=[channel],
+            id=job_id,
+            next_run_time=next_run_time,
+            replace_existing=True,
+        )
+        self._schedule_prestage(job_id, channel)
 
-                # If we missed runs, notify and update
-                if intervals_missed > 0:
-                    logger.info(
-                        LogArea.SCHEDULER,
-                        f"Job {job_id} missed {intervals_missed} runs while offline",
-                    )
-                    if self._notify_callback:
-                        await self._notify_callback(channel, job_id)
-
-                    # Update the stored next run time
-                    server = await self.data_service.get_server(server_id)
-                    if server and channel_id in server.channels:
-                        server.channels[channel_id].next_run_time = actual_next_run
-                        await self.data_service.save_servers()
-            else:
-                # Timer hasn't expired yet, use the stored time
-                actual_next_run = stored_next_run
-        else:
-            # For cron triggers, use the stored next run time or recalculate if missed
-            if stored_next_run < now:
-                await self._reschedule_missed_clear_job(
-                    bot, server_id, channel_id, channel_timer
-                )
-                return
-            actual_next_run = stored_next_run
+    def create_channel_clear_job(
+        self,
+        channel_id: str,
+        server_id: str,
+        trigger: BaseTrigger,
+        channel: discord.TextChannel,
+        next_run_time: Optional[datetime] = None,
+    ) -> str:
+        job_id = self._create_job_identifier(server_id, channel_id)
 
-        task = ScheduledTask(
-            task_id=job_id,
-            name=f"clear_{channel_id}",
-            channel_id=channel_id,
-            guild_id=server_id,
-            scheduled_time=actual_next_run,
+        self._stats.total_tasks_scheduled += 1
+        # A new schedule replaces a paused one, it starts out running
+        self._paused_jobs.pop(job_id, None)
+        self._track_task(
+            job_id, server_id, channel_id, next_run_time or self._clock()
         )
 
         self.scheduler.add_job(
-            self._clear_callback,
+            self._run_scheduled_clear,
             trigger,
             args=[channel],
             id=job_id,
-            next_run_time=actual_next_run,
+            next_run_time=next_run_time,
             replace_existing=True,
         )
+        self._schedule_prestage(job_id, channel)
+
+        return job_id
 
-    async def _reschedule_missed_clear_job(
+    def create_channel_clear_jobs(
         self,
-        bot: "ClearTimerBot",
         server_id: str,
-        channel_id: str,
-        channel_timer: ChannelTimer,
-    ) -> None:
-        job_id = self._create_job_identifier(server_id, channel_id)
+        trigger: BaseTrigger,
+        channels: List[discord.TextChannel],
+        next_run_time: Optional[datetime] = None,
+    ) -> List[str]:
+        """Schedule several channels on the same trigger with one scheduler wakeup"""
+        with self._batched_job_changes():
+            return [
+                self.create_channel_clear_job(
+                    str(channel.id), server_id, trigger, channel, next_run_time
+                )
+                for channel in channels
+            ]
 
-        try:
-            trigger, next_run_time = self.schedule_parser.parse_schedule_expression(
-                channel_timer.timer, server_id
+    def remove_channel_clear_jobs(self, server_id: str, channel_ids: List[str]) -> int:
+        with self._batched_job_changes():
+            return sum(
+                self.remove_channel_clear_job(server_id, channel_id)
+                for channel_id in channel_ids
             )
-        except Exception as e:
-            logger.error(
-                LogArea.SCHEDULER, f"Error parsing timer for missed job {job_id}: {e}"
-            )
-            return
 
-        server = await self.data_service.get_server(server_id)
-        if server and channel_id in server.channels:
-            server.channels[channel_id].next_run_time = next_run_time
-            await self.data_service.save_servers()
-
-        channel = bot.get_channel(int(channel_id))
-        if channel and self._notify_callback:
-            await self._notify_callback(channel, job_id)
-
-        if channel:
-            task = ScheduledTask(
-                task_id=job_id,
-                name=f"clear_{channel_id}",
-                channel_id=channel_id,
-                guild_id=server_id,
-                scheduled_time=next_run_time,
-            )
+    @contextmanager
+    def _batched_job_changes(self) -> Iterator[None]:
+        """Hold the scheduler's wakeups until all job changes are in
 
-            self.scheduler.add_job(
-                self._clear_callback,
-                trigger,
-                args=[channel],
-                id=job_id,
-                next_run_time=next_run_time,
-                replace_existing=True,
-            )
+        Every added job otherwise reschedules the scheduler's timer on its own.
+        """
+        if self.scheduler.state != STATE_RUNNING:
+            yield
+            return
 
-    def create_channel_clear_job(
+        self.scheduler.pause()
+        try:
+            yield
+        finally:
+            self.scheduler.resume()
+
+    def create_group_clear_job(
         self,
-        channel_id: str,
         server_id: str,
+        name: str,
         trigger: BaseTrigger,
-        channel: discord.TextChannel,
+        guild: discord.Guild,
         next_run_time: Optional[datetime] = None,
     ) -> str:
-        job_id = self._create_job_identifier(server_id, channel_id)
+        job_id = self._create_group_job_identifier(server_id, name)
+        self._stats.total_tasks_scheduled += 1
+        self._add_group_job(job_id, name, trigger, guild, next_run_time)
+        return job_id
 
+    def _add_group_job(
+        self,
+        job_id: str,
+        name: str,
+        trigger: BaseTrigger,
+        guild: discord.Guild,
+        next_run_time: Optional[datetime],
+    ) -> None:
+        self._group_jobs.add(job_id)
+        self._paused_jobs.pop(job_id, None)
         self.scheduler.add_job(
-            self._clear_callback,
+            self._run_scheduled_group_clear,
             trigger,
-            args=[channel],
+            args=[guild, name],
             id=job_id,
             next_run_time=next_run_time,
             replace_existing=True,
         )
 
-        return job_id
+    def remove_group_clear_job(self, server_id: str, name: str) -> bool:
+        job_id = self._create_group_job_identifier(server_id, name)
+        self._group_jobs.discard(job_id)
+        self._submitted_run_times.pop(job_id, None)
+        self._paused_jobs.pop(job_id, None)
+        self._deferred_work.pop(job_id, None)
+        for member_job_id, group_job_id in list(self._group_members.items()):
+            if group_job_id == job_id:
+                del self._group_members[member_job_id]
+                self._forget_task(member_job_id)
+
+        try:
+            self.scheduler.remove_job(job_id)
+            return True
+        except Exception:
+            return False
+
+    def forget_group_member(self, server_id: str, channel_id: str) -> None:
+        """Drop what is tracked for a channel that left its group"""
+        job_id = self._create_job_identifier(server_id, channel_id)
+        if self._group_members.pop(job_id, None) is not None:
+            self._forget_task(job_id)
 
     def remove_channel_clear_job(self, server_id: str, channel_id: str) -> bool:
         job_id = self._create_job_identifier(server_id, channel_id)
 
         try:
             self.scheduler.remove_job(job_id)
+            self._forget_task(job_id)
             return True
         except Exception:
             return False
 
+    def move_channel_clear_job(
+        self, server_id: str, old_channel_id: str, new_channel: discord.TextChannel
+    ) -> Optional[str]:
+        """Hand a channel's job to a replacement channel, keeping its schedule
+
+        The task and execution history follow the job, so statistics and the
+        next run time carry over as if the channel had not changed.
+        """
+        old_job_id = self._create_job_identifier(server_id, old_channel_id)
+        job = self.scheduler.get_job(old_job_id)
+        if job is None:
+            return None
+
+        new_channel_id = str(new_channel.id)
+        new_job_id = self._create_job_identifier(server_id, new_channel_id)
+        self._cancel_pending_retry(old_job_id)
+        self._cancel_prestage(old_job_id)
+
+        task = self._tasks.pop(old_job_id, None)
+        if task is not None:
+            task.task_id = new_job_id
+            task.name = f"clear_{new_channel_id}"
+            task.channel_id = new_channel_id
+            self._tasks[new_job_id] = task
+        history = self._execution_history.pop(old_job_id, None)
+        if history is not None:
+            self._execution_history[new_job_id] = history
+        submitted_run_time = self._submitted_run_times.pop(old_job_id, None)
+        if submitted_run_time is not None:
+            self._submitted_run_times[new_job_id] = submitted_run_time
+        # A paused job has no next run time and stays paused under the new id
+        paused = self._paused_jobs.pop(old_job_id, None)
+        if paused is not None:
+            self._paused_jobs[new_job_id] = paused
+
+        self.scheduler.add_job(
+            self._run_scheduled_clear,
+            job.trigger,
+            args=[new_channel],
+            id=new_job_id,
+            next_run_time=job.next_run_time,
+            replace_existing=True,
+        )
+        self.scheduler.remove_job(old_job_id)
+        self._schedule_prestage(new_job_id, new_channel)
+        return new_job_id
+
+    def pause_job(self, job_id: str, reason: PauseReason) -> bool:
+        """Hold a clear job back, keeping its trigger for when it resumes
+
+        A job that is already paused keeps its first reason, so each reason
+        is only lifted by the event that matches it.
+        """
+        job = self.scheduler.get_job(job_id)
+        if job is None or job_id in self._paused_jobs:
+            return False
+
+        self._paused_jobs[job_id] = PausedJob(
+            reason=reason, paused_at=self._clock(), next_run_time=job.next_run_time
+        )
+        self.scheduler.pause_job(job_id)
+        self._cancel_pending_retry(job_id)
+        self._cancel_prestage(job_id)
+        logger.info(LogArea.SCHEDULER, f"Paused job {job_id}: {reason.value}")
+        return True
+
+    def resume_job(self, job_id: str) -> bool:
+        """Let a paused job run again, at once if it missed a run meanwhile"""
+        paused = self._paused_jobs.pop(job_id, None)
+        job = self.scheduler.get_job(job_id)
+        if paused is None or job is None:
+            return False
+
+        now = self._clock()
+        if paused.next_run_time is None:
+            self.scheduler.resume_job(job_id)
+        else:
+            # A run that passed is caught up now, later ones follow the trigger
+            self.scheduler.modify_job(
+                job_id, next_run_time=max(paused.next_run_time, now)
+            )
+        if job_id in self._tasks:
+            self._schedule_prestage(job_id, job.args[0])
+
+        caught_up = paused.next_run_time is not None and paused.next_run_time <= now
+        logger.info(
+            LogArea.SCHEDULER,
+            f"Resumed job {job_id} after {paused.reason.value}"
+            + (", catching up the missed run" if caught_up else ""),
+        )
+        return True
+
+    def pause_channel_job(
+        self, server_id: str, channel_id: str, reason: PauseReason
+    ) -> bool:
+        return self.pause_job(self._create_job_identifier(server_id, channel_id), reason)
+
+    def resume_channel_job(self, server_id: str, channel_id: str) -> bool:
+        return self.resume_job(self._create_job_identifier(server_id, channel_id))
+
+    def get_channel_pause(self, server_id: str, channel_id: str) -> Optional[PausedJob]:
+        return self._paused_jobs.get(self._create_job_identifier(server_id, channel_id))
+
+    def pause_guild_jobs(self, server_id: str, reason: PauseReason) -> int:
+        """Pause the channel and group jobs of a guild"""
+        job_ids = [
+            job_id for job_id, task in self._tasks.items() if task.guild_id == server_id
+        ]
+        job_ids.extend(
+            job_id
+            for job_id in self._group_jobs
+            if job_id.startswith(f"{server_id}_group_")
+        )
+        with self._batched_job_changes():
+            paused_count = sum(self.pause_job(job_id, reason) for job_id in job_ids)
+
+        if paused_count:
+            logger.info(
+                LogArea.SCHEDULER,
+                f"Paused {paused_count} jobs of server {server_id}: {reason.value}",
+            )
+        return paused_count
+
+    def resume_guild_jobs(self, server_id: str, reason: PauseReason) -> int:
+        """Resume the jobs of a guild that were paused for the given reason"""
+        job_ids = [
+            job_id
+            for job_id, paused in self._paused_jobs.items()
+            if paused.reason == reason and job_id.startswith(f"{server_id}_")
+        ]
+        with self._batched_job_changes():
+            return sum(self.resume_job(job_id) for job_id in job_ids)
+
     async def cancel_job_by_id(self, job_id: str) -> bool:
         try:
             self.scheduler.remove_job(job_id)
+            self._forget_task(job_id)
             return True
         except Exception:
             return False
 
+    def _track_task(
+        self,
+        job_id: str,
+        server_id: str,
+        channel_id: str,
+        scheduled_time: datetime,
+    ) -> ScheduledTask:
+        task = ScheduledTask(
+            task_id=job_id,
+            name=f"clear_{channel_id}",
+            channel_id=channel_id,
+            guild_id=server_id,
+            scheduled_time=scheduled_time,
+            max_retries=self._retry_max_attempts,
+        )
+        self._tasks[job_id] = task
+        return task
+
+    def _forget_task(self, job_id: str) -> None:
+        if self._tasks.pop(job_id, None) is not None:
+            self._stats.total_tasks_cancelled += 1
+        self._submitted_run_times.pop(job_id, None)
+        self._execution_history.pop(job_id, None)
+        self._paused_jobs.pop(job_id, None)
+        self._deferred_work.pop(job_id, None)
+        self._cancel_pending_retry(job_id)
+        self._cancel_prestage(job_id)
+
+    def _on_job_submitted(self, event: JobSubmissionEvent) -> None:
+        """Remember when APScheduler intended a clear job to run"""
+        job_id = event.job_id.removesuffix("_retry")
+        if job_id not in self._tasks and job_id not in self._group_jobs:
+            return
+
+        if event.code == EVENT_JOB_MAX_INSTANCES:
+            # Previous run of the same channel is still going
+            self._stats.total_runs_skipped += 1
+            logger.warning(
+                LogArea.SCHEDULER,
+                f"Skipped run of job {event.job_id}: previous clear still running",
+            )
+            return
+
+        if event.scheduled_run_times:
+            self._submitted_run_times[event.job_id] = event.scheduled_run_times[-1]
+
+    def _on_job_changed(self, event: JobEvent) -> None:
+        """Keep the index of timezone dependent jobs in step with the job store"""
+        server_id = event.job_id.split("_", 1)[0]
+        server_jobs = self._timezone_jobs.setdefault(server_id, {})
+        server_jobs.pop(event.job_id, None)
+
+        job = self.scheduler.get_job(event.job_id)
+        if (
+            event.code == EVENT_JOB_ADDED
+            and job is not None
+            and isinstance(job.trigger, CronTrigger)
+        ):
+            if job.func == self._run_scheduled_clear:
+                server_jobs[event.job_id] = f"channels.{job.args[0].id}"
+            elif job.func == self._run_scheduled_group_clear:
+                server_jobs[event.job_id] = f"groups.{job.args[1]}"
+
+        if not server_jobs:
+            del self._timezone_jobs[server_id]
+
+    def reschedule_timezone_jobs(
+        self, servers: Dict[str, Server], dependencies: Dict[str, Set[str]]
+    ) -> List[RescheduledJob]:
+        """Move fixed-time jobs onto triggers built with the current timezones
+
+        Only indexed jobs whose timer depends on one of their server's
+        ``dependencies`` (see ScheduleExpressionParser.get_timezone_dependency)
+        are parsed again, and only those whose timezone differs are changed.
+        """
+        now = self._clock()
+        rescheduled: List[RescheduledJob] = []
+
+        with self._batched_job_changes():
+            for server_id in dependencies.keys() & self._timezone_jobs.keys():
+                server = servers.get(server_id)
+                if server is None:
+                    continue
+                for job_id, schedule_path in list(
+                    self._timezone_jobs[server_id].items()
+                ):
+                    kind, key = schedule_path.split(".", 1)
+                    schedule = (
+                        server.channels if kind == "channels" else server.groups
+                    ).get(key)
+                    job = self.scheduler.get_job(job_id)
+                    if schedule is None or job is None:
+                        continue
+                    dependency = self.schedule_parser.get_timezone_dependency(
+                        schedule.timer
+                    )
+                    if dependency not in dependencies[server_id]:
+                        continue
+
+                    try:
+                        trigger, next_run_time = (
+                            self.schedule_parser.parse_schedule_expression(
+                                schedule.timer, server_id
+                            )
+                        )
+                    except ScheduleParseError as e:
+                        logger.error(
+                            LogArea.SCHEDULER,
+                            f"Error parsing timer for job {job_id}: {e}",
+                        )
+                        continue
+                    if str(trigger.timezone) == str(job.trigger.timezone):
+                        continue
+
+                    anchor_time = next_run_time
+                    # A pending skip keeps the run it skips to
+                    if schedule.skip_until and schedule.skip_until > now:
+                        next_run_time = schedule.skip_until
+                    paused = self._paused_jobs.get(job_id)
+                    if paused is not None:
+                        # Stays paused, the new time applies once it resumes
+                        self.scheduler.modify_job(job_id, trigger=trigger)
+                        paused.next_run_time = next_run_time
+                    else:
+                        self.scheduler.modify_job(
+                            job_id, trigger=trigger, next_run_time=next_run_time
+                        )
+
+                    channel_id = None
+                    if kind == "channels":
+                        channel_id = key
+                        task = self._tasks.get(job_id)
+                        if task is not None:
+                            task.scheduled_time = next_run_time
+                        self._cancel_prestage(job_id)
+                        if paused is None:
+                            self._schedule_prestage(job_id, job.args[0])
+
+                    rescheduled.append(
+                        RescheduledJob(
+                            job_id=job_id,
+                            server_id=server_id,
+                            schedule_path=schedule_path,
+                            schedule=schedule,
+                            anchor_time=anchor_time,
+                            channel_id=channel_id,
+                        )
+                    )
+
+        return rescheduled
+
+    async def _run_scheduled_clear(self, channel: discord.TextChannel) -> None:
+        """Run a scheduled clear and record lateness, duration and outcome"""
+        server_id = str(channel.guild.id)
+        channel_id = str(channel.id)
+        job_id = self._create_job_identifier(server_id, channel_id)
+
+        started_at = self._clock()
+        scheduled_time = self._submitted_run_times.pop(job_id, started_at)
+
+        task = self._tasks.get(job_id) or self._track_task(
+            job_id, server_id, channel_id, scheduled_time
+        )
+        # The job already points at its next fire time, which can be read
+        # ahead now; this run uses whatever was staged for it
+        self._schedule_prestage(job_id, channel)
+
+        if task.status == TaskStatus.RUNNING:
+            # A retry of the previous run is still in progress
+            self._stats.total_runs_skipped += 1
+            logger.warning(
+                LogArea.SCHEDULER,
+                f"Skipped run of job {job_id}: retry still running",
+            )
+            return
+
+        # The regular run supersedes any retry still waiting
+        self._cancel_pending_retry(job_id)
+        task.retry_count = 0
+
+        if self._defer_clear(
+            job_id, lambda: self._run_deferred_clear(channel, task, scheduled_time)
+        ):
+            return
+        if await self._wait_for_dispatch_slot():
+            started_at = self._clock()
+
+        await self._execute_clear(channel, task, scheduled_time, started_at)
+
+    async def _run_scheduled_group_clear(self, guild: discord.Guild, name: str) -> None:
+        """Fan a group's run out to the clear of each of its channels
+
+        Every channel is tracked and retried like a channel with its own job.
+        Channels with their own subscription are left to that one.
+        """
+        server_id = str(guild.id)
+        job_id = self._create_group_job_identifier(server_id, name)
+        scheduled_time = self._submitted_run_times.pop(job_id, self._clock())
+
+        if self._defer_clear(
+            job_id, lambda: self._clear_group(guild, name, scheduled_time)
+        ):
+            return
+        await self._clear_group(guild, name, scheduled_time)
+
+    async def _clear_group(
+        self, guild: discord.Guild, name: str, scheduled_time: datetime
+    ) -> None:
+        server_id = str(guild.id)
+        job_id = self._create_group_job_identifier(server_id, name)
+        server = await self.data_service.get_server(server_id)
+        group = server.get_group(name) if server else None
+        if group is None:
+            return
+
+        channels = []
+        for channel_id in group.members:
+            if channel_id in server.channels:
+                continue
+            channel = guild.get_channel(int(channel_id))
+            if channel is not None:
+                channels.append(channel)
+
+        semaphore = asyncio.Semaphore(self._group_concurrency)
+
+        async def clear_member(channel: discord.TextChannel) -> None:
+            channel_id = str(channel.id)
+            member_job_id = self._create_job_identifier(server_id, channel_id)
+            self._group_members[member_job_id] = job_id
+            task = self._tasks.get(member_job_id) or self._track_task(
+                member_job_id, server_id, channel_id, scheduled_time
+            )
+            if task.status == TaskStatus.RUNNING:
+                self._stats.total_runs_skipped += 1
+                return
+
+            self._cancel_pending_retry(member_job_id)
+            task.retry_count = 0
+            async with semaphore:
+                await self._wait_for_dispatch_slot()
+                await self._execute_clear(
+                    channel, task, scheduled_time, self._clock()
+                )
+
+        results = await asyncio.gather(
+            *(clear_member(channel) for channel in channels), return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning(
+                LogArea.SCHEDULER,
+                f"Group job {job_id}: {len(failures)} of {len(channels)} channel clears failed: {failures[0]}",
+            )
+
+    async def _run_retry_clear(self, channel: discord.TextChannel) -> None:
+        """Run a retry scheduled after a transient clear failure"""
+        server_id = str(channel.guild.id)
+        channel_id = str(channel.id)
+        job_id = self._create_job_identifier(server_id, channel_id)
+
+        task = self._tasks.get(job_id)
+        if task is None or task.status == TaskStatus.RUNNING:
+            return
+
+        started_at = self._clock()
+        scheduled_time = self._submitted_run_times.pop(
+            self._create_retry_job_identifier(job_id), started_at
+        )
+        # Shares the key of the regular run, the two catch up as one clear
+        if self._defer_clear(
+            job_id, lambda: self._run_deferred_clear(channel, task, scheduled_time)
+        ):
+            return
+        if await self._wait_for_dispatch_slot():
+            started_at = self._clock()
+        await self._execute_clear(
+            channel, task, scheduled_time, started_at, is_retry=True
+        )
+
+    async def _run_deferred_clear(
+        self, channel: discord.TextChannel, task: ScheduledTask, scheduled_time: datetime
+    ) -> None:
+        job_id = task.task_id
+        if (
+            task.status == TaskStatus.RUNNING
+            or job_id not in self._tasks
+            or job_id in self._paused_jobs
+        ):
+            return
+        await self._execute_clear(channel, task, scheduled_time, self._clock())
+
+    async def _execute_clear(
+        self,
+        channel: discord.TextChannel,
+        task: ScheduledTask,
+        scheduled_time: datetime,
+        started_at: datetime,
+        is_retry: bool = False,
+    ) -> None:
+        task.scheduled_time = scheduled_time
+        task.mark_running()
+
+        start = time.perf_counter()
+        result: Optional[ClearResult] = None
+        try:
+            result = await self._clear_callback(channel)
+        except Exception as e:
+            task.mark_failed(str(e))
+            raise
+        finally:
+            duration = time.perf_counter() - start
+
+            if task.status == TaskStatus.RUNNING:
+                if result is not None and not result.succeeded:
+                    task.mark_failed(result.error_message or result.outcome.value)
+                else:
+                    task.mark_completed()
+
+            record = ClearExecutionRecord(
+                # A recreated channel's task was moved to a new job meanwhile
+                job_id=task.task_id,
+                channel_id=task.channel_id,
+                guild_id=task.guild_id,
+                scheduled_time=scheduled_time,
+                started_at=started_at,
+                duration_seconds=duration,
+                deleted_count=result.deleted_count if result else 0,
+                api_calls=result.api_calls if result else 0,
+                status=task.status,
+                outcome=result.outcome.value if result else task.status.value,
+            )
+            self._record_execution(record)
+            if result is not None:
+                self.health.record_responses(
+                    result.api_calls,
+                    server_errors=int(
+                        result.outcome == ClearOutcome.TRANSIENT_ERROR
+                    ),
+                    rate_limited=result.rate_limited,
+                )
+
+        if result.outcome == ClearOutcome.TRANSIENT_ERROR:
+            self._schedule_retry(channel, task)
+        elif is_retry and result.succeeded:
+            self._stats.total_retries_succeeded += 1
+
+    def _schedule_retry(self, channel: discord.TextChannel, task: ScheduledTask) -> None:
+        """Schedule a one-off retry using exponential backoff with jitter"""
+        job_id = task.task_id
+        if job_id in self._paused_jobs:
+            return
+
+        if not task.can_retry():
+            self._stats.total_retries_exhausted += 1
+            logger.warning(
+                LogArea.SCHEDULER,
+                f"Job {job_id} failed {task.retry_count + 1} times, waiting for next scheduled run",
+            )
+            return
+
+        delay = min(
+            self._retry_base_delay * (2**task.retry_count), self._retry_max_delay
+        )
+        # Equal jitter keeps at least half the backoff while spreading retries out
+        delay = random.uniform(delay / 2, delay)
+        now = self._clock()
+        run_at = now + timedelta(seconds=delay)
+
+        # Channels of a group run again with the group
+        regular_job = self.scheduler.get_job(self._group_members.get(job_id, job_id))
+        next_regular_run = regular_job.next_run_time if regular_job else None
+        if next_regular_run and next_regular_run <= run_at:
+            logger.debug(
+                LogArea.SCHEDULER,
+                f"Not retrying job {job_id}: next scheduled run comes first",
+            )
+            return
+
+        # Retries share one budget so a Discord outage does not cause a burst
+        run_at = max(run_at, self._next_retry_slot)
+        self._next_retry_slot = run_at + self._retry_min_spacing
+
+        task.increment_retry()
+        task.scheduled_time = run_at
+        self._stats.total_retries_scheduled += 1
+
+        self.scheduler.add_job(
+            self._run_retry_clear,
+            "date",
+            run_date=run_at,
+            args=[channel],
+            id=self._create_retry_job_identifier(job_id),
+            replace_existing=True,
+        )
+        logger.info(
+            LogArea.SCHEDULER,
+            f"Retry {task.retry_count}/{task.max_retries} for job {job_id} in {(run_at - now).total_seconds():.0f}s",
+        )
+
+    def _schedule_prestage(self, job_id: str, channel: discord.TextChannel) -> None:
+        """Plan reading a fixed-time clear's history ahead of its next fire
+
+        Interval clears are left alone: they run often enough that their
+        history stays short, and a short interval would read it twice.
+        """
+        job = self.scheduler.get_job(job_id)
+        fire_time = getattr(job, "next_run_time", None)
+        if (
+            self._prestage_callback is None
+            or not self._prestage_lead
+            or fire_time is None
+            or not isinstance(job.trigger, CronTrigger)
+        ):
+            return
+
+        run_at = fire_time - self._prestage_lead
+        if run_at <= self._clock():
+            return
+
+        self.scheduler.add_job(
+            self._run_prestage,
+            "date",
+            run_date=run_at,
+            args=[channel, fire_time],
+            id=self._create_prestage_job_identifier(job_id),
+            replace_existing=True,
+        )
+
+    def refresh_prestage(self, server_id: str, channel_id: str) -> None:
+        """Plan pre-staging again after a job's next run time was changed"""
+        job_id = self._create_job_identifier(server_id, channel_id)
+        job = self.scheduler.get_job(job_id)
+        self._cancel_prestage(job_id)
+        if job is not None:
+            self._schedule_prestage(job_id, job.args[0])
+
+    async def _run_prestage(
+        self, channel: discord.TextChannel, fire_time: datetime
+    ) -> None:
+        job = self.get_channel_clear_job(str(channel.guild.id), str(channel.id))
+        if job is None or job.next_run_time != fire_time:
+            # Skipped or rescheduled since this was planned
+            return
+        if self.health.evaluate().level >= HealthMode.DEFERRING.level:
+            # Only saves time, the clear reads the history itself
+            return
+
+        try:
+            await self._prestage_callback(channel, fire_time)
+        except Exception as e:
+            logger.warning(
+                LogArea.SCHEDULER, f"Failed to pre-stage clear of job {job.id}: {e}"
+            )
+
+    def _cancel_prestage(self, job_id: str) -> None:
+        prestage_job_id = self._create_prestage_job_identifier(job_id)
+        if self.scheduler.get_job(prestage_job_id):
+            self.scheduler.remove_job(prestage_job_id)
+
+    async def run_or_defer(
+        self, key: str, work: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Run non-critical work now, or once the shard stops deferring
+
+        Work deferred under the same key replaces what was waiting, so only
+        the latest view edit or notification of a channel is sent.
+        """
+        if self.health.evaluate().level >= HealthMode.DEFERRING.level:
+            self._deferred_work[key] = (HealthMode.DEFERRING, work)
+            return
+        await work()
+
+    def _defer_clear(self, job_id: str, work: Callable[[], Awaitable[None]]) -> bool:
+        """Hold a clear back while the shard sheds load"""
+        if self.health.evaluate() != HealthMode.SHEDDING:
+            return False
+
+        if job_id not in self._deferred_work:
+            self._stats.total_runs_deferred += 1
+            logger.debug(
+                LogArea.SCHEDULER, f"Deferred run of job {job_id}: shedding load"
+            )
+        self._deferred_work[job_id] = (HealthMode.SHEDDING, work)
+        return True
+
+    async def _wait_for_dispatch_slot(self) -> bool:
+        """Space clear starts out across the shard while it is degraded
+
+        Returns whether the caller had to wait.
+        """
+        if self.health.evaluate() == HealthMode.NORMAL:
+            return False
+
+        now = self._clock()
+        slot = max(now, self._next_dispatch_slot)
+        self._next_dispatch_slot = slot + self._dispatch_interval
+        if slot <= now:
+            return False
+        await self._sleep((slot - now).total_seconds())
+        return True
+
+    async def _check_shard_health(self) -> None:
+        self.health.evaluate()
+
+    def _on_health_mode_change(self, previous: HealthMode, mode: HealthMode) -> None:
+        if mode.level >= previous.level or not self._deferred_work:
+            return
+        if self._deferred_worker is None or self._deferred_worker.done():
+            self._deferred_worker = asyncio.create_task(self._run_deferred_work())
+
+    async def _run_deferred_work(self) -> None:
+        """Catch up on deferred work the current mode allows, paced like clears"""
+        while True:
+            ready = [
+                key
+                for key, (mode, _) in self._deferred_work.items()
+                if self.health.mode.level < mode.level
+            ]
+            if not ready:
+                return
+
+            for key in ready:
+                entry = self._deferred_work.get(key)
+                if entry is None or self.health.evaluate().level >= entry[0].level:
+                    continue
+                del self._deferred_work[key]
+
+                await self._wait_for_dispatch_slot()
+                try:
+                    await entry[1]()
+                except Exception as e:
+                    logger.warning(
+                        LogArea.SCHEDULER, f"Deferred work {key} failed: {e}"
+                    )
+
+    def get_health_status(self) -> Dict[str, Any]:
+        status = self.health.get_status()
+        status["deferred_clears"] = sum(
+            1
+            for mode, _ in self._deferred_work.values()
+            if mode == HealthMode.SHEDDING
+        )
+        status["deferred_work"] = len(self._deferred_work) - status["deferred_clears"]
+        return status
+
+    def _cancel_pending_retry(self, job_id: str) -> None:
+        retry_job_id = self._create_retry_job_identifier(job_id)
+        if self.scheduler.get_job(retry_job_id):
+            self.scheduler.remove_job(retry_job_id)
+
+    def _record_execution(self, record: ClearExecutionRecord) -> None:
+        self._stats.record_execution(record)
+
+        history = self._execution_history.get(record.job_id)
+        if history is None:
+            history = deque(maxlen=self._history_size)
+            self._execution_history[record.job_id] = history
+        history.append(record)
+
+        if record.lateness_seconds > 60:
+            logger.warning(
+                LogArea.PERFORMANCE,
+                f"Clear job {record.job_id} started {record.lateness_seconds:.1f}s late",
+            )
+
+    def record_background_deletions(self, deleted_count: int, api_calls: int) -> None:
+        """Count work done by clears that continue after their job returned"""
+        self._stats.total_messages_deleted += deleted_count
+        self._stats.total_api_calls += api_calls
+
+    def record_overlapping_clear(self, follow_up: bool) -> None:
+        """Count a clear request that was merged into one already running"""
+        if follow_up:
+            self._stats.total_clears_followed_up += 1
+        else:
+            self._stats.total_clears_joined += 1
+
+    def get_channel_execution_history(
+        self, server_id: str, channel_id: str
+    ) -> List[ClearExecutionRecord]:
+        job_id = self._create_job_identifier(server_id, channel_id)
+        return list(self._execution_history.get(job_id, ()))
+
     def get_channel_clear_job(self, server_id: str, channel_id: str) -> Optional[Job]:
         job_id = self._create_job_identifier(server_id, channel_id)
         return self.scheduler.get_job(job_id)
@@ -277,6 +1253,16 @@ class SchedulerService:
         job = self.get_channel_clear_job(server_id, channel_id)
         return job.next_run_time if job else None
 
+    def get_group_clear_job(self, server_id: str, name: str) -> Optional[Job]:
+        job_id = self._create_group_job_identifier(server_id, name)
+        return self.scheduler.get_job(job_id)
+
+    def get_group_next_clear_time(
+        self, server_id: str, name: str
+    ) -> Optional[datetime]:
+        job = self.get_group_clear_job(server_id, name)
+        return job.next_run_time if job else None
+
     def get_all_scheduled_jobs(self) -> Dict[str, Any]:
         jobs = {}
         for job in self.scheduler.get_jobs():
@@ -290,6 +1276,34 @@ class SchedulerService:
     def _create_job_identifier(server_id: str, channel_id: str) -> str:
         return f"{server_id}_{channel_id}"
 
+    @staticmethod
+    def _create_group_job_identifier(server_id: str, name: str) -> str:
+        return f"{server_id}_group_{name}"
+
+    @staticmethod
+    def _create_retry_job_identifier(job_id: str) -> str:
+        return f"{job_id}_retry"
+
+    @staticmethod
+    def _create_prestage_job_identifier(job_id: str) -> str:
+        return f"{job_id}_prestage"
+
     def get_scheduler_statistics(self) -> Dict[str, Any]:
-        self._stats.current_queue_size = len(self.scheduler.get_jobs())
-        return self._stats.to_dict()
+        jobs = self.scheduler.get_jobs()
+        self._stats.current_queue_size = len(jobs)
+        self._stats.pending_retries = sum(
+            1 for job in jobs if job.id.endswith("_retry")
+        )
+        stats = self._stats.to_dict()
+        stats["running_tasks"] = sum(
+            1 for task in self._tasks.values() if task.status == TaskStatus.RUNNING
+        )
+        stats["tracked_channels"] = len(self._execution_history)
+        stats["paused_jobs"] = len(self._paused_jobs)
+        health = self.get_health_status()
+        stats["health_mode"] = health["mode"]
+        stats["health_error_rate"] = health["error_rate"]
+        stats["health_mode_changes"] = health["mode_changes"]
+        stats["deferred_clears"] = health["deferred_clears"]
+        stats["deferred_work"] = health["deferred_work"]
+        return stats
@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import discord
+
+from src.models import ClearRunRecord
+from src.services.server_data_service import DataService
+from src.utils.logger import logger, LogArea
+from src.config import get_global_config
+
+
+class ClearLedgerService:
+    """Buffers a record of every clear run and writes them to the ledger in batches"""
+
+    def __init__(
+        self,
+        data_service: DataService,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
+        self.data_service = data_service
+        self._clock = clock or discord.utils.utcnow
+        config = get_global_config()
+        self.retention_seconds = config.clear_ledger_retention_days * 86400
+        self.batch_size = config.clear_ledger_batch_size
+        self.flush_interval = config.clear_ledger_flush_interval
+        # Records kept while the database is unreachable, the oldest go first
+        self.max_buffered = self.batch_size * 10
+        self._buffer: List[ClearRunRecord] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._collection_ready = False
+        self.dropped_count = 0
+
+    def record(self, record: ClearRunRecord) -> None:
+        self._buffer.append(record)
+        overflow = len(self._buffer) - self.max_buffered
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self.dropped_count += overflow
+        if len(self._buffer) >= self.batch_size and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Write the buffered records in one request"""
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+
+            records = self._buffer
+            self._buffer = []
+            try:
+                if not self._collection_ready:
+                    await self.data_service.ensure_clear_ledger(self.retention_seconds)
+                    self._collection_ready = True
+                await self.data_service.save_clear_runs(records)
+            except Exception as e:
+                # Back in front of whatever was recorded meanwhile
+                self._buffer[:0] = records
+                overflow = len(self._buffer) - self.max_buffered
+                if overflow > 0:
+                    del self._buffer[:overflow]
+                    self.dropped_count += overflow
+                logger.warning(
+                    LogArea.DATABASE,
+                    f"Failed to write {len(records)} clear runs to the ledger: {e}",
+                )
+
+    async def summarize_channels(
+        self, hours: int, guild_id: Optional[str] = None, limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Clear run totals per channel over the last hours, longest running first"""
+        # Buffered runs would otherwise be missing from the totals
+        await self.flush()
+        since = self._clock() - timedelta(hours=hours)
+        return await self.data_service.summarize_clear_runs(since, guild_id, limit)
+
+    def get_pending_count(self) -> int:
+        return len(self._buffer)
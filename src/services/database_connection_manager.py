@@ -71,5 +71,17 @@ class DatabaseManager:
     def config(self):
         return self.db[CollectionName.CONFIG.value]
 
+    @property
+    def clear_checkpoints(self):
+        return self.db[CollectionName.CLEAR_CHECKPOINTS.value]
+
+    @property
+    def channel_profiles(self):
+        return self.db[CollectionName.CHANNEL_PROFILES.value]
+
+    @property
+    def clear_ledger(self):
+        return self.db[CollectionName.CLEAR_LEDGER.value]
+
 
 db_manager = DatabaseManager()
@@ -0,0 +1,451 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+import discord
+from discord.http import Route
+from aiohttp.client_exceptions import ClientConnectorError, ClientPayloadError
+
+from src.models import ClearCheckpoint, ClearOutcome, ClearResult, IgnoreFilter
+from src.services.server_data_service import DataService
+from src.services.clear_job_scheduler_service import SchedulerService
+from src.utils.logger import logger, LogArea
+from src.utils.message_history import (
+    RawMessage,
+    fetch_pinned_message_ids,
+    fetch_raw_history_page,
+)
+from src.utils.rate_limiter import AdaptiveRateLimiter, read_bucket_state
+from src.config import get_global_config
+
+
+@dataclass(eq=False)
+class _LegacyJob:
+    """One channel's share of the legacy deletion queue"""
+
+    channel: discord.TextChannel
+    checkpoint: ClearCheckpoint
+    ignore_filter: IgnoreFilter
+    result: ClearResult
+    done: asyncio.Future
+    resumed_from: int
+    # Deletable messages read ahead, newest first, refilled from ``cursor``
+    pending: Deque[RawMessage] = field(default_factory=deque)
+    cursor: Optional[int] = None
+    exhausted: bool = False
+    refill: Optional[asyncio.Task] = None
+    busy: bool = False
+    unsaved: int = 0
+    # Failed attempts at the message at the head of ``pending``
+    failed_attempts: int = 0
+    # Kept messages come across since the pass started at ``scanned_from``
+    scanned_from: Optional[int] = None
+    seen_ignored: Set[int] = field(default_factory=set)
+
+    @property
+    def channel_id(self) -> str:
+        return self.checkpoint.channel_id
+
+
+class LegacyDeletionService:
+    """Shard-wide queue for messages too old to bulk delete
+
+    Clears hand over a channel with a checkpoint and return at once. A small
+    pool of workers then deletes one message at a time, taking channels in
+    turn so a huge backlog cannot starve the others, under a budget shared by
+    the whole shard on top of the adaptive per-server limit. Each channel only
+    buffers a few pages of ids; the rest of its backlog stays in the channel
+    history behind the checkpoint cursor, which is saved to the database
+    after every page so a restart resumes where it stopped.
+    """
+
+    page_size = 100
+
+    def __init__(
+        self,
+        data_service: DataService,
+        scheduler_service: SchedulerService,
+        limiter: AdaptiveRateLimiter,
+        clock: Optional[Callable[[], datetime]] = None,
+        sleep: Optional[Callable[[float], Awaitable[None]]] = None,
+    ):
+        self.data_service = data_service
+        self.scheduler_service = scheduler_service
+        self._health = scheduler_service.health
+        self._limiter = limiter
+        self._clock = clock or discord.utils.utcnow
+        self._sleep = sleep or asyncio.sleep
+        config = get_global_config()
+        self.worker_count = config.legacy_delete_workers
+        self.channel_buffer = config.legacy_delete_channel_buffer
+        # A fixed rate: the limiter never sees successes for this key
+        self._shard_budget = AdaptiveRateLimiter(
+            initial_rate=config.legacy_delete_shard_rate,
+            max_rate=config.legacy_delete_shard_rate,
+            clock=self._clock,
+            sleep=self._sleep,
+        )
+        self._jobs: Dict[str, _LegacyJob] = {}
+        # Channels with buffered messages and no delete in flight, in turn order
+        self._ready: Deque[str] = deque()
+        self._wakeup = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+        # Channels whose pass has not finished, whether running or stopped
+        self._checkpoints: Dict[str, ClearCheckpoint] = {}
+        self._stored_checkpoints: Set[str] = set()
+        self._finished_callbacks: List[
+            Callable[[discord.TextChannel, ClearCheckpoint, ClearResult], None]
+        ] = []
+
+    def register_finished_callback(
+        self,
+        callback: Callable[[discord.TextChannel, ClearCheckpoint, ClearResult], None],
+    ) -> None:
+        """Called with the channel, checkpoint and result of every completed pass"""
+        self._finished_callbacks.append(callback)
+
+    def enqueue(
+        self,
+        channel: discord.TextChannel,
+        checkpoint: ClearCheckpoint,
+        ignore_filter: IgnoreFilter,
+    ) -> None:
+        """Queue a channel's legacy range, unless it is already being worked on"""
+        if checkpoint.channel_id in self._jobs:
+            return
+
+        self._checkpoints[checkpoint.channel_id] = checkpoint
+        job = _LegacyJob(
+            channel=channel,
+            checkpoint=checkpoint,
+            ignore_filter=ignore_filter,
+            result=ClearResult(
+                channel_id=checkpoint.channel_id,
+                guild_id=checkpoint.guild_id,
+                deleted_count=checkpoint.deleted_count,
+            ),
+            done=asyncio.get_running_loop().create_future(),
+            resumed_from=checkpoint.deleted_count,
+            cursor=checkpoint.before_id,
+            scanned_from=checkpoint.before_id,
+        )
+        self._jobs[job.channel_id] = job
+        self._ensure_workers()
+        self._schedule_refill(job)
+
+    def has_pending(self, channel_id: str) -> bool:
+        return channel_id in self._checkpoints
+
+    def is_running(self, channel_id: str) -> bool:
+        return channel_id in self._jobs
+
+    def get_progress(self, channel_id: str) -> Optional[ClearCheckpoint]:
+        return self._checkpoints.get(channel_id)
+
+    async def wait_for_channel(self, channel_id: str) -> Optional[ClearResult]:
+        job = self._jobs.get(channel_id)
+        if job is None:
+            return None
+        return await asyncio.shield(job.done)
+
+    def mark_stored(self, channel_id: str) -> None:
+        """Note that a checkpoint loaded from the database exists there"""
+        self._stored_checkpoints.add(channel_id)
+
+    async def discard(self, channel_id: str) -> None:
+        """Forget a channel's unfinished pass, in memory and in the database"""
+        self._checkpoints.pop(channel_id, None)
+        if channel_id not in self._stored_checkpoints:
+            return
+
+        self._stored_checkpoints.discard(channel_id)
+        try:
+            await self.data_service.delete_clear_checkpoint(channel_id)
+        except Exception as e:
+            logger.warning(
+                LogArea.DATABASE,
+                f"Failed to delete clear checkpoint for channel {channel_id}: {e}",
+            )
+
+    async def stop(self) -> None:
+        """Stop all work, keeping checkpoints so the passes can be resumed"""
+        tasks = list(self._workers)
+        tasks.extend(job.refill for job in self._jobs.values() if job.refill)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers.clear()
+
+        for job in list(self._jobs.values()):
+            await self._save_checkpoint(job)
+            self._end_job(job)
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            "channels_queued": len(self._jobs),
+            "channels_stopped": len(self._checkpoints) - len(self._jobs),
+            "messages_buffered": sum(len(job.pending) for job in self._jobs.values()),
+        }
+
+    def _ensure_workers(self) -> None:
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self.worker_count:
+            self._workers.append(asyncio.create_task(self._run_worker()))
+
+    def _make_ready(self, job: _LegacyJob) -> None:
+        if job.pending and not job.busy and job.channel_id not in self._ready:
+            self._ready.append(job.channel_id)
+            self._wakeup.set()
+
+    async def _run_worker(self) -> None:
+        while True:
+            while not self._ready:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            job = self._jobs.get(self._ready.popleft())
+            if job is None or not job.pending:
+                continue
+
+            job.busy = True
+            try:
+                await self._delete_next(job)
+            except Exception as e:
+                logger.warning(
+                    LogArea.DISCORD,
+                    f"Unexpected error deleting an older message in channel {job.channel_id}: {e}",
+                )
+            finally:
+                job.busy = False
+            await self._after_delete(job)
+
+    async def _delete_next(self, job: _LegacyJob) -> None:
+        message = job.pending.popleft()
+        channel = job.channel
+        bucket_key = job.checkpoint.guild_id
+        route = Route(
+            "DELETE",
+            "/channels/{channel_id}/messages/{message_id}",
+            channel_id=channel.id,
+            message_id=0,
+        )
+
+        await self._shard_budget.acquire("shard")
+        await self._limiter.acquire(bucket_key)
+        try:
+            job.result.api_calls += 1
+            await channel.get_partial_message(message.id).delete()
+            job.result.deleted_count += 1
+            job.result.single_deleted_count += 1
+            self._limiter.record_success(
+                bucket_key, read_bucket_state(channel._state.http, route)
+            )
+            self._health.record_responses(1)
+        except discord.RateLimited as e:
+            job.result.rate_limited += 1
+            self._limiter.record_rate_limited(bucket_key, e.retry_after)
+            self._health.record_responses(1, rate_limited=1)
+            job.pending.appendleft(message)
+            return
+        except discord.NotFound:
+            # Already gone, which is what we wanted
+            self._health.record_responses(1)
+        except discord.Forbidden as e:
+            # Lost access, handled like a refill running into the same error
+            self._health.record_responses(1)
+            job.result.outcome = ClearOutcome.CHANNEL_UNAVAILABLE
+            job.result.error_message = str(e)
+            job.pending.clear()
+            job.exhausted = True
+            await self.discard(job.channel_id)
+            return
+        except (
+            discord.DiscordServerError,
+            ClientConnectorError,
+            ClientPayloadError,
+            TimeoutError,
+        ) as e:
+            if isinstance(e, discord.DiscordServerError):
+                self._health.record_responses(1, server_errors=1)
+            job.failed_attempts += 1
+            if job.failed_attempts < 3:
+                job.pending.appendleft(message)
+                await self._sleep(2.0 * (2 ** (job.failed_attempts - 1)))
+                return
+
+            # The checkpoint stays before this message, so a resumed pass
+            # reads it again
+            logger.warning(
+                LogArea.SCHEDULER,
+                f"Clearing older messages in channel {channel.id} stopped, will resume later: {e}",
+            )
+            job.result.outcome = ClearOutcome.TRANSIENT_ERROR
+            job.result.error_message = f"{type(e).__name__}: {e}"
+            job.pending.clear()
+            job.exhausted = True
+            return
+        except discord.HTTPException as e:
+            if e.status == 429:
+                job.result.rate_limited += 1
+                retry_after = float(e.response.headers.get("Retry-After", 1.0))
+                self._limiter.record_rate_limited(bucket_key, retry_after)
+                self._health.record_responses(1, rate_limited=1)
+                job.pending.appendleft(message)
+                return
+            # Rejected for this message alone, asking again won't help
+            self._health.record_responses(1)
+            logger.warning(
+                LogArea.DISCORD,
+                f"Failed to delete message {message.id} in channel {channel.id}: {e}",
+            )
+
+        # One delete in flight per channel keeps them in history order, so
+        # everything newer than this message is done
+        job.failed_attempts = 0
+        job.checkpoint.before_id = message.id
+        job.checkpoint.deleted_count = job.result.deleted_count
+        job.unsaved += 1
+
+    async def _after_delete(self, job: _LegacyJob) -> None:
+        if job.unsaved >= self.page_size:
+            await self._save_checkpoint(job)
+
+        if len(job.pending) <= self.channel_buffer // 2:
+            self._schedule_refill(job)
+        self._make_ready(job)
+        await self._finish_if_done(job)
+
+    def _schedule_refill(self, job: _LegacyJob) -> None:
+        if job.exhausted or (job.refill is not None and not job.refill.done()):
+            return
+        job.refill = asyncio.create_task(self._refill(job))
+
+    async def _refill(self, job: _LegacyJob) -> None:
+        """Read the next page of the channel's legacy range into its buffer"""
+        channel = job.channel
+
+        try:
+            if not await self._is_channel_subscribed(job):
+                job.result.outcome = ClearOutcome.SKIPPED
+                job.result.error_message = "unsubscribed"
+                job.pending.clear()
+                job.exhausted = True
+                await self.discard(job.channel_id)
+                return
+
+            if job.ignore_filter.fetch_pinned:
+                job.result.api_calls += 1
+                job.ignore_filter = job.ignore_filter.with_pinned_messages(
+                    await fetch_pinned_message_ids(channel)
+                )
+
+            messages_page = []
+            # Retry fetching message history on network errors
+            for attempt in range(3):
+                try:
+                    messages_page = await fetch_raw_history_page(
+                        channel,
+                        self.page_size,
+                        before=discord.Object(id=job.cursor),
+                    )
+                    break
+                except (ClientConnectorError, ClientPayloadError, TimeoutError):
+                    if attempt == 2:
+                        raise
+                    delay = 2.0 * (2 ** attempt)
+                    await self._sleep(delay)
+
+            job.result.api_calls += 1
+            job.result.pages_fetched += 1
+            job.result.scanned_count += len(messages_page)
+            if len(messages_page) < self.page_size:
+                job.exhausted = True
+            if messages_page:
+                job.cursor = messages_page[-1].id
+
+            deletable = job.ignore_filter.deletable(messages_page, job.seen_ignored)
+            job.result.kept_count += len(messages_page) - len(deletable)
+            # A delete may have stopped the pass while this page was read
+            if job.result.outcome == ClearOutcome.COMPLETED:
+                job.pending.extend(deletable)
+        except (discord.NotFound, discord.Forbidden) as e:
+            # The channel's next scheduled clear runs into the same error and
+            # removes the subscription or pauses its job
+            job.result.outcome = ClearOutcome.CHANNEL_UNAVAILABLE
+            job.result.error_message = str(e)
+            job.pending.clear()
+            job.exhausted = True
+            await self.discard(job.channel_id)
+        except Exception as e:
+            logger.warning(
+                LogArea.SCHEDULER,
+                f"Clearing older messages in channel {channel.id} stopped, will resume later: {e}",
+            )
+            job.result.outcome = ClearOutcome.TRANSIENT_ERROR
+            job.result.error_message = f"{type(e).__name__}: {e}"
+            # Buffered messages are read again from the cursor on resume
+            job.pending.clear()
+            job.exhausted = True
+        finally:
+            job.refill = None
+
+        if len(job.pending) <= self.channel_buffer // 2:
+            self._schedule_refill(job)
+        self._make_ready(job)
+        await self._finish_if_done(job)
+
+    async def _finish_if_done(self, job: _LegacyJob) -> None:
+        if (
+            job.pending
+            or job.busy
+            or not job.exhausted
+            or job.refill is not None
+            or self._jobs.get(job.channel_id) is not job
+        ):
+            return
+
+        if job.result.outcome == ClearOutcome.COMPLETED:
+            await self.discard(job.channel_id)
+            job.result.unseen_ignored_ids = job.ignore_filter.unseen_message_ids(
+                job.seen_ignored, before_id=job.scanned_from
+            )
+            for callback in self._finished_callbacks:
+                callback(job.channel, job.checkpoint, job.result)
+            logger.info(
+                LogArea.SCHEDULER,
+                f"Finished clearing older messages in channel {job.channel_id}: {job.result.deleted_count} deleted",
+            )
+        elif job.result.outcome == ClearOutcome.TRANSIENT_ERROR:
+            await self._save_checkpoint(job)
+
+        self._end_job(job)
+
+    def _end_job(self, job: _LegacyJob) -> None:
+        self._jobs.pop(job.channel_id, None)
+        self.scheduler_service.record_background_deletions(
+            job.result.deleted_count - job.resumed_from, job.result.api_calls
+        )
+        if not job.done.done():
+            job.done.set_result(job.result)
+
+    async def _save_checkpoint(self, job: _LegacyJob) -> None:
+        if not job.unsaved:
+            return
+
+        checkpoint = job.checkpoint
+        checkpoint.updated_at = self._clock()
+        job.unsaved = 0
+        try:
+            await self.data_service.save_clear_checkpoint(checkpoint)
+            self._stored_checkpoints.add(checkpoint.channel_id)
+        except Exception as e:
+            logger.warning(
+                LogArea.DATABASE,
+                f"Failed to save clear checkpoint for channel {checkpoint.channel_id}: {e}",
+            )
+
+    async def _is_channel_subscribed(self, job: _LegacyJob) -> bool:
+        server = await self.data_service.get_server(job.checkpoint.guild_id)
+        return server is not None and server.is_channel_cleared(job.channel_id)
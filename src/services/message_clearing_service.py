@@ -1,216 +1,499 @@
 import asyncio
-import pytz
+from dataclasses import dataclass
+from functools import partial
 from datetime import timedelta, datetime
-from typing import Tuple, Set, Optional
+from typing import Awaitable, Callable, Dict, List, Sequence, Set, Optional
 import discord
+from discord.http import Route
 from aiohttp.client_exceptions import ClientConnectorError, ClientPayloadError
 
+from src.models import (
+    ChannelClearProfile,
+    ChannelHighWaterMark,
+    ClearCheckpoint,
+    ClearOutcome,
+    ClearResult,
+    ClearRunRecord,
+    IgnoreFilter,
+    PauseReason,
+)
 from src.services.server_data_service import DataService
+from src.services.clear_ledger_service import ClearLedgerService
 from src.services.clear_job_scheduler_service import SchedulerService
+from src.services.legacy_deletion_service import LegacyDeletionService
+from src.utils.command_validation import CommandValidator
 from src.utils.logger import logger, LogArea
+from src.utils.message_history import (
+    RawMessage,
+    fetch_pinned_message_ids,
+    fetch_raw_history_page,
+)
+from src.utils.rate_limiter import AdaptiveRateLimiter, read_bucket_state
 from src.config import get_global_config
 
 
+@dataclass(eq=False)
+class _RunningClear:
+    """A clear in progress, shared by every request that overlaps it"""
+
+    last_message_id: Optional[int]
+    done: asyncio.Future
+    follow_up: Optional[asyncio.Future] = None
+
+
+@dataclass(eq=False)
+class _PrestagedClear:
+    """History of a fixed-time clear read before it fires"""
+
+    fire_time: datetime
+    # Every message up to this id is in ``messages``, ignored ones included
+    until_id: int
+    messages: List[RawMessage]
+
+
+@dataclass(eq=False)
+class _StaleIgnoredMessages:
+    """Ignored ids of a channel that a full scan did not come across"""
+
+    channel: discord.TextChannel
+    message_ids: Set[int]
+
+
+@dataclass(frozen=True)
+class _ClearPlan:
+    """How one clear reads and deletes, tuned to the channel's recent clears"""
+
+    queue_pages: int
+    page_size: int = 100
+    # Bulk delete requests kept in flight at once
+    bulk_concurrency: int = 1
+    # Whether estimating the old history for a recreate is worth two requests
+    consider_recreate: bool = True
+
+
+# Messages per clear below which a channel is quiet and above which it is busy
+QUIET_CHANNEL_MESSAGES = 100
+BUSY_CHANNEL_MESSAGES = 2000
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
 class MessageService:
-    def __init__(self, data_service: DataService, scheduler_service: SchedulerService):
+    def __init__(
+        self,
+        data_service: DataService,
+        scheduler_service: SchedulerService,
+        clock: Optional[Callable[[], datetime]] = None,
+        sleep: Optional[Callable[[float], Awaitable[None]]] = None,
+    ):
         self.data_service = data_service
         self.scheduler_service = scheduler_service
-        self.rate_limit_delay = 1.0  # Delay between message deletions
+        self._clock = clock or discord.utils.utcnow
+        self._sleep = sleep or asyncio.sleep
+        config = get_global_config()
+        # Single deletes start at one per second and speed up while Discord allows
+        self._delete_limiter = AdaptiveRateLimiter(
+            initial_rate=1.0,
+            max_rate=config.clear_single_delete_max_rate,
+            clock=self._clock,
+            sleep=self._sleep,
+        )
+        self.pipeline_queue_pages = config.clear_pipeline_queue_pages
+        self.clear_legacy_messages = config.clear_legacy_messages
+        self.recreate_threshold = config.clear_recreate_threshold
+        self.prestage_lead = timedelta(seconds=config.clear_prestage_lead_time)
+        self.prestage_max_messages = config.clear_prestage_max_messages
+        self.profile_flush_interval = config.channel_profile_flush_interval
+        self.ignored_compaction_interval = config.ignored_compaction_interval
+        self.ignored_compaction_batch = config.ignored_compaction_batch
+        self.ignored_compaction_rate = config.ignored_compaction_rate
+        # Waiting to be checked with Discord before they are dropped
+        self._stale_ignored: Dict[str, _StaleIgnoredMessages] = {}
+        self._prestaged: Dict[str, _PrestagedClear] = {}
+        # How recent clears of each channel went, written back in batches
+        self._profiles: Dict[str, ChannelClearProfile] = {}
+        self._dirty_profiles: Set[str] = set()
+        self._deleted_profiles: Set[str] = set()
+        # Newest message id and kept entities at the last successful clear
+        self._high_water_marks: Dict[str, ChannelHighWaterMark] = {}
+        # Messages too old for bulk delete are handed to a shard-wide queue
+        self.legacy_deletion = LegacyDeletionService(
+            data_service,
+            scheduler_service,
+            self._delete_limiter,
+            clock=self._clock,
+            sleep=self._sleep,
+        )
+        self.legacy_deletion.register_finished_callback(self._on_legacy_pass_finished)
+        self.clear_ledger = ClearLedgerService(data_service, clock=self._clock)
+        self._bulk_delete_failures: Dict[str, int] = {}
+        # Clears in a row that Discord refused, the job pauses at the threshold
+        self.forbidden_pause_threshold = config.clear_forbidden_pause_threshold
+        self._forbidden_counts: Dict[str, int] = {}
+        # At most one clear runs per channel, later requests share it
+        self._running_clears: Dict[str, _RunningClear] = {}
         self.bot = None  # Will be set by the bot during initialization
 
     def set_bot(self, bot):
         """Set the bot instance after initialization"""
         self.bot = bot
 
-    async def execute_channel_message_clear(self, channel: discord.TextChannel) -> None:
-        if not await self._validate_bot_channel_permissions(channel):
-            return
+    async def execute_channel_message_clear(
+        self, channel: discord.TextChannel
+    ) -> ClearResult:
+        """Clear a channel, or share a clear that is already running there
+
+        An overlapping request gets the running clear's result when nothing
+        was posted since it started. Otherwise it waits for a single
+        follow-up clear, shared by every request that arrives meanwhile.
+        """
+        channel_id = str(channel.id)
+        running = self._running_clears.get(channel_id)
 
-        ignored_messages, ignored_users = await self._get_ignored_entities(channel)
+        if running is None:
+            running = self._start_clear(channel)
+            return await asyncio.shield(running.done)
 
+        last_message_id = channel.last_message_id
+        if last_message_id is None or (
+            running.last_message_id is not None
+            and last_message_id <= running.last_message_id
+        ):
+            self.scheduler_service.record_overlapping_clear(follow_up=False)
+            return await asyncio.shield(running.done)
+
+        self.scheduler_service.record_overlapping_clear(follow_up=True)
+        if running.follow_up is None:
+            running.follow_up = asyncio.get_running_loop().create_future()
+        return await asyncio.shield(running.follow_up)
+
+    def _start_clear(
+        self, channel: discord.TextChannel, done: Optional[asyncio.Future] = None
+    ) -> _RunningClear:
+        running = _RunningClear(
+            last_message_id=channel.last_message_id,
+            done=done or asyncio.get_running_loop().create_future(),
+        )
+        # Every request waiting on a failed clear may be gone by the time
+        # it fails, which asyncio would log as a never retrieved exception
+        running.done.add_done_callback(_retrieve_exception)
+        self._running_clears[str(channel.id)] = running
+        asyncio.create_task(self._run_clear(channel, running))
+        return running
+
+    async def _run_clear(
+        self, channel: discord.TextChannel, running: _RunningClear
+    ) -> None:
+        result = None
+        started_at = self._clock()
+        try:
+            result = await self._clear_channel(channel)
+        except asyncio.CancelledError:
+            running.done.cancel()
+            raise
+        except Exception as e:
+            running.done.set_exception(e)
+            failed = ClearResult(
+                channel_id=str(channel.id),
+                guild_id=str(channel.guild.id),
+                outcome=ClearOutcome.FAILED,
+            )
+            self._record_clear_run(failed, started_at)
+        else:
+            running.done.set_result(result)
+            self._record_clear_run(result, started_at)
+        finally:
+            del self._running_clears[str(channel.id)]
+            if running.follow_up is not None:
+                if result is not None and result.recreated_channel_id:
+                    # Whatever was posted meanwhile went with the old channel
+                    running.follow_up.set_result(result)
+                else:
+                    self._start_clear(channel, running.follow_up)
+
+    async def _clear_channel(self, channel: discord.TextChannel) -> ClearResult:
         server_id = str(channel.guild.id)
         channel_id = str(channel.id)
-        server = await self.data_service.get_server(server_id)
-        if server and channel_id in server.channels:
-            view_message_id = server.channels[channel_id].view_message_id
-            if view_message_id:
-                ignored_messages.add(view_message_id)
+        result = ClearResult(channel_id=channel_id, guild_id=server_id)
 
-        deleted_count = await self._perform_message_deletion(
-            channel, ignored_messages, ignored_users
-        )
+        if not await self._validate_bot_channel_permissions(channel):
+            result.outcome = ClearOutcome.SKIPPED
+            result.error_message = "missing_permissions"
+            # Runs stop until the permissions are restored
+            self.scheduler_service.pause_channel_job(
+                server_id, channel_id, PauseReason.MISSING_PERMISSIONS
+            )
+            return result
 
-        await self._update_next_scheduled_clear_time(channel)
+        ignore_filter = await self._get_ignore_filter(channel)
 
-    async def _get_ignored_entities(
-        self, channel: discord.TextChannel
-    ) -> Tuple[Set[str], Set[str]]:
+        # A legacy pass stopped by an error carries on first
+        checkpoint = self.legacy_deletion.get_progress(channel_id)
+        if checkpoint is not None:
+            self.legacy_deletion.enqueue(channel, checkpoint, ignore_filter)
+
+        # Quiet channels keep their last message id in the guild cache, so an
+        # unchanged channel can be skipped without any history request
+        last_message_id = channel.last_message_id
+        high_water_mark = self._high_water_marks.get(channel_id)
+        if high_water_mark and high_water_mark.covers(last_message_id, ignore_filter):
+            result.outcome = ClearOutcome.IDLE
+            # The timer view still shows the next run time, which just moved
+            await self._refresh_timer_view(channel)
+            return result
+
+        plan = self._plan_clear(channel_id)
+        started_at = self._clock()
+
+        if checkpoint is None and plan.consider_recreate:
+            estimate = await self._recreate_estimate(channel, ignore_filter, result)
+            if estimate is not None and await self._recreate_channel(channel, result):
+                # The history went with the old channel, so the estimate stands
+                # in for a count of deleted messages
+                result.deleted_count = estimate
+                self._high_water_marks.pop(channel_id, None)
+                return result
+
+        await self._perform_message_deletion(channel, ignore_filter, result, plan)
+
+        if result.outcome == ClearOutcome.COMPLETED:
+            self._forbidden_counts.pop(channel_id, None)
+            duration = (self._clock() - started_at).total_seconds()
+            self._get_profile(channel).record_clear(
+                result.deleted_count, duration, result.rate_limited
+            )
+            self._dirty_profiles.add(channel_id)
+            self._report_unseen_ignored(channel, result.unseen_ignored_ids)
+
+        if result.outcome == ClearOutcome.COMPLETED and last_message_id is not None:
+            # Pins are left out, a clear only fetches them when it has to run
+            self._high_water_marks[channel_id] = ChannelHighWaterMark(
+                last_message_id=last_message_id, kept=ignore_filter
+            )
+        else:
+            self._high_water_marks.pop(channel_id, None)
+
+        if result.outcome != ClearOutcome.CHANNEL_UNAVAILABLE:
+            await self._refresh_timer_view(channel)
+
+        return result
+
+    async def _refresh_timer_view(self, channel: discord.TextChannel) -> None:
+        """Edit the timer view message, later on if Discord is struggling"""
+        await self.scheduler_service.run_or_defer(
+            f"{channel.guild.id}_{channel.id}_view",
+            lambda: self._refresh_timer_view_message(channel),
+        )
+
+    async def _get_ignore_filter(self, channel: discord.TextChannel) -> IgnoreFilter:
         server_id = str(channel.guild.id)
         channel_id = str(channel.id)
 
         server = await self.data_service.get_server(server_id)
-        if server and channel_id in server.channels:
-            channel_timer = server.channels[channel_id]
-            ignored_messages = set(channel_timer.ignored.messages)
-            ignored_users = set(channel_timer.ignored.users)
-            return ignored_messages, ignored_users
-        return set(), set()
+        if server is None:
+            return IgnoreFilter()
+        channel_timer = server.get_channel(channel_id)
+        if channel_timer is not None:
+            return channel_timer.compile_ignore_filter()
+        group = server.get_channel_group(channel_id)
+        if group is not None:
+            return group.compile_ignore_filter(channel_id)
+        return IgnoreFilter()
 
     async def _validate_bot_channel_permissions(
         self, channel: discord.TextChannel
     ) -> bool:
-        cache_key = f"perms:{channel.guild.id}:{channel.id}:{channel.guild.me.id}"
+        cache_key = self._permission_cache_key(channel)
         cached_result = await self.data_service._cache.get(cache_key)
 
         if cached_result is not None:
             return cached_result
 
-        permissions = channel.permissions_for(channel.guild.me)
-
-        required_perms = {
-            "view_channel": permissions.view_channel,
-            "send_messages": permissions.send_messages,
-            "read_message_history": permissions.read_message_history,
-            "manage_messages": permissions.manage_messages,
-            "embed_links": permissions.embed_links,
-            "use_application_commands": permissions.use_application_commands,
-            "send_messages_in_threads": permissions.send_messages_in_threads,
-        }
-
-        missing_perms = [
-            perm for perm, has_perm in required_perms.items() if not has_perm
-        ]
-
-        result = len(missing_perms) == 0
+        result = not CommandValidator.get_missing_bot_permissions(channel)
 
         await self.data_service._cache.set(
             cache_key, result, cache_level="memory", ttl=900
         )
 
-        if missing_perms:
-            return False
+        return result
 
-        return True
+    @staticmethod
+    def _permission_cache_key(channel: discord.TextChannel) -> str:
+        return f"perms:{channel.guild.id}:{channel.id}:{channel.guild.me.id}"
+
+    async def sync_channel_permissions(
+        self, guild: discord.Guild, channel_ids: Optional[Sequence[str]] = None
+    ) -> None:
+        """Pause or resume clear jobs after the bot's permissions changed
+
+        Jobs paused because the guild went unavailable are left to the
+        guild's availability events.
+        """
+        server_id = str(guild.id)
+        server = await self.data_service.get_server(server_id)
+        if server is None:
+            return
+
+        if channel_ids is None:
+            channel_ids = list(server.channels)
+
+        paused_count = resumed_count = 0
+        for channel_id in channel_ids:
+            channel = guild.get_channel(int(channel_id))
+            if channel is None or channel_id not in server.channels:
+                continue
+
+            await self.data_service._cache.invalidate(self._permission_cache_key(channel))
+            pause = self.scheduler_service.get_channel_pause(server_id, channel_id)
+            if await self._validate_bot_channel_permissions(channel):
+                if pause is not None and pause.reason != PauseReason.GUILD_UNAVAILABLE:
+                    self._forbidden_counts.pop(channel_id, None)
+                    resumed_count += self.scheduler_service.resume_channel_job(
+                        server_id, channel_id
+                    )
+            elif pause is None:
+                paused_count += self.scheduler_service.pause_channel_job(
+                    server_id, channel_id, PauseReason.MISSING_PERMISSIONS
+                )
+
+        if paused_count or resumed_count:
+            logger.info(
+                LogArea.PERMISSIONS,
+                f"Permissions changed in server {server_id}: {paused_count} jobs paused, {resumed_count} resumed",
+            )
+
+    async def _on_clear_forbidden(self, channel: discord.TextChannel) -> None:
+        """Count a refused clear, pausing the job once refusals repeat"""
+        server_id = str(channel.guild.id)
+        channel_id = str(channel.id)
+        # The cached permissions said the clear was allowed
+        await self.data_service._cache.invalidate(self._permission_cache_key(channel))
+
+        refused = self._forbidden_counts.get(channel_id, 0) + 1
+        self._forbidden_counts[channel_id] = refused
+        if refused >= self.forbidden_pause_threshold:
+            self.scheduler_service.pause_channel_job(
+                server_id, channel_id, PauseReason.FORBIDDEN
+            )
 
     async def _perform_message_deletion(
         self,
         channel: discord.TextChannel,
-        ignored_messages: Optional[Set[str]] = None,
-        ignored_users: Optional[Set[str]] = None,
+        ignore_filter: Optional[IgnoreFilter] = None,
+        result: Optional[ClearResult] = None,
+        plan: Optional[_ClearPlan] = None,
     ) -> int:
-        deleted_count = 0
-        ignored_messages = ignored_messages or set()
-        ignored_users = ignored_users or set()
+        ignore_filter = ignore_filter or IgnoreFilter()
+        if result is None:
+            result = ClearResult(
+                channel_id=str(channel.id), guild_id=str(channel.guild.id)
+            )
+        if plan is None:
+            plan = _ClearPlan(queue_pages=self.pipeline_queue_pages)
 
         try:
-            two_weeks_ago = discord.utils.utcnow() - timedelta(days=13)
+            started_at = self._clock()
+            # Bulk delete only accepts messages younger than 14 days, a day of
+            # margin keeps slow clears from crossing that line mid-run
+            bulk_cutoff = discord.Object(
+                id=discord.utils.time_snowflake(started_at - timedelta(days=13))
+            )
+            channel_id = str(channel.id)
 
-            messages_to_delete = []
-            old_messages = []
+            # History read ahead of a fixed-time clear only needs the messages
+            # posted since added to it
+            staged_messages: Sequence[RawMessage] = ()
+            history_start = bulk_cutoff
+            prestaged = self._take_prestaged(channel_id, started_at)
+            if prestaged is not None:
+                staged_messages = [
+                    message
+                    for message in prestaged.messages
+                    if message.id > bulk_cutoff.id
+                ]
+                history_start = discord.Object(
+                    id=max(prestaged.until_id, bulk_cutoff.id)
+                )
 
             try:
-                batch_size = 1000
-                last_message = None
-
-                while True:
-                    messages_batch = []
-
-                    # Retry fetching message history on network errors
-                    for attempt in range(3):
-                        try:
-                            async for message in channel.history(
-                                limit=batch_size, before=last_message
-                            ):
-                                messages_batch.append(message)
-                            break  # Success, exit retry loop
-                        except (ClientConnectorError, ClientPayloadError, TimeoutError):
-                            if attempt == 2:  # Last attempt
-                                raise
-                            delay = 2.0 * (2 ** attempt)
-                            await asyncio.sleep(delay)
-
-                    if not messages_batch:
-                        break
-
-                    for message in messages_batch:
-                        if str(message.id) in ignored_messages:
-                            continue
-
-                        if str(message.author.id) in ignored_users:
-                            continue
+                if ignore_filter.fetch_pinned:
+                    result.api_calls += 1
+                    ignore_filter = ignore_filter.with_pinned_messages(
+                        await fetch_pinned_message_ids(channel)
+                    )
 
-                        if message.created_at > two_weeks_ago:
-                            messages_to_delete.append(message)
-                        else:
-                            old_messages.append(message)
-
-                    if len(messages_batch) < batch_size:
-                        break
+                # Fast path: only the part of the history that can be bulk
+                # deleted, read oldest first from the cutoff
+                seen_ignored: Set[int] = set()
+                await self._run_deletion_pass(
+                    channel,
+                    ignore_filter,
+                    result,
+                    partial(
+                        self._consume_bulk_pages, concurrency=plan.bulk_concurrency
+                    ),
+                    staged_messages,
+                    page_size=plan.page_size,
+                    queue_pages=plan.queue_pages,
+                    seen_ignored=seen_ignored,
+                    after=history_start,
+                )
+                result.unseen_ignored_ids = ignore_filter.unseen_message_ids(
+                    seen_ignored, after_id=bulk_cutoff.id
+                )
 
-                    last_message = messages_batch[-1]
+                if self._needs_legacy_pass(channel_id, started_at):
+                    # Older messages cost one request each, which can take
+                    # hours, so they are queued for the shard's background
+                    # workers instead of holding up this run
+                    checkpoint = ClearCheckpoint(
+                        channel_id=channel_id,
+                        guild_id=str(channel.guild.id),
+                        before_id=bulk_cutoff.id,
+                        started_at=started_at,
+                        updated_at=started_at,
+                    )
+                    self.legacy_deletion.enqueue(channel, checkpoint, ignore_filter)
+                elif (
+                    result.outcome == ClearOutcome.COMPLETED
+                    and not result.rate_limited
+                    and self._is_legacy_clean(channel_id, started_at)
+                ):
+                    # Nothing was left behind the cutoff and this pass cleared
+                    # everything after it, so the channel is clean as of now
+                    # and the next 13 days of clears can skip old history too
+                    self._get_profile(channel).legacy_clean_at = started_at
+                    self._dirty_profiles.add(channel_id)
             except discord.NotFound:
                 logger.warning(
                     LogArea.DISCORD,
                     f"Channel {channel.id} not found (deleted or bot removed from server). Removing schedule.",
                 )
-                # Remove the schedule for this channel
-                server_id = str(channel.guild.id)
-                channel_id = str(channel.id)
-                self.scheduler_service.remove_channel_clear_job(server_id, channel_id)
-                # Remove from data service
-                server = await self.data_service.get_server(server_id)
-                if server and channel_id in server.channels:
-                    del server.channels[channel_id]
-                    await self.data_service.save_servers()
-                return 0
+                await self._drop_subscription(channel)
+                result.outcome = ClearOutcome.CHANNEL_UNAVAILABLE
+                result.error_message = "channel_not_found"
+                return result.deleted_count
             except discord.Forbidden:
                 logger.warning(
                     LogArea.PERMISSIONS,
-                    f"No permission to access channel history for channel {channel.id}. Removing schedule.",
+                    f"No permission to access channel history for channel {channel.id}.",
                 )
-                # Remove the schedule for this channel since we don't have permissions
-                server_id = str(channel.guild.id)
-                channel_id = str(channel.id)
-                self.scheduler_service.remove_channel_clear_job(server_id, channel_id)
-                # Remove from data service
-                server = await self.data_service.get_server(server_id)
-                if server and channel_id in server.channels:
-                    del server.channels[channel_id]
-                    await self.data_service.save_servers()
-                return 0
+                # Kept subscribed, permissions are usually given back
+                await self._on_clear_forbidden(channel)
+                result.outcome = ClearOutcome.CHANNEL_UNAVAILABLE
+                result.error_message = "forbidden"
+                return result.deleted_count
             except discord.DiscordServerError as e:
                 logger.warning(
                     LogArea.DISCORD,
-                    f"Discord API error (likely 503) for channel {channel.id}: {e}. Will retry on next scheduled run.",
+                    f"Discord API error (likely 503) for channel {channel.id}: {e}. Retry will be scheduled.",
                 )
-                return 0
-
-            if messages_to_delete:
-                for i in range(0, len(messages_to_delete), 100):
-                    batch = messages_to_delete[i : i + 100]
-                    try:
-                        await channel.delete_messages(batch)
-                        deleted_count += len(batch)
-                    except discord.HTTPException as e:
-                        logger.warning(
-                            LogArea.DISCORD,
-                            f"Bulk delete failed: {e}, falling back to individual deletion",
-                        )
-                        for msg in batch:
-                            try:
-                                await msg.delete()
-                                deleted_count += 1
-                                await asyncio.sleep(self.rate_limit_delay)
-                            except discord.HTTPException:
-                                pass
-
-            for message in old_messages:
-                try:
-                    await message.delete()
-                    deleted_count += 1
-                    await asyncio.sleep(self.rate_limit_delay)
-                except discord.HTTPException:
-                    pass
+                result.outcome = ClearOutcome.TRANSIENT_ERROR
+                result.error_message = str(e)
+                return result.deleted_count
 
         except Exception as e:
             error_id = await logger.log_error(
@@ -223,36 +506,933 @@ class MessageService:
                 LogArea.SCHEDULER,
                 f"Error clearing messages in channel {channel.id}. Error ID: {error_id}",
             )
+            result.outcome = ClearOutcome.FAILED
+            result.error_message = f"{type(e).__name__}: {e}"
 
-        return deleted_count
+        return result.deleted_count
 
-    async def _update_next_scheduled_clear_time(
-        self, channel: discord.TextChannel
-    ) -> None:
-        server_id = str(channel.guild.id)
+    def _needs_legacy_pass(self, channel_id: str, started_at: datetime) -> bool:
+        """Whether messages older than the bulk delete cutoff may need deleting
+
+        After a clear finished both passes, only messages posted since then can
+        be left, and those are still bulk deletable until 13 days later.
+        """
+        if not self.clear_legacy_messages or self.legacy_deletion.has_pending(
+            channel_id
+        ):
+            return False
+
+        return not self._is_legacy_clean(channel_id, started_at)
+
+    def _is_legacy_clean(self, channel_id: str, started_at: datetime) -> bool:
+        profile = self._profiles.get(channel_id)
+        return (
+            profile is not None
+            and profile.legacy_clean_at is not None
+            and profile.legacy_clean_at >= started_at - timedelta(days=13)
+        )
+
+    def _get_profile(self, channel: discord.abc.GuildChannel) -> ChannelClearProfile:
         channel_id = str(channel.id)
+        profile = self._profiles.get(channel_id)
+        if profile is None:
+            profile = ChannelClearProfile(
+                channel_id=channel_id, guild_id=str(channel.guild.id)
+            )
+            self._profiles[channel_id] = profile
+            self._deleted_profiles.discard(channel_id)
+        return profile
 
-        next_run_time = self.scheduler_service.get_channel_next_clear_time(
-            server_id, channel_id
+    def _forget_profile(self, channel_id: str) -> None:
+        if self._profiles.pop(channel_id, None) is not None:
+            self._dirty_profiles.discard(channel_id)
+            self._deleted_profiles.add(channel_id)
+
+    def _plan_clear(self, channel_id: str) -> _ClearPlan:
+        """Pick page size, read-ahead and bulk concurrency from past clears
+
+        Quiet channels read small pages and keep one page ahead, busy ones
+        read further ahead and overlap bulk deletes unless Discord pushed
+        back last time. A channel whose old history turned out to be a small
+        part of what gets deleted is not worth estimating for a recreate.
+        """
+        profile = self._profiles.get(channel_id)
+        if profile is None or not profile.clears:
+            return _ClearPlan(queue_pages=self.pipeline_queue_pages)
+
+        expected = profile.messages_per_clear
+        consider_recreate = (
+            profile.legacy_clean_at is None or profile.legacy_share >= 0.5
+        )
+        if expected < QUIET_CHANNEL_MESSAGES:
+            # Twice the usual count, so one page still covers most clears
+            return _ClearPlan(
+                queue_pages=1,
+                page_size=max(25, min(100, int(expected * 2))),
+                consider_recreate=consider_recreate,
+            )
+        if expected >= BUSY_CHANNEL_MESSAGES:
+            return _ClearPlan(
+                queue_pages=self.pipeline_queue_pages * 2,
+                bulk_concurrency=1 if profile.rate_limited else 2,
+                consider_recreate=consider_recreate,
+            )
+        return _ClearPlan(
+            queue_pages=self.pipeline_queue_pages,
+            consider_recreate=consider_recreate,
+        )
+
+    async def _run_deletion_pass(
+        self,
+        channel: discord.TextChannel,
+        ignore_filter: IgnoreFilter,
+        result: ClearResult,
+        consume: Callable[
+            [discord.TextChannel, asyncio.Queue, ClearResult], Awaitable[None]
+        ],
+        staged_messages: Sequence[RawMessage] = (),
+        page_size: int = 100,
+        queue_pages: Optional[int] = None,
+        seen_ignored: Optional[Set[int]] = None,
+        **history_range,
+    ) -> None:
+        # History pages are fetched into a small queue while earlier pages are
+        # being deleted, so memory stays bounded to a few pages
+        pages: asyncio.Queue = asyncio.Queue(
+            maxsize=queue_pages or self.pipeline_queue_pages
+        )
+        producer = asyncio.create_task(
+            self._produce_history_pages(
+                channel,
+                pages,
+                ignore_filter,
+                result,
+                history_range,
+                staged_messages,
+                page_size,
+                seen_ignored,
+            )
         )
 
-        if not next_run_time:
+        try:
+            await consume(channel, pages, result)
+        except BaseException:
+            producer.cancel()
+            raise
+        await producer
+
+    async def _produce_history_pages(
+        self,
+        channel: discord.TextChannel,
+        pages: asyncio.Queue,
+        ignore_filter: IgnoreFilter,
+        result: ClearResult,
+        history_range: Dict[str, discord.abc.Snowflake],
+        staged_messages: Sequence[RawMessage] = (),
+        page_size: int = 100,
+        seen_ignored: Optional[Set[int]] = None,
+    ) -> None:
+        """Fetch one range of history a page at a time and queue what should go
+
+        ``history_range`` is either ``after`` (read oldest first) or ``before``
+        (read newest first); the last message of each page becomes the next
+        cursor. ``staged_messages``, read ahead of time, are queued before
+        anything is fetched. Ignored messages come across are added to
+        ``seen_ignored``. ``None`` marks the end of the range, and is also
+        queued when fetching fails so the consumer never waits forever. A
+        cancelled producer queues nothing, its consumer is already gone.
+        """
+        (direction, cursor), = history_range.items()
+
+        try:
+            for start in range(0, len(staged_messages), page_size):
+                staged_page = staged_messages[start : start + page_size]
+                result.scanned_count += len(staged_page)
+                deletable = ignore_filter.deletable(staged_page, seen_ignored)
+                result.kept_count += len(staged_page) - len(deletable)
+                if deletable:
+                    await pages.put(deletable)
+
+            while True:
+                messages_page = []
+
+                # Retry fetching message history on network errors
+                for attempt in range(3):
+                    try:
+                        messages_page = await fetch_raw_history_page(
+                            channel, page_size, **{direction: cursor}
+                        )
+                        break  # Success, exit retry loop
+                    except (ClientConnectorError, ClientPayloadError, TimeoutError):
+                        if attempt == 2:  # Last attempt
+                            raise
+                        delay = 2.0 * (2 ** attempt)
+                        await self._sleep(delay)
+
+                result.api_calls += 1
+                result.pages_fetched += 1
+                result.scanned_count += len(messages_page)
+
+                if not messages_page:
+                    break
+
+                deletable = ignore_filter.deletable(messages_page, seen_ignored)
+                result.kept_count += len(messages_page) - len(deletable)
+                if deletable:
+                    # Blocks while the consumer is behind, which keeps at most
+                    # a few pages of messages alive at once
+                    await pages.put(deletable)
+
+                if len(messages_page) < page_size:
+                    break
+
+                cursor = messages_page[-1]
+        except asyncio.CancelledError:
+            # Only cancelled once the consumer stopped reading, a full queue
+            # would never make room for the end marker
+            raise
+        except BaseException:
+            await pages.put(None)
+            raise
+        await pages.put(None)
+
+    async def _consume_bulk_pages(
+        self,
+        channel: discord.TextChannel,
+        pages: asyncio.Queue,
+        result: ClearResult,
+        concurrency: int = 1,
+    ) -> None:
+        pending_bulk = []
+        in_flight: Set[asyncio.Task] = set()
+
+        async def submit(batch: List[RawMessage]) -> None:
+            if len(in_flight) >= concurrency:
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                in_flight.difference_update(done)
+                for task in done:
+                    task.result()
+            in_flight.add(
+                asyncio.create_task(
+                    self._bulk_delete_messages(channel, batch, result)
+                )
+            )
+
+        try:
+            while True:
+                page = await pages.get()
+                if page is None:
+                    break
+
+                pending_bulk.extend(page)
+                while len(pending_bulk) >= 100:
+                    await submit(pending_bulk[:100])
+                    del pending_bulk[:100]
+
+            if pending_bulk:
+                await submit(pending_bulk)
+            while in_flight:
+                await in_flight.pop()
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            raise
+
+    def _record_clear_run(
+        self, result: ClearResult, started_at: datetime, legacy: bool = False
+    ) -> None:
+        duration = (self._clock() - started_at).total_seconds()
+        self.clear_ledger.record(
+            ClearRunRecord.from_result(result, started_at, duration, legacy=legacy)
+        )
+
+    def _on_legacy_pass_finished(
+        self,
+        channel: discord.TextChannel,
+        checkpoint: ClearCheckpoint,
+        result: ClearResult,
+    ) -> None:
+        self._report_unseen_ignored(channel, result.unseen_ignored_ids)
+        self._record_clear_run(result, checkpoint.started_at, legacy=True)
+        profile = self._profiles.get(checkpoint.channel_id)
+        if profile is None:
+            profile = ChannelClearProfile(
+                channel_id=checkpoint.channel_id, guild_id=checkpoint.guild_id
+            )
+            self._profiles[checkpoint.channel_id] = profile
+        profile.record_legacy_pass(checkpoint.deleted_count, checkpoint.started_at)
+        self._dirty_profiles.add(checkpoint.channel_id)
+
+    async def prestage_clear(
+        self, channel: discord.TextChannel, fire_time: datetime
+    ) -> None:
+        """Read the bulk deletable history of a clear ahead of its fire time
+
+        The clear then only fetches what was posted after the staged ids.
+        Staged ids are capped across the shard, checked once per page, and
+        are thrown away unused once the fire time has passed by the lead
+        time, like when the run was skipped.
+        """
+        channel_id = str(channel.id)
+        self._drop_expired_prestages(self._clock())
+        self._prestaged.pop(channel_id, None)
+        if channel_id in self._running_clears:
+            return
+        if not await self._validate_bot_channel_permissions(channel):
+            return
+
+        ignore_filter = await self._get_ignore_filter(channel)
+        high_water_mark = self._high_water_marks.get(channel_id)
+        if high_water_mark and high_water_mark.covers(
+            channel.last_message_id, ignore_filter
+        ):
             return
 
+        budget = self.prestage_max_messages - sum(
+            len(prestaged.messages) for prestaged in self._prestaged.values()
+        )
+        cursor = discord.Object(
+            id=discord.utils.time_snowflake(fire_time - timedelta(days=13))
+        )
+        messages: List[RawMessage] = []
+        try:
+            while len(messages) < budget:
+                messages_page = await fetch_raw_history_page(
+                    channel, 100, after=cursor
+                )
+                if not messages_page:
+                    break
+                messages.extend(messages_page)
+                cursor = messages_page[-1]
+                if len(messages_page) < 100:
+                    break
+        except (
+            discord.HTTPException,
+            ClientConnectorError,
+            ClientPayloadError,
+            TimeoutError,
+        ) as e:
+            # The clear reads the whole range itself at fire time
+            logger.debug(
+                LogArea.DISCORD, f"Failed to pre-stage clear of channel {channel_id}: {e}"
+            )
+            return
+
+        self._prestaged[channel_id] = _PrestagedClear(
+            fire_time=fire_time, until_id=cursor.id, messages=messages
+        )
+
+    def _take_prestaged(
+        self, channel_id: str, started_at: datetime
+    ) -> Optional[_PrestagedClear]:
+        prestaged = self._prestaged.pop(channel_id, None)
+        if prestaged is None:
+            return None
+        # Staged for another run, or so early that the bulk delete cutoff
+        # has not reached the staged range yet
+        if not prestaged.fire_time <= started_at <= (
+            prestaged.fire_time + self.prestage_lead
+        ):
+            return None
+        return prestaged
+
+    def _drop_expired_prestages(self, now: datetime) -> None:
+        expired = [
+            channel_id
+            for channel_id, prestaged in self._prestaged.items()
+            if prestaged.fire_time + self.prestage_lead < now
+        ]
+        for channel_id in expired:
+            del self._prestaged[channel_id]
+
+    async def _is_channel_subscribed(self, server_id: str, channel_id: str) -> bool:
+        server = await self.data_service.get_server(server_id)
+        return server is not None and server.is_channel_cleared(channel_id)
+
+    async def _drop_subscription(self, channel: discord.TextChannel) -> None:
+        """Stop clearing a channel, on its own or as a member of a group"""
+        server_id = str(channel.guild.id)
+        channel_id = str(channel.id)
+        self.scheduler_service.remove_channel_clear_job(server_id, channel_id)
         server = await self.data_service.get_server(server_id)
         if server and channel_id in server.channels:
-            channel_timer = server.channels[channel_id]
-            channel_timer.next_run_time = next_run_time.astimezone(pytz.UTC)
+            del server.channels[channel_id]
+            await self.data_service.save_servers()
+        elif server:
+            group = server.get_channel_group(channel_id)
+            if group is not None:
+                await self.data_service.remove_group_member(
+                    server_id, group.name, channel_id
+                )
+                self.scheduler_service.forget_group_member(server_id, channel_id)
+        self._forget_profile(channel_id)
 
-            if channel_timer.view_message_id:
-                await self._update_view_message(
-                    channel,
-                    channel_timer.view_message_id,
-                    channel_timer.timer,
-                    next_run_time,
+    async def _recreate_estimate(
+        self,
+        channel: discord.TextChannel,
+        ignore_filter: IgnoreFilter,
+        result: ClearResult,
+    ) -> Optional[int]:
+        """Estimated old messages when replacing the channel beats deleting them
+
+        Only for subscriptions that opted in, and only when the messages too
+        old for bulk delete are estimated above the threshold; ``None``
+        otherwise. Messages of ignored users and pins cannot be carried
+        over, so those channels are always cleared.
+        """
+        server = await self.data_service.get_server(str(channel.guild.id))
+        channel_timer = server.get_channel(str(channel.id)) if server else None
+        if (
+            channel_timer is None
+            or not channel_timer.allow_recreate
+            or ignore_filter.user_ids
+            or ignore_filter.fetch_pinned
+        ):
+            return None
+
+        if not channel.permissions_for(channel.guild.me).manage_channels:
+            return None
+
+        started_at = self._clock()
+        if not self._needs_legacy_pass(str(channel.id), started_at):
+            return None
+
+        try:
+            estimate = await self._estimate_legacy_messages(
+                channel, started_at - timedelta(days=13), result
+            )
+        except discord.HTTPException:
+            # The regular clear reports whatever is wrong with the channel
+            return None
+        return estimate if estimate >= self.recreate_threshold else None
+
+    async def _estimate_legacy_messages(
+        self, channel: discord.TextChannel, before: datetime, result: ClearResult
+    ) -> int:
+        """Estimate the messages older than ``before`` from two history pages
+
+        Reads the newest and the oldest page of that range and assumes the
+        time in between was as busy as both ends together.
+        """
+        cutoff = discord.Object(id=discord.utils.time_snowflake(before))
+        newest = await fetch_raw_history_page(channel, 100, before=cutoff)
+        result.api_calls += 1
+        result.pages_fetched += 1
+        if len(newest) < 100:
+            return len(newest)
+
+        oldest = await fetch_raw_history_page(
+            channel, 100, after=discord.Object(id=channel.id)
+        )
+        result.api_calls += 1
+        result.pages_fetched += 1
+        if oldest[-1].id >= newest[-1].id:
+            # The pages meet, so between them they hold every old message
+            return len({message.id for message in newest + oldest})
+
+        sampled = len(newest) + len(oldest)
+        sampled_seconds = (before - newest[-1].created_at).total_seconds() + (
+            oldest[-1].created_at - oldest[0].created_at
+        ).total_seconds()
+        total_seconds = (before - oldest[0].created_at).total_seconds()
+        return max(sampled, int(sampled * total_seconds / max(sampled_seconds, 1.0)))
+
+    async def _recreate_channel(
+        self, channel: discord.TextChannel, result: ClearResult
+    ) -> bool:
+        """Replace the channel with an empty clone and move the subscription
+
+        Ignored messages are re-posted by the bot and the timer view message
+        is posted again. The subscription and its job move to the clone
+        before the old channel is deleted, and move back if that fails.
+        Returns ``False`` when the channel was left as it was.
+        """
+        server_id = str(channel.guild.id)
+        channel_id = str(channel.id)
+        server = await self.data_service.get_server(server_id)
+        channel_timer = server.get_channel(channel_id) if server else None
+        if channel_timer is None:
+            return False
+
+        reason = "Scheduled clear: recreating the channel to drop its history"
+
+        # Read everything that should survive before changing anything
+        kept_messages = []
+        for message_id in sorted(channel_timer.ignored.messages):
+            try:
+                kept_messages.append(await channel.fetch_message(message_id))
+            except discord.NotFound:
+                continue
+            except discord.HTTPException as e:
+                logger.warning(
+                    LogArea.DISCORD,
+                    f"Not recreating channel {channel_id}: could not read kept message {message_id}: {e}",
                 )
+                return False
 
-            await self.data_service.save_servers()
+        try:
+            new_channel = await channel.clone(reason=reason)
+        except discord.HTTPException as e:
+            logger.warning(
+                LogArea.DISCORD, f"Failed to clone channel {channel_id}: {e}"
+            )
+            return False
+
+        new_channel_id = str(new_channel.id)
+        message_ids: Dict[str, str] = {}
+        moved = False
+        try:
+            # clone() copies topic, permissions and category but not the position
+            await new_channel.edit(position=channel.position, reason=reason)
+
+            lost_count = 0
+            for message in kept_messages:
+                try:
+                    copy = await new_channel.send(
+                        content=message.content or None,
+                        embeds=message.embeds,
+                        files=[
+                            await attachment.to_file()
+                            for attachment in message.attachments
+                        ],
+                        allowed_mentions=discord.AllowedMentions.none(),
+                    )
+                    message_ids[str(message.id)] = str(copy.id)
+                except discord.HTTPException:
+                    lost_count += 1
+            lost_count += len(channel_timer.ignored.messages) - len(kept_messages)
+
+            from src.components.subscription import (
+                RecreatedChannelNoticeView,
+                TimerViewMessage,
+            )
+            from src.localization import get_translator
+
+            translator = await get_translator(server_id, self.data_service)
+            next_run_time = self.scheduler_service.get_channel_next_clear_time(
+                server_id, channel_id
+            )
+            if channel_timer.view_message_id and next_run_time:
+                view_message = await new_channel.send(
+                    view=TimerViewMessage(
+                        new_channel, channel_timer.timer, next_run_time, translator
+                    )
+                )
+                message_ids[channel_timer.view_message_id] = str(view_message.id)
+            if lost_count:
+                await new_channel.send(
+                    view=RecreatedChannelNoticeView(lost_count, translator)
+                )
+
+            # Moved before deleting, so the channel delete event finds nothing
+            # left to unsubscribe
+            if not await self.data_service.move_channel_subscription(
+                server_id, channel_id, new_channel_id, message_ids
+            ):
+                raise LookupError(f"Channel {channel_id} was unsubscribed")
+            moved = True
+            self.scheduler_service.move_channel_clear_job(
+                server_id, channel_id, new_channel
+            )
+
+            await channel.delete(reason=reason)
+        except Exception as e:
+            logger.warning(
+                LogArea.DISCORD,
+                f"Failed to recreate channel {channel_id}, clearing it instead: {e}",
+            )
+            if moved:
+                await self.data_service.move_channel_subscription(
+                    server_id,
+                    new_channel_id,
+                    channel_id,
+                    {new: old for old, new in message_ids.items()},
+                )
+                self.scheduler_service.move_channel_clear_job(
+                    server_id, new_channel_id, channel
+                )
+            try:
+                await new_channel.delete(reason=reason)
+            except discord.HTTPException:
+                pass
+            return False
+
+        # The clone holds nothing a legacy pass would have to delete
+        profile = self._get_profile(channel)
+        self._forget_profile(channel_id)
+        profile.channel_id = new_channel_id
+        profile.legacy_clean_at = self._clock()
+        self._profiles[new_channel_id] = profile
+        self._dirty_profiles.add(new_channel_id)
+        result.recreated_channel_id = new_channel_id
+        logger.info(
+            LogArea.SCHEDULER,
+            f"Recreated channel {channel_id} as {new_channel_id} in server {server_id}",
+        )
+        return True
+
+    async def resume_checkpointed_clears(self) -> None:
+        """Restart the legacy passes a previous run of this shard left unfinished"""
+        for checkpoint in await self.data_service.get_clear_checkpoints():
+            self.legacy_deletion.mark_stored(checkpoint.channel_id)
+            guild = self.bot.get_guild(int(checkpoint.guild_id))
+            if guild is None:
+                # Belongs to another shard
+                continue
+
+            channel = guild.get_channel(int(checkpoint.channel_id))
+            if channel is None or not await self._is_channel_subscribed(
+                checkpoint.guild_id, checkpoint.channel_id
+            ):
+                await self.legacy_deletion.discard(checkpoint.channel_id)
+                continue
+
+            ignore_filter = await self._get_ignore_filter(channel)
+            self.legacy_deletion.enqueue(channel, checkpoint, ignore_filter)
+            logger.info(
+                LogArea.SCHEDULER,
+                f"Resuming clear of older messages in channel {checkpoint.channel_id} ({checkpoint.deleted_count} deleted so far)",
+            )
+
+    def schedule_maintenance_jobs(self) -> None:
+        """Save clear profiles and runs and compact ignored ids in the background"""
+        self.scheduler_service.scheduler.add_job(
+            self.save_channel_profiles,
+            "interval",
+            seconds=self.profile_flush_interval,
+            id="save_channel_profiles",
+            replace_existing=True,
+        )
+        self.scheduler_service.scheduler.add_job(
+            self.clear_ledger.flush,
+            "interval",
+            seconds=self.clear_ledger.flush_interval,
+            id="flush_clear_ledger",
+            replace_existing=True,
+        )
+        self.scheduler_service.scheduler.add_job(
+            self.compact_ignored_messages,
+            "interval",
+            seconds=self.ignored_compaction_interval,
+            id="compact_ignored_messages",
+            replace_existing=True,
+        )
+
+    def _report_unseen_ignored(
+        self, channel: discord.TextChannel, message_ids: List[int]
+    ) -> None:
+        if not message_ids:
+            return
+        channel_id = str(channel.id)
+        stale = self._stale_ignored.get(channel_id)
+        if stale is None:
+            self._stale_ignored[channel_id] = _StaleIgnoredMessages(
+                channel=channel, message_ids=set(message_ids)
+            )
+        else:
+            stale.channel = channel
+            stale.message_ids.update(message_ids)
+
+    async def compact_ignored_messages(self) -> None:
+        """Drop ignored ids that clears no longer found and Discord confirms gone
+
+        A scan can miss a message for reasons other than its deletion, so every
+        id is looked up once more before it goes, a batch per run at a slow
+        pace. Ids that still exist are forgotten until a scan misses them again.
+        """
+        budget = self.ignored_compaction_batch
+        removed_count = present_count = channel_count = 0
+
+        for channel_id in list(self._stale_ignored):
+            if budget <= 0:
+                break
+            stale = self._stale_ignored[channel_id]
+            server_id = str(stale.channel.guild.id)
+            server = await self.data_service.get_server(server_id)
+            ignore_rules = server.get_ignore_rules(channel_id) if server else None
+            if ignore_rules is None:
+                del self._stale_ignored[channel_id]
+                continue
+
+            # Un-ignored meanwhile, or the timer view message
+            stale.message_ids &= ignore_rules.ignored.messages
+            missing: Set[int] = set()
+            for message_id in sorted(stale.message_ids)[:budget]:
+                budget -= 1
+                await self._sleep(1.0 / self.ignored_compaction_rate)
+                try:
+                    await stale.channel.fetch_message(message_id)
+                    present_count += 1
+                except discord.HTTPException as e:
+                    # Only Unknown Message, a deleted channel is a 404 too
+                    if e.code == 10008:
+                        missing.add(message_id)
+                        stale.message_ids.discard(message_id)
+                        continue
+                    logger.debug(
+                        LogArea.DISCORD,
+                        f"Could not check ignored message {message_id} in channel {channel_id}: {e}",
+                    )
+                    break
+                stale.message_ids.discard(message_id)
+
+            if missing:
+                removed = await self.data_service.remove_ignored_messages(
+                    server_id, channel_id, missing
+                )
+                removed_count += removed
+                channel_count += 1
+            if not stale.message_ids:
+                del self._stale_ignored[channel_id]
+
+        if removed_count or present_count:
+            pending_count = sum(
+                len(stale.message_ids) for stale in self._stale_ignored.values()
+            )
+            logger.info(
+                LogArea.DATABASE,
+                f"Compacted ignored messages: {removed_count} stale ids removed from {channel_count} channels, {present_count} still exist, {pending_count} left to check",
+            )
+
+    async def load_channel_profiles(self) -> None:
+        """Load the clear profiles of this shard's channels"""
+        for profile in await self.data_service.get_channel_profiles():
+            if self.bot.get_guild(int(profile.guild_id)) is None:
+                # Belongs to another shard
+                continue
+
+            if await self._is_channel_subscribed(profile.guild_id, profile.channel_id):
+                self._profiles[profile.channel_id] = profile
+            else:
+                self._deleted_profiles.add(profile.channel_id)
+
+    async def save_channel_profiles(self) -> None:
+        """Write the profiles changed since the last save in one request"""
+        if not self._dirty_profiles and not self._deleted_profiles:
+            return
+
+        profiles = [
+            self._profiles[channel_id]
+            for channel_id in self._dirty_profiles
+            if channel_id in self._profiles
+        ]
+        deleted_channel_ids = list(self._deleted_profiles)
+        self._dirty_profiles.clear()
+        self._deleted_profiles.clear()
+        try:
+            await self.data_service.save_channel_profiles(
+                profiles, deleted_channel_ids
+            )
+        except Exception as e:
+            # Kept for the next save, the profiles are only a tuning aid
+            self._dirty_profiles.update(profile.channel_id for profile in profiles)
+            self._deleted_profiles.update(deleted_channel_ids)
+            logger.warning(LogArea.DATABASE, f"Failed to save clear profiles: {e}")
+
+    def get_channel_profile(self, channel_id: str) -> Optional[ChannelClearProfile]:
+        return self._profiles.get(channel_id)
+
+    async def wait_for_legacy_pass(self, channel_id: str) -> Optional[ClearResult]:
+        """Wait for a channel's queued legacy pass, if one is running"""
+        return await self.legacy_deletion.wait_for_channel(channel_id)
+
+    async def stop_legacy_passes(self) -> None:
+        """Stop the legacy deletion workers, keeping checkpoints for later"""
+        await self.legacy_deletion.stop()
+
+    def get_legacy_progress(self, channel_id: str) -> Optional[ClearCheckpoint]:
+        return self.legacy_deletion.get_progress(channel_id)
+
+    async def _bulk_delete_messages(
+        self,
+        channel: discord.TextChannel,
+        batch: List[RawMessage],
+        result: ClearResult,
+    ) -> None:
+        try:
+            result.api_calls += 1
+            await channel.delete_messages(
+                [discord.Object(id=message.id) for message in batch]
+            )
+            result.deleted_count += len(batch)
+            result.bulk_deleted_count += len(batch)
+        except discord.DiscordServerError:
+            raise
+        except discord.HTTPException as e:
+            self._record_bulk_delete_failure(channel, e, result)
+            if e.status != 400:
+                # Not about particular messages, splitting would not help
+                await self._delete_messages_individually(channel, batch, result)
+                return
+
+            rejected = await self._isolate_rejected_messages(channel, batch, result)
+            await self._delete_messages_individually(channel, rejected, result)
+
+    async def _isolate_rejected_messages(
+        self,
+        channel: discord.TextChannel,
+        batch: List[RawMessage],
+        result: ClearResult,
+    ) -> List[RawMessage]:
+        """Bulk delete the halves of a rejected batch, returning what still fails
+
+        A request fails as a whole when any one message cannot be bulk deleted,
+        so a few bad ids only cost a few bulk calls per halving step instead of
+        a single delete for every message of the batch.
+        """
+        if len(batch) <= 2:
+            return list(batch)
+
+        middle = len(batch) // 2
+        halves = await asyncio.gather(
+            self._bulk_delete_half(channel, batch[:middle], result),
+            self._bulk_delete_half(channel, batch[middle:], result),
+        )
+        return halves[0] + halves[1]
+
+    async def _bulk_delete_half(
+        self,
+        channel: discord.TextChannel,
+        half: List[RawMessage],
+        result: ClearResult,
+    ) -> List[RawMessage]:
+        try:
+            result.api_calls += 1
+            await channel.delete_messages(
+                [discord.Object(id=message.id) for message in half]
+            )
+            result.deleted_count += len(half)
+            result.bulk_deleted_count += len(half)
+            return []
+        except discord.DiscordServerError:
+            raise
+        except discord.HTTPException as e:
+            if e.status != 400:
+                return list(half)
+            return await self._isolate_rejected_messages(channel, half, result)
+
+    def _record_bulk_delete_failure(
+        self,
+        channel: discord.TextChannel,
+        error: discord.HTTPException,
+        result: ClearResult,
+    ) -> None:
+        reason = f"{error.status}/{error.code}"
+        self._bulk_delete_failures[reason] = (
+            self._bulk_delete_failures.get(reason, 0) + 1
+        )
+        result.bulk_delete_failures += 1
+        logger.warning(
+            LogArea.DISCORD,
+            f"Bulk delete failed in channel {channel.id} ({reason}): {error.text}",
+        )
+
+    def get_bulk_delete_failures(self) -> Dict[str, int]:
+        """Rejected bulk deletes since startup, by HTTP status and error code"""
+        return dict(self._bulk_delete_failures)
+
+    async def _delete_messages_individually(
+        self,
+        channel: discord.TextChannel,
+        messages: List[RawMessage],
+        result: ClearResult,
+    ) -> None:
+        # One at a time, all of them share the channel's delete bucket and a
+        # burst would only come back as 429s
+        for message in messages:
+            await self._delete_single_message(channel, message, result)
+
+    async def _delete_single_message(
+        self,
+        channel: discord.TextChannel,
+        message: RawMessage,
+        result: ClearResult,
+    ) -> None:
+        """Delete one message, retrying it when Discord pushes back
+
+        A 429 is retried once the limiter waited out its retry-after, a server
+        error after a short backoff. A message that still fails marks the
+        clear for a retry instead of letting it report as completed.
+        """
+        # Paced per guild so concurrent clears in one server share a budget
+        bucket_key = str(channel.guild.id)
+        route = Route(
+            "DELETE",
+            "/channels/{channel_id}/messages/{message_id}",
+            channel_id=channel.id,
+            message_id=0,
+        )
+
+        error: Optional[Exception] = None
+        for attempt in range(3):
+            await self._delete_limiter.acquire(bucket_key)
+            try:
+                result.api_calls += 1
+                await channel.get_partial_message(message.id).delete()
+                result.deleted_count += 1
+                result.single_deleted_count += 1
+                self._delete_limiter.record_success(
+                    bucket_key, read_bucket_state(channel._state.http, route)
+                )
+                return
+            except discord.RateLimited as e:
+                result.rate_limited += 1
+                self._delete_limiter.record_rate_limited(bucket_key, e.retry_after)
+                error = e
+            except discord.NotFound:
+                # Already gone, which is what we wanted
+                return
+            except discord.Forbidden:
+                # Lost access to the channel, handled like any other
+                # permission error of the clear
+                raise
+            except discord.HTTPException as e:
+                error = e
+                if e.status == 429:
+                    result.rate_limited += 1
+                    retry_after = float(e.response.headers.get("Retry-After", 1.0))
+                    self._delete_limiter.record_rate_limited(bucket_key, retry_after)
+                elif e.status < 500:
+                    # Rejected for this message alone, asking again won't help
+                    logger.warning(
+                        LogArea.DISCORD,
+                        f"Failed to delete message {message.id} in channel {channel.id}: {e}",
+                    )
+                    return
+                elif attempt < 2:
+                    await self._sleep(2.0 * (2 ** attempt))
+
+        logger.warning(
+            LogArea.DISCORD,
+            f"Failed to delete message {message.id} in channel {channel.id}: {error}",
+        )
+        result.outcome = ClearOutcome.TRANSIENT_ERROR
+        result.error_message = str(error)
+
+    async def _refresh_timer_view_message(self, channel: discord.TextChannel) -> None:
+        server_id = str(channel.guild.id)
+        channel_id = str(channel.id)
+
+        server = await self.data_service.get_server(server_id)
+        if not server or channel_id not in server.channels:
+            return
+
+        channel_timer = server.channels[channel_id]
+        if not channel_timer.view_message_id:
+            return
+
+        next_run_time = self.scheduler_service.get_channel_next_clear_time(
+            server_id, channel_id
+        )
+        if next_run_time:
+            await self._update_view_message(
+                channel,
+                channel_timer.view_message_id,
+                channel_timer.timer,
+                next_run_time,
+            )
 
     async def _update_view_message(
         self,
@@ -278,7 +1458,7 @@ class MessageService:
                         if attempt == 2:
                             raise
                         delay = 2.0 * (2 ** attempt)
-                        await asyncio.sleep(delay)
+                        await self._sleep(delay)
             from src.components.subscription import TimerViewMessage
             from src.localization import get_translator
 
@@ -295,7 +1475,7 @@ class MessageService:
                     if attempt == 2:
                         raise
                     delay = 2.0 * (2 ** attempt)
-                    await asyncio.sleep(delay)
+                    await self._sleep(delay)
         except discord.NotFound:
             server_id = str(channel.guild.id)
             channel_id = str(channel.id)
@@ -3,7 +3,22 @@ import asyncio
 import discord
 from datetime import datetime, timezone, timedelta
 
-from src.models import Server, BlacklistEntry, RemovedServer, BotConfigDocument
+from pymongo import DeleteOne, ReplaceOne, UpdateOne
+from pymongo.errors import CollectionInvalid
+
+from src.models import (
+    ChannelClearProfile,
+    ChannelGroup,
+    Server,
+    ChannelTimer,
+    BlacklistEntry,
+    RemovedServer,
+    BotConfigDocument,
+    ClearCheckpoint,
+    ClearOutcome,
+    ClearRunRecord,
+    CollectionName,
+)
 from src.services.database_connection_manager import db_manager
 from src.services.cache_manager import MultiLevelCache
 from src.utils.logger import logger, LogArea
@@ -211,6 +226,252 @@ class DataService:
             )
             return True
 
+    async def move_channel_subscription(
+        self,
+        server_id: str,
+        old_channel_id: str,
+        new_channel_id: str,
+        message_ids: Dict[str, str],
+    ) -> Optional[ChannelTimer]:
+        """Move a subscription to another channel in one document update
+
+        ``message_ids`` maps the kept messages of the old channel to their
+        copies in the new one; ignored messages without a copy are dropped.
+        """
+        async with self._lock:
+            server = self._servers_cache.get(server_id)
+            if not server or old_channel_id not in server.channels:
+                return None
+
+            channel_timer = server.channels[old_channel_id]
+            moved = ChannelTimer.from_dict(new_channel_id, channel_timer.to_dict())
+            moved.ignored.messages = {
+                int(message_ids[str(message_id)])
+                for message_id in channel_timer.ignored.messages
+                if str(message_id) in message_ids
+            }
+            moved.view_message_id = message_ids.get(channel_timer.view_message_id)
+
+            await self._write_channel_move(
+                server_id, old_channel_id, new_channel_id, moved
+            )
+
+            del server.channels[old_channel_id]
+            server.channels[new_channel_id] = moved
+
+            cache_key = f"server:{server_id}"
+            await self._cache.invalidate(cache_key)
+
+            logger.debug(
+                LogArea.DATABASE,
+                f"Moved subscription of channel {old_channel_id} to {new_channel_id} in server {server_id}",
+            )
+            return moved
+
+    async def _write_channel_move(
+        self,
+        server_id: str,
+        old_channel_id: str,
+        new_channel_id: str,
+        channel_timer: ChannelTimer,
+    ) -> None:
+        servers_collection = db_manager.servers
+        await servers_collection.update_one(
+            {"_id": server_id},
+            {
+                "$set": {f"channels.{new_channel_id}": channel_timer.to_dict()},
+                "$unset": {f"channels.{old_channel_id}": ""},
+            },
+        )
+
+    async def apply_channel_subscriptions(
+        self,
+        server_id: str,
+        channel_timers: List[ChannelTimer],
+        removed_channel_ids: List[str],
+    ) -> bool:
+        """Store and remove several subscriptions of a server in one document update"""
+        async with self._lock:
+            server = self._servers_cache.get(server_id)
+            if not server:
+                return False
+
+            update: Dict[str, Any] = {}
+            if channel_timers:
+                update["$set"] = {
+                    f"channels.{channel_timer.channel_id}": channel_timer.to_dict()
+                    for channel_timer in channel_timers
+                }
+            if removed_channel_ids:
+                update["$unset"] = {
+                    f"channels.{channel_id}": "" for channel_id in removed_channel_ids
+                }
+            if not update:
+                return False
+
+            await self._write_channel_batch(server_id, update)
+
+            for channel_timer in channel_timers:
+                server.channels[channel_timer.channel_id] = channel_timer
+            for channel_id in removed_channel_ids:
+                server.remove_channel(channel_id)
+
+            cache_key = f"server:{server_id}"
+            await self._cache.invalidate(cache_key)
+
+            logger.debug(
+                LogArea.DATABASE,
+                f"Stored {len(channel_timers)} and removed {len(removed_channel_ids)} subscriptions in server {server_id}",
+            )
+            return True
+
+    async def _write_channel_batch(self, server_id: str, update: Dict[str, Any]) -> None:
+        servers_collection = db_manager.servers
+        await servers_collection.update_one({"_id": server_id}, update)
+
+    async def save_schedule_anchors(
+        self, anchors: Dict[str, Dict[str, datetime]]
+    ) -> None:
+        """Write new anchor times of several servers in one request
+
+        ``anchors`` maps server ids to the anchor time of each schedule, keyed
+        by the schedule's path in the server document.
+        """
+        operations = [
+            UpdateOne(
+                {"_id": server_id},
+                {
+                    "$set": {
+                        f"{schedule_path}.anchor_time": anchor_time.isoformat()
+                        for schedule_path, anchor_time in schedules.items()
+                    }
+                },
+            )
+            for server_id, schedules in anchors.items()
+            if schedules
+        ]
+        if not operations:
+            return
+
+        servers_collection = db_manager.servers
+        await servers_collection.bulk_write(operations, ordered=False)
+
+        for server_id in anchors:
+            cache_key = f"server:{server_id}"
+            await self._cache.invalidate(cache_key)
+
+    async def remove_ignored_messages(
+        self, server_id: str, channel_id: str, message_ids: Set[int]
+    ) -> int:
+        """Drop ignored message ids from a subscription in one document update"""
+        async with self._lock:
+            server = self._servers_cache.get(server_id)
+            ignore_rules = server.get_ignore_rules(channel_id) if server else None
+            if ignore_rules is None:
+                return 0
+
+            removed = ignore_rules.ignored.messages & message_ids
+            if not removed:
+                return 0
+
+            await self._write_ignored_removal(
+                server_id, server.get_ignore_rules_path(channel_id), removed
+            )
+            ignore_rules.ignored.messages -= removed
+
+            cache_key = f"server:{server_id}"
+            await self._cache.invalidate(cache_key)
+            return len(removed)
+
+    async def _write_ignored_removal(
+        self, server_id: str, rules_path: str, message_ids: Set[int]
+    ) -> None:
+        servers_collection = db_manager.servers
+        await servers_collection.update_one(
+            {"_id": server_id},
+            {
+                "$pull": {
+                    f"{rules_path}.ignored.messages": {
+                        "$in": [str(message_id) for message_id in message_ids]
+                    }
+                }
+            },
+        )
+
+    async def remove_group_subscription(
+        self, server_id: str, name: str
+    ) -> Optional[ChannelGroup]:
+        """Remove a group subscription from a server"""
+        async with self._lock:
+            server = self._servers_cache.get(server_id)
+            group = server.get_group(name) if server else None
+            if group is None:
+                return None
+
+            await self._write_group_change(
+                server_id, {"$unset": {f"groups.{name}": ""}}
+            )
+            server.remove_group(name)
+
+            cache_key = f"server:{server_id}"
+            await self._cache.invalidate(cache_key)
+            return group
+
+    async def add_group_member(self, server_id: str, name: str, channel_id: str) -> bool:
+        """Add a channel to a group subscription in one document update"""
+        async with self._lock:
+            server = self._servers_cache.get(server_id)
+            group = server.get_group(name) if server else None
+            # A channel already in a group, this one or another, stays there
+            if group is None or server.get_member_group(channel_id) is not None:
+                return False
+            group.add_member(channel_id)
+
+            await self._write_group_change(
+                server_id,
+                {
+                    "$set": {
+                        f"groups.{name}.members.{channel_id}": group.members[
+                            channel_id
+                        ].to_dict()
+                    }
+                },
+            )
+
+            cache_key = f"server:{server_id}"
+            await self._cache.invalidate(cache_key)
+            logger.debug(
+                LogArea.DATABASE,
+                f"Added channel {channel_id} to group {name} in server {server_id}",
+            )
+            return True
+
+    async def remove_group_member(
+        self, server_id: str, name: str, channel_id: str
+    ) -> bool:
+        """Drop a channel and its ignore lists from a group subscription"""
+        async with self._lock:
+            server = self._servers_cache.get(server_id)
+            group = server.get_group(name) if server else None
+            if group is None or not group.remove_member(channel_id):
+                return False
+
+            await self._write_group_change(
+                server_id, {"$unset": {f"groups.{name}.members.{channel_id}": ""}}
+            )
+
+            cache_key = f"server:{server_id}"
+            await self._cache.invalidate(cache_key)
+            logger.debug(
+                LogArea.DATABASE,
+                f"Removed channel {channel_id} from group {name} in server {server_id}",
+            )
+            return True
+
+    async def _write_group_change(self, server_id: str, update: Dict[str, Any]) -> None:
+        servers_collection = db_manager.servers
+        await servers_collection.update_one({"_id": server_id}, update)
+
     async def get_all_servers(self) -> Dict[str, Server]:
         async with self._lock:
             return self._servers_cache.copy()
@@ -470,6 +731,146 @@ class DataService:
             {"_id": "bot_config"}, config_data, upsert=True
         )
 
+    async def get_scheduler_heartbeat(self, shard_key: str) -> Optional[datetime]:
+        """Last time the scheduler for this shard was known to be running"""
+        config_collection = db_manager.config
+        heartbeat_doc = await config_collection.find_one(
+            {"_id": f"scheduler_heartbeat:{shard_key}"}
+        )
+        if heartbeat_doc and heartbeat_doc.get("last_seen"):
+            return datetime.fromisoformat(heartbeat_doc["last_seen"])
+        return None
+
+    async def save_scheduler_heartbeat(self, shard_key: str, moment: datetime) -> None:
+        """Record that the scheduler for this shard is running"""
+        config_collection = db_manager.config
+        await config_collection.replace_one(
+            {"_id": f"scheduler_heartbeat:{shard_key}"},
+            {"last_seen": moment.isoformat()},
+            upsert=True,
+        )
+
+    async def get_clear_checkpoints(self) -> List[ClearCheckpoint]:
+        """All legacy passes that were interrupted before finishing"""
+        checkpoints_collection = db_manager.clear_checkpoints
+        return [
+            ClearCheckpoint.from_dict(checkpoint_doc)
+            async for checkpoint_doc in checkpoints_collection.find()
+        ]
+
+    async def save_clear_checkpoint(self, checkpoint: ClearCheckpoint) -> None:
+        checkpoints_collection = db_manager.clear_checkpoints
+        await checkpoints_collection.replace_one(
+            {"_id": checkpoint.channel_id}, checkpoint.to_dict(), upsert=True
+        )
+
+    async def delete_clear_checkpoint(self, channel_id: str) -> None:
+        checkpoints_collection = db_manager.clear_checkpoints
+        await checkpoints_collection.delete_one({"_id": channel_id})
+
+    async def get_channel_profiles(self) -> List[ChannelClearProfile]:
+        profiles_collection = db_manager.channel_profiles
+        return [
+            ChannelClearProfile.from_dict(profile_doc)
+            async for profile_doc in profiles_collection.find()
+        ]
+
+    async def save_channel_profiles(
+        self, profiles: List[ChannelClearProfile], deleted_channel_ids: List[str]
+    ) -> None:
+        """Write changed clear profiles and drop removed ones in one request"""
+        operations = [
+            ReplaceOne({"_id": profile.channel_id}, profile.to_dict(), upsert=True)
+            for profile in profiles
+        ]
+        operations.extend(
+            DeleteOne({"_id": channel_id}) for channel_id in deleted_channel_ids
+        )
+        if operations:
+            profiles_collection = db_manager.channel_profiles
+            await profiles_collection.bulk_write(operations, ordered=False)
+
+    async def ensure_clear_ledger(self, retention_seconds: int) -> None:
+        """Create the time-series collection clear runs are recorded in
+
+        Expired runs are removed by MongoDB itself.
+        """
+        collection_name = CollectionName.CLEAR_LEDGER.value
+        existing = await db_manager.db.list_collection_names(
+            filter={"name": collection_name}
+        )
+        if existing:
+            return
+
+        try:
+            await db_manager.db.create_collection(
+                collection_name,
+                timeseries={
+                    "timeField": "started_at",
+                    "metaField": "channel",
+                    "granularity": "minutes",
+                },
+                expireAfterSeconds=retention_seconds,
+            )
+        except CollectionInvalid:
+            # Another shard created it first
+            pass
+
+    async def save_clear_runs(self, records: List[ClearRunRecord]) -> None:
+        if records:
+            ledger_collection = db_manager.clear_ledger
+            await ledger_collection.insert_many(
+                [record.to_dict() for record in records], ordered=False
+            )
+
+    async def summarize_clear_runs(
+        self, since: datetime, guild_id: Optional[str] = None, limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Totals of the recorded clear runs per channel, longest running first
+
+        Grouped by the database, so only one document per channel comes back.
+        """
+        match: Dict[str, Any] = {"started_at": {"$gte": since}}
+        if guild_id:
+            match["channel.guild_id"] = guild_id
+        failed_outcomes = [
+            ClearOutcome.FAILED.value,
+            ClearOutcome.TRANSIENT_ERROR.value,
+            ClearOutcome.CHANNEL_UNAVAILABLE.value,
+        ]
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": "$channel",
+                    "runs": {"$sum": 1},
+                    "total_seconds": {"$sum": "$duration_seconds"},
+                    "max_seconds": {"$max": "$duration_seconds"},
+                    "scanned": {"$sum": "$scanned_count"},
+                    "bulk_deleted": {"$sum": "$bulk_deleted_count"},
+                    "single_deleted": {"$sum": "$single_deleted_count"},
+                    "kept": {"$sum": "$kept_count"},
+                    "rate_limited": {"$sum": "$rate_limited"},
+                    "failed": {
+                        "$sum": {
+                            "$cond": [{"$in": ["$outcome", failed_outcomes]}, 1, 0]
+                        }
+                    },
+                }
+            },
+            {"$sort": {"total_seconds": -1}},
+            {"$limit": limit},
+        ]
+
+        ledger_collection = db_manager.clear_ledger
+        summaries = []
+        async for summary in ledger_collection.aggregate(pipeline):
+            channel = summary.pop("_id")
+            summary["guild_id"] = channel["guild_id"]
+            summary["channel_id"] = channel["channel_id"]
+            summaries.append(summary)
+        return summaries
+
     async def is_admin(self, user_id: str) -> bool:
         """Check if a user is an admin (uses cache)"""
         return user_id in self._admins_cache
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from src.models import Server
+from src.services.server_data_service import DataService
+from src.services.clear_job_scheduler_service import SchedulerService
+from src.utils.schedule_parser import SERVER_TIMEZONE
+from src.utils.logger import logger, LogArea
+from src.config import get_global_config
+
+
+class TimezoneRescheduleService:
+    """Moves fixed-time jobs onto changed timezones without a restart
+
+    Server timezones and timezone mappings only count when a trigger is
+    built, so existing jobs keep their old zone until they are rebuilt here.
+    """
+
+    def __init__(
+        self,
+        data_service: DataService,
+        scheduler_service: SchedulerService,
+        refresh_view: Callable[..., Awaitable[None]],
+        sleep: Optional[Callable[[float], Awaitable[None]]] = None,
+    ):
+        self.data_service = data_service
+        self.scheduler_service = scheduler_service
+        self._refresh_view = refresh_view
+        self._sleep = sleep or asyncio.sleep
+        config = get_global_config()
+        self.view_refresh_rate = config.view_refresh_rate
+        # Channel jobs whose timer view message still shows the old time
+        self._view_queue: Dict[str, str] = {}
+        self._view_worker: Optional[asyncio.Task] = None
+
+    async def reschedule_server(self, server_id: str) -> int:
+        """Rebuild the jobs that follow a server's timezone after it changed"""
+        server = await self.data_service.get_server(server_id)
+        if not server:
+            return 0
+        return await self._reschedule(
+            {server_id: server}, {server_id: {SERVER_TIMEZONE}}
+        )
+
+    async def reschedule_after_reload(
+        self,
+        old_mappings: Dict[str, str],
+        old_server_timezones: Dict[str, Optional[str]],
+    ) -> int:
+        """Rebuild the jobs a reload of mappings and servers moved to another zone"""
+        new_mappings = self.data_service.get_timezones_list()
+        changed = {
+            abbreviation
+            for abbreviation in old_mappings.keys() | new_mappings.keys()
+            if old_mappings.get(abbreviation) != new_mappings.get(abbreviation)
+        }
+
+        servers = await self.data_service.get_all_servers()
+        dependencies: Dict[str, Set[str]] = {}
+        for server_id, server in servers.items():
+            server_dependencies = set(changed)
+            if server.timezone != old_server_timezones.get(server_id):
+                server_dependencies.add(SERVER_TIMEZONE)
+            if server_dependencies:
+                dependencies[server_id] = server_dependencies
+
+        if not dependencies:
+            return 0
+        return await self._reschedule(servers, dependencies)
+
+    async def _reschedule(
+        self, servers: Dict[str, Server], dependencies: Dict[str, Set[str]]
+    ) -> int:
+        rescheduled = self.scheduler_service.reschedule_timezone_jobs(
+            servers, dependencies
+        )
+        if not rescheduled:
+            return 0
+
+        anchors: Dict[str, Dict[str, datetime]] = {}
+        for job in rescheduled:
+            job.schedule.anchor_time = job.anchor_time
+            anchors.setdefault(job.server_id, {})[job.schedule_path] = job.anchor_time
+        await self.data_service.save_schedule_anchors(anchors)
+
+        for job in rescheduled:
+            if job.channel_id and getattr(job.schedule, "view_message_id", None):
+                self._view_queue[job.job_id] = job.server_id
+        if self._view_queue and (
+            self._view_worker is None or self._view_worker.done()
+        ):
+            self._view_worker = asyncio.create_task(self._refresh_views())
+
+        logger.info(
+            LogArea.SCHEDULER,
+            f"Rescheduled {len(rescheduled)} jobs in {len(anchors)} servers after a timezone change",
+        )
+        return len(rescheduled)
+
+    async def _refresh_views(self) -> None:
+        """Edit the queued timer view messages at a steady pace"""
+        while self._view_queue:
+            job_id = next(iter(self._view_queue))
+            server_id = self._view_queue.pop(job_id)
+            job = self.scheduler_service.scheduler.get_job(job_id)
+            if job is None:
+                continue
+
+            try:
+                await self.scheduler_service.run_or_defer(
+                    f"{job_id}_view",
+                    lambda channel=job.args[0]: self._refresh_view(channel),
+                )
+            except Exception as e:
+                logger.warning(
+                    LogArea.DISCORD,
+                    f"Failed to refresh view message of job {job_id} in server {server_id}: {e}",
+                )
+            await self._sleep(1.0 / self.view_refresh_rate)
+
+    def get_pending_view_count(self) -> int:
+        return len(self._view_queue)
+
+    async def stop(self) -> None:
+        if self._view_worker is not None and not self._view_worker.done():
+            self._view_worker.cancel()
+            try:
+                await self._view_worker
+            except asyncio.CancelledError:
+                pass
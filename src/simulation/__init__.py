@@ -0,0 +1,21 @@
+from .clock import FakeClock
+from .data_service import SimulatedDataService
+from .fake_discord import (
+    FakeGuild,
+    FakeMessage,
+    FakeRestBudget,
+    FakeTextChannel,
+)
+from .harness import SchedulerSimulation, SimulationConfig, run_simulation
+
+__all__ = [
+    "FakeClock",
+    "SimulatedDataService",
+    "FakeGuild",
+    "FakeMessage",
+    "FakeRestBudget",
+    "FakeTextChannel",
+    "SchedulerSimulation",
+    "SimulationConfig",
+    "run_simulation",
+]
@@ -0,0 +1,75 @@
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timedelta
+from typing import Awaitable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class FakeClock:
+    """Virtual clock whose sleeps only finish when the simulation advances time"""
+
+    def __init__(self, start: datetime):
+        self._now = start
+        self._sleepers: List[Tuple[datetime, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    def now(self) -> datetime:
+        return self._now
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        wake_at = self._now + timedelta(seconds=seconds)
+        heapq.heappush(self._sleepers, (wake_at, next(self._sequence), future))
+        await future
+
+    @property
+    def pending_sleepers(self) -> int:
+        return len(self._sleepers)
+
+    def next_wakeup(self) -> Optional[datetime]:
+        return self._sleepers[0][0] if self._sleepers else None
+
+    def advance_to(self, moment: datetime) -> int:
+        """Move time forward and wake every sleeper that is now due"""
+        if moment > self._now:
+            self._now = moment
+
+        woken = 0
+        while self._sleepers and self._sleepers[0][0] <= self._now:
+            _, _, future = heapq.heappop(self._sleepers)
+            if not future.done():
+                future.set_result(None)
+                woken += 1
+        return woken
+
+    async def settle(self) -> None:
+        """Yield until every task that can run has run and is waiting again
+
+        Peeks at the event loop's private ready queue: counting quiet rounds
+        instead is fooled by call chains that take a few iterations to reach
+        their next sleep.
+        """
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(0)
+        while loop._ready:
+            await asyncio.sleep(0)
+
+    async def run_until_complete(self, awaitable: Awaitable[T]) -> T:
+        """Await ``awaitable``, jumping the clock whenever everything is asleep"""
+        task = asyncio.ensure_future(awaitable)
+        while not task.done():
+            # Let woken tasks run until they are all back on the clock
+            await self.settle()
+            if task.done():
+                break
+            wakeup = self.next_wakeup()
+            if wakeup is None:
+                return await task
+            self.advance_to(wakeup)
+        return task.result()
@@ -0,0 +1,142 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from src.models import (
+    ChannelClearProfile,
+    ChannelTimer,
+    ClearCheckpoint,
+    ClearRunRecord,
+    Server,
+)
+from src.services.server_data_service import DataService
+
+DEFAULT_SIMULATION_TIMEZONES = {
+    "GMT": "GMT",
+    "UTC": "UTC",
+    "EST": "US/Eastern",
+    "PST": "US/Pacific",
+    "CET": "Europe/Paris",
+}
+
+
+class SimulatedDataService(DataService):
+    """In-memory DataService that counts the writes it would have sent to MongoDB"""
+
+    def __init__(self, timezones: Optional[Dict[str, str]] = None):
+        super().__init__()
+        self._timezones_cache = dict(timezones or DEFAULT_SIMULATION_TIMEZONES)
+        self._initialized = True
+        self.write_counts: Dict[str, int] = {
+            "save_servers_calls": 0,
+            "server_documents_written": 0,
+            "save_blacklist_calls": 0,
+            "save_bot_config_calls": 0,
+            "save_heartbeat_calls": 0,
+            "save_checkpoint_calls": 0,
+            "delete_checkpoint_calls": 0,
+            "channel_move_calls": 0,
+            "ignored_removal_calls": 0,
+            "group_update_calls": 0,
+            "channel_batch_calls": 0,
+            "save_anchors_calls": 0,
+            "anchor_documents_written": 0,
+            "save_profiles_calls": 0,
+            "profile_documents_written": 0,
+            "save_clear_runs_calls": 0,
+            "clear_run_documents_written": 0,
+        }
+        self._heartbeats: Dict[str, datetime] = {}
+        self._checkpoints: Dict[str, ClearCheckpoint] = {}
+        self._profiles: Dict[str, ChannelClearProfile] = {}
+        self.clear_runs: List[ClearRunRecord] = []
+
+    def add_simulated_server(self, server: Server) -> None:
+        self._servers_cache[server.server_id] = server
+
+    async def initialize(self) -> None:
+        return
+
+    async def save_servers(self) -> None:
+        async with self._lock:
+            self.write_counts["save_servers_calls"] += 1
+            self.write_counts["server_documents_written"] += len(self._servers_cache)
+
+    async def save_blacklist(self) -> None:
+        self.write_counts["save_blacklist_calls"] += 1
+
+    async def save_bot_config(self) -> None:
+        self.write_counts["save_bot_config_calls"] += 1
+
+    async def _write_channel_move(
+        self,
+        server_id: str,
+        old_channel_id: str,
+        new_channel_id: str,
+        channel_timer: ChannelTimer,
+    ) -> None:
+        self.write_counts["channel_move_calls"] += 1
+
+    async def _write_channel_batch(self, server_id: str, update: Dict[str, Any]) -> None:
+        self.write_counts["channel_batch_calls"] += 1
+
+    async def save_schedule_anchors(
+        self, anchors: Dict[str, Dict[str, datetime]]
+    ) -> None:
+        self.write_counts["save_anchors_calls"] += 1
+        self.write_counts["anchor_documents_written"] += len(anchors)
+
+    async def _write_ignored_removal(
+        self, server_id: str, rules_path: str, message_ids: Set[int]
+    ) -> None:
+        self.write_counts["ignored_removal_calls"] += 1
+
+    async def _write_group_change(self, server_id: str, update: Dict[str, Any]) -> None:
+        self.write_counts["group_update_calls"] += 1
+
+    async def get_scheduler_heartbeat(self, shard_key: str) -> Optional[datetime]:
+        return self._heartbeats.get(shard_key)
+
+    async def save_scheduler_heartbeat(self, shard_key: str, moment: datetime) -> None:
+        self.write_counts["save_heartbeat_calls"] += 1
+        self._heartbeats[shard_key] = moment
+
+    async def get_clear_checkpoints(self) -> List[ClearCheckpoint]:
+        return list(self._checkpoints.values())
+
+    async def save_clear_checkpoint(self, checkpoint: ClearCheckpoint) -> None:
+        self.write_counts["save_checkpoint_calls"] += 1
+        self._checkpoints[checkpoint.channel_id] = ClearCheckpoint.from_dict(
+            checkpoint.to_dict()
+        )
+
+    async def delete_clear_checkpoint(self, channel_id: str) -> None:
+        self.write_counts["delete_checkpoint_calls"] += 1
+        self._checkpoints.pop(channel_id, None)
+
+    async def get_channel_profiles(self) -> List[ChannelClearProfile]:
+        return list(self._profiles.values())
+
+    async def save_channel_profiles(
+        self, profiles: List[ChannelClearProfile], deleted_channel_ids: List[str]
+    ) -> None:
+        self.write_counts["save_profiles_calls"] += 1
+        self.write_counts["profile_documents_written"] += len(profiles) + len(
+            deleted_channel_ids
+        )
+        for profile in profiles:
+            self._profiles[profile.channel_id] = ChannelClearProfile.from_dict(
+                profile.to_dict()
+            )
+        for channel_id in deleted_channel_ids:
+            self._profiles.pop(channel_id, None)
+
+    async def ensure_clear_ledger(self, retention_seconds: int) -> None:
+        return
+
+    async def save_clear_runs(self, records: List[ClearRunRecord]) -> None:
+        self.write_counts["save_clear_runs_calls"] += 1
+        self.write_counts["clear_run_documents_written"] += len(records)
+        self.clear_runs.extend(records)
+
+    async def cleanup_old_removed_servers(self) -> int:
+        return 0
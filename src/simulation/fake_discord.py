@@ -0,0 +1,425 @@
+import itertools
+import random
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+import discord
+from discord.http import Route
+
+from src.simulation.clock import FakeClock
+
+# Discord snowflakes count milliseconds from 2015-01-01
+DISCORD_EPOCH_MS = 1420070400000
+
+
+def snowflake_for(moment: datetime, sequence: int = 0) -> int:
+    return (
+        int(moment.timestamp() * 1000) - DISCORD_EPOCH_MS
+    ) << 22 | sequence & 0x3FFFFF
+
+
+class FakeRestBudget:
+    """Shared REST budget that spaces out every simulated API call"""
+
+    def __init__(self, clock: FakeClock, requests_per_second: float, latency: float):
+        self.clock = clock
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.latency = latency
+        self._next_free: Optional[datetime] = None
+        self.total_calls = 0
+
+    async def call(self) -> None:
+        now = self.clock.now()
+        start = max(now, self._next_free or now)
+        self._next_free = start + timedelta(seconds=self.interval)
+        self.total_calls += 1
+        await self.clock.sleep((start - now).total_seconds() + self.latency)
+
+
+@dataclass
+class FakeResponse:
+    """Enough of an aiohttp response to build discord.py's HTTP errors"""
+
+    status: int
+    reason: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class FakeUser:
+    id: int
+    bot: bool = False
+
+
+@dataclass
+class FakePermissions:
+    view_channel: bool = True
+    send_messages: bool = True
+    read_message_history: bool = True
+    manage_messages: bool = True
+    manage_channels: bool = True
+    embed_links: bool = True
+    use_application_commands: bool = True
+    send_messages_in_threads: bool = True
+
+
+class FakeDeleteBucket:
+    """Single-message delete limit shared by every channel of a guild
+
+    Mirrors discord.py's Ratelimit fields so the clearing code can read the
+    headers. A call that finds the bucket empty counts as a 429 and waits for
+    the reset, like discord.py does when it retries.
+    """
+
+    def __init__(self, limit: int = 5, window: float = 1.0):
+        self.limit = limit
+        self.window = window
+        self.remaining = limit
+        self.reset_after = 0.0
+        self.dirty = False
+        self.rate_limited_responses = 0
+        self._reset_at: Optional[datetime] = None
+
+    async def take(self, clock: FakeClock) -> None:
+        now = clock.now()
+        if self._reset_at is not None and self.remaining <= 0 and now < self._reset_at:
+            self.rate_limited_responses += 1
+            await clock.sleep((self._reset_at - now).total_seconds())
+            now = clock.now()
+        if self._reset_at is None or now >= self._reset_at:
+            self.remaining = self.limit
+            self._reset_at = now + timedelta(seconds=self.window)
+        self.remaining -= 1
+        self.reset_after = (self._reset_at - now).total_seconds()
+        self.dirty = True
+
+
+@dataclass
+class FakeGuild:
+    id: int
+    me: FakeUser = field(default_factory=lambda: FakeUser(id=1, bot=True))
+    delete_bucket: FakeDeleteBucket = field(default_factory=FakeDeleteBucket)
+    name: str = "Simulated Guild"
+
+
+class FakeMessage:
+    def __init__(
+        self,
+        channel: "FakeTextChannel",
+        message_id: int,
+        author: FakeUser,
+        content: str = "",
+    ):
+        self.channel = channel
+        self.id = message_id
+        self.author = author
+        self.content = content
+        self.embeds: List[Any] = []
+        self.attachments: List[Any] = []
+
+    @property
+    def created_at(self) -> datetime:
+        return discord.utils.snowflake_time(self.id)
+
+    async def delete(self) -> None:
+        await self.channel.guild.delete_bucket.take(self.channel.clock)
+        await self.channel.rest.call()
+        self.channel._remove([self.id])
+
+
+class FakeHTTPClient:
+    """The part of discord.py's HTTPClient that clears call directly"""
+
+    def __init__(self, channel: "FakeTextChannel"):
+        self.channel = channel
+        self._bucket_hashes: Dict[str, str] = {}
+
+    @property
+    def _buckets(self) -> Dict[str, FakeDeleteBucket]:
+        route = Route(
+            "DELETE",
+            "/channels/{channel_id}/messages/{message_id}",
+            channel_id=self.channel.id,
+            message_id=0,
+        )
+        return {f"{route.key}:{route.major_parameters}": self.channel.guild.delete_bucket}
+
+    async def logs_from(
+        self, channel_id: int, limit: int, before=None, after=None, around=None
+    ) -> List[Dict[str, Any]]:
+        return await self.channel._logs_from(limit, before, after)
+
+    async def pins_from(
+        self, channel_id: int, limit: Optional[int] = None, before: Optional[str] = None
+    ) -> Dict[str, Any]:
+        return await self.channel._pins_from(limit or 50, before)
+
+
+@dataclass
+class FakeConnectionState:
+    http: FakeHTTPClient
+
+
+class FakeTextChannel:
+    """Text channel that keeps messages in memory and charges the REST budget"""
+
+    def __init__(
+        self,
+        channel_id: int,
+        guild: FakeGuild,
+        clock: FakeClock,
+        rest: FakeRestBudget,
+        messages_per_hour: float = 60.0,
+        rng: Optional[random.Random] = None,
+    ):
+        self.id = channel_id
+        self.guild = guild
+        self.clock = clock
+        self.rest = rest
+        self.messages_per_hour = messages_per_hour
+        self.rng = rng or random.Random(channel_id)
+        self._state = FakeConnectionState(http=FakeHTTPClient(self))
+        self.deleted_count = 0
+        # Ids the bulk delete endpoint refuses, like Discord does for some
+        # system messages; a request containing any of them fails as a whole
+        self.bulk_rejected_ids: Set[int] = set()
+        self.pinned_ids: Set[int] = set()
+        self.first_delete_at: Optional[datetime] = None
+        # Only ids and authors are stored, message objects are built per fetch
+        # like discord.py does from the JSON payload. Ids stay sorted oldest
+        # first; deleted ids leave the dict at once and the list in batches
+        self._messages: Dict[int, FakeUser] = {}
+        self._ids: List[int] = []
+        self._last_message_id: Optional[int] = None
+        self._authors = [FakeUser(id=1000 + index) for index in range(5)]
+        self._sequence = itertools.count()
+        self._filled_until = clock.now()
+        self.position = 0
+        self.deleted = False
+
+    @property
+    def mention(self) -> str:
+        return f"<#{self.id}>"
+
+    def permissions_for(self, member) -> FakePermissions:
+        return FakePermissions()
+
+    @property
+    def last_message_id(self) -> Optional[int]:
+        """Like the guild cache, keeps pointing at the newest message ever sent"""
+        self._catch_up()
+        return self._last_message_id
+
+    @property
+    def message_count(self) -> int:
+        return len(self._messages)
+
+    def _post(self, start: datetime, end: datetime, count: int) -> None:
+        moments = sorted(start + (end - start) * self.rng.random() for _ in range(count))
+        for posted_at in moments:
+            message_id = snowflake_for(posted_at, next(self._sequence))
+            self._messages[message_id] = self.rng.choice(self._authors)
+            self._ids.append(message_id)
+            self._last_message_id = message_id
+
+    def prefill(self, count: int, span: timedelta) -> None:
+        """Post ``count`` messages spread over the ``span`` before now"""
+        now = self.clock.now()
+        self._post(now - span, now, count)
+        self._filled_until = now
+
+    def _catch_up(self) -> None:
+        """Post the messages users would have sent since the last look"""
+        now = self.clock.now()
+        hours = (now - self._filled_until).total_seconds() / 3600
+        count = int(hours * self.messages_per_hour)
+        if count:
+            self._post(self._filled_until, now, count)
+            self._filled_until = now
+
+    def _remove(self, message_ids: List[int]) -> None:
+        for message_id in message_ids:
+            if self._messages.pop(message_id, None) is not None:
+                self.deleted_count += 1
+        if self.first_delete_at is None:
+            self.first_delete_at = self.clock.now()
+        if len(self._ids) > 2 * len(self._messages) + 1000:
+            self._ids = [
+                message_id for message_id in self._ids if message_id in self._messages
+            ]
+
+    def _page(
+        self,
+        count: int,
+        before_id: Optional[int],
+        after_id: Optional[int],
+        oldest_first: bool,
+    ) -> List[Tuple[int, FakeUser]]:
+        """Up to ``count`` live messages in the id range, walking in one direction
+
+        Positions are looked up for every page since deletions may compact
+        the id list between pages.
+        """
+        low = 0 if after_id is None else bisect_right(self._ids, after_id)
+        high = len(self._ids) if before_id is None else bisect_left(self._ids, before_id)
+        positions = range(low, high) if oldest_first else range(high - 1, low - 1, -1)
+
+        page = []
+        for position in positions:
+            if len(page) >= count:
+                break
+            message_id = self._ids[position]
+            author = self._messages.get(message_id)
+            if author is not None:
+                page.append((message_id, author))
+        return page
+
+    def _payload(self, message_id: int, author: FakeUser) -> Dict[str, Any]:
+        """Message JSON shaped like the REST API's, trimmed to common fields"""
+        return {
+            "id": str(message_id),
+            "channel_id": str(self.id),
+            "author": {
+                "id": str(author.id),
+                "username": f"user{author.id}",
+                "discriminator": "0",
+                "avatar": None,
+                "global_name": f"User {author.id}",
+            },
+            "content": f"Simulated message {message_id}",
+            "timestamp": discord.utils.snowflake_time(message_id).isoformat(),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+        }
+
+    async def _logs_from(
+        self, limit: int, before: Optional[int], after: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """One page of the messages endpoint, always newest first like Discord"""
+        self._catch_up()
+        await self.rest.call()
+        page = self._page(min(limit, 100), before, after, before is None and after is not None)
+        page.sort(key=lambda item: item[0], reverse=True)
+        return [self._payload(message_id, author) for message_id, author in page]
+
+    async def _pins_from(self, limit: int, before: Optional[str]) -> Dict[str, Any]:
+        """One page of the pins endpoint, messages count as pinned when posted"""
+        await self.rest.call()
+        pinned = sorted(
+            (message_id for message_id in self.pinned_ids if message_id in self._messages),
+            reverse=True,
+        )
+        pinned_at = {
+            message_id: discord.utils.snowflake_time(message_id).isoformat()
+            for message_id in pinned
+        }
+        if before is not None:
+            pinned = [message_id for message_id in pinned if pinned_at[message_id] < before]
+        return {
+            "items": [
+                {
+                    "pinned_at": pinned_at[message_id],
+                    "message": self._payload(message_id, self._messages[message_id]),
+                }
+                for message_id in pinned[:limit]
+            ],
+            "has_more": len(pinned) > limit,
+        }
+
+    async def history(
+        self, limit: Optional[int] = 100, before=None, after=None
+    ) -> AsyncIterator[FakeMessage]:
+        """Newest first, or oldest first when only ``after`` is given"""
+        self._catch_up()
+        before_id = getattr(before, "id", before)
+        after_id = getattr(after, "id", after)
+        oldest_first = after_id is not None and before_id is None
+        remaining = limit if limit is not None else len(self._ids)
+
+        # One API call per page of up to 100 messages
+        while True:
+            await self.rest.call()
+            page = [
+                FakeMessage(self, message_id, author, f"Simulated message {message_id}")
+                for message_id, author in self._page(
+                    min(remaining, 100), before_id, after_id, oldest_first
+                )
+            ]
+
+            for message in page:
+                yield message
+            remaining -= len(page)
+            if len(page) < 100 or remaining <= 0:
+                return
+            if oldest_first:
+                after_id = page[-1].id
+            else:
+                before_id = page[-1].id
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        return FakeMessage(self, message_id, self._messages.get(message_id))
+
+    async def delete_messages(self, messages: List[FakeMessage]) -> None:
+        message_ids = [message.id for message in messages]
+        if len(message_ids) == 1:
+            # discord.py sends a lone message to the single delete endpoint
+            await self.guild.delete_bucket.take(self.clock)
+        await self.rest.call()
+        if len(message_ids) > 1 and self.bulk_rejected_ids.intersection(message_ids):
+            raise discord.HTTPException(
+                FakeResponse(400, "Bad Request"),
+                {"code": 50034, "message": "Message cannot be bulk deleted"},
+            )
+        self._remove(message_ids)
+
+    async def fetch_message(self, message_id: int) -> FakeMessage:
+        await self.rest.call()
+        author = self._messages.get(message_id)
+        if author is None:
+            raise discord.NotFound(
+                FakeResponse(404, "Not Found"),
+                {"code": 10008, "message": "Unknown Message"},
+            )
+        return FakeMessage(self, message_id, author, f"Simulated message {message_id}")
+
+    async def send(self, *args, **kwargs) -> FakeMessage:
+        await self.rest.call()
+        self._catch_up()
+        now = self.clock.now()
+        message_id = snowflake_for(now, next(self._sequence))
+        self._messages[message_id] = self.guild.me
+        self._ids.append(message_id)
+        self._last_message_id = message_id
+        return FakeMessage(self, message_id, self.guild.me, kwargs.get("content") or "")
+
+    async def clone(self, *, name=None, category=None, reason=None) -> "FakeTextChannel":
+        """An empty channel with the same settings, placed last like Discord does"""
+        await self.rest.call()
+        channel = FakeTextChannel(
+            snowflake_for(self.clock.now(), next(self._sequence)),
+            self.guild,
+            self.clock,
+            self.rest,
+            self.messages_per_hour,
+            self.rng,
+        )
+        channel.position = self.position + 1
+        return channel
+
+    async def edit(self, *, position=None, reason=None, **fields) -> None:
+        await self.rest.call()
+        if position is not None:
+            self.position = position
+
+    async def delete(self, *, reason=None) -> None:
+        await self.rest.call()
+        self.deleted = True
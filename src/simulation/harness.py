@@ -0,0 +1,274 @@
+import asyncio
+import random
+import time
+import pytz
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_SUBMITTED,
+    JobSubmissionEvent,
+)
+
+from src.models import RollingHistogram, Server
+from src.services.clear_job_scheduler_service import SchedulerService
+from src.services.message_clearing_service import MessageService
+from src.simulation.clock import FakeClock
+from src.simulation.data_service import SimulatedDataService
+from src.simulation.fake_discord import FakeGuild, FakeRestBudget, FakeTextChannel
+from src.utils.logger import logger
+
+DEFAULT_TIMER_MIX: Sequence[Tuple[str, float]] = (
+    ("24h", 0.4),
+    ("09:00 EST", 0.25),
+    ("Mon-Fri 09:00", 0.2),
+    ("1/4 15:30", 0.15),
+)
+
+
+@dataclass
+class SimulationConfig:
+    channels: int = 1000
+    channels_per_guild: int = 5
+    duration_hours: float = 24.0
+    start: Optional[datetime] = None
+    seed: int = 0
+    messages_per_hour: float = 30.0
+    rest_requests_per_second: float = 50.0
+    api_latency_seconds: float = 0.15
+    timer_mix: Sequence[Tuple[str, float]] = DEFAULT_TIMER_MIX
+    verbose: bool = False
+
+
+class SchedulerSimulation:
+    """Discrete-event replay of the scheduler and clearing services on a fake clock
+
+    APScheduler is started paused so it only keeps the job store. The harness
+    plays the role of its dispatch loop: it jumps the clock to the next due job
+    or sleeper, submits due jobs the way APScheduler would (one instance per
+    job), then lets the event loop run until every task is waiting on the clock.
+    """
+
+    def __init__(self, config: SimulationConfig):
+        if config.start is None:
+            config.start = datetime.now(pytz.UTC)
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.clock = FakeClock(config.start)
+        self.data_service = SimulatedDataService()
+        self.scheduler_service = SchedulerService(
+            self.data_service, clock=self.clock.now, sleep=self.clock.sleep
+        )
+        self.message_service = MessageService(
+            self.data_service,
+            self.scheduler_service,
+            clock=self.clock.now,
+            sleep=self.clock.sleep,
+        )
+        self.scheduler_service.register_channel_clear_callback(
+            self.message_service.execute_channel_message_clear
+        )
+        self.scheduler_service.register_prestage_callback(
+            self.message_service.prestage_clear
+        )
+        self.rest = FakeRestBudget(
+            self.clock, config.rest_requests_per_second, config.api_latency_seconds
+        )
+        self.channels: Dict[str, FakeTextChannel] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._completion_lag = RollingHistogram(max_samples=100_000)
+        self.dispatched = 0
+        self.prestages_dispatched = 0
+        self.peak_concurrency = 0
+        self.timer_counts: Dict[str, int] = {}
+
+    def _pick_timer(self) -> str:
+        timers = [timer for timer, _ in self.config.timer_mix]
+        weights = [weight for _, weight in self.config.timer_mix]
+        return self.rng.choices(timers, weights)[0]
+
+    async def _create_subscriptions(self) -> None:
+        parser = self.scheduler_service.schedule_parser
+        guild = None
+        server = None
+
+        for index in range(self.config.channels):
+            if index % self.config.channels_per_guild == 0:
+                guild = FakeGuild(id=10_000 + index)
+                server = Server(str(guild.id), guild.name)
+                self.data_service.add_simulated_server(server)
+
+            channel = FakeTextChannel(
+                channel_id=1_000_000 + index,
+                guild=guild,
+                clock=self.clock,
+                rest=self.rest,
+                messages_per_hour=self.config.messages_per_hour,
+                rng=random.Random(self.rng.random()),
+            )
+            channel_id = str(channel.id)
+            self.channels[channel_id] = channel
+
+            timer = self._pick_timer()
+            self.timer_counts[timer] = self.timer_counts.get(timer, 0) + 1
+            trigger, next_run_time = parser.parse_schedule_expression(
+                timer, server.server_id
+            )
+            server.add_channel(channel_id, timer, next_run_time)
+            self.scheduler_service.create_channel_clear_job(
+                channel_id, server.server_id, trigger, channel, next_run_time
+            )
+
+    def _next_due_job(self):
+        jobs = self.scheduler_service.scheduler.get_jobs()
+        due = [job for job in jobs if job.next_run_time is not None]
+        return min(due, key=lambda job: job.next_run_time) if due else None
+
+    def _dispatch(self, job) -> None:
+        run_time = job.next_run_time
+        now = self.clock.now()
+
+        running = self._running.get(job.id)
+        if running is not None and not running.done():
+            self.scheduler_service._on_job_submitted(
+                JobSubmissionEvent(
+                    EVENT_JOB_MAX_INSTANCES, job.id, "default", [run_time]
+                )
+            )
+        else:
+            self.scheduler_service._on_job_submitted(
+                JobSubmissionEvent(EVENT_JOB_SUBMITTED, job.id, "default", [run_time])
+            )
+            self._running[job.id] = asyncio.create_task(
+                self._run_job(job, run_time)
+            )
+            if job.id.endswith("_prestage"):
+                self.prestages_dispatched += 1
+            else:
+                self.dispatched += 1
+
+        next_run_time = job.trigger.get_next_fire_time(run_time, now)
+        if next_run_time is None:
+            job.remove()
+        else:
+            job.modify(next_run_time=next_run_time)
+
+    async def _run_job(self, job, run_time: datetime) -> None:
+        try:
+            await job.func(*job.args, **job.kwargs)
+        except Exception:
+            pass
+        finally:
+            # Pre-staging runs ahead of time on purpose, only clears count
+            if not job.id.endswith("_prestage"):
+                lag = (self.clock.now() - run_time).total_seconds()
+                self._completion_lag.record(lag)
+
+    async def run(self) -> Dict[str, Any]:
+        console_enabled, db_enabled = logger.console_enabled, logger.db_enabled
+        logger.console_enabled = self.config.verbose
+        logger.db_enabled = False
+
+        wall_start = time.perf_counter()
+        self.scheduler_service.scheduler.start(paused=True)
+        try:
+            await self._create_subscriptions()
+            setup_writes = dict(self.data_service.write_counts)
+            end = self.clock.now() + timedelta(hours=self.config.duration_hours)
+            dispatch_start = time.perf_counter()
+
+            while True:
+                await self.clock.settle()
+                self.peak_concurrency = max(
+                    self.peak_concurrency,
+                    sum(1 for task in self._running.values() if not task.done()),
+                )
+
+                job = self._next_due_job()
+                candidates = [
+                    moment
+                    for moment in (
+                        job.next_run_time if job else None,
+                        self.clock.next_wakeup(),
+                    )
+                    if moment is not None
+                ]
+                if not candidates:
+                    break
+                moment = min(candidates)
+                if moment > end:
+                    break
+
+                self.clock.advance_to(moment)
+                if job is not None and job.next_run_time <= self.clock.now():
+                    self._dispatch(job)
+
+            dispatch_seconds = time.perf_counter() - dispatch_start
+        finally:
+            await self.message_service.stop_legacy_passes()
+            await self.message_service.save_channel_profiles()
+            await self.message_service.clear_ledger.flush()
+            self.scheduler_service.scheduler.shutdown(wait=False)
+            logger.console_enabled, logger.db_enabled = console_enabled, db_enabled
+
+        for task in self._running.values():
+            if not task.done():
+                task.cancel()
+
+        return self._report(setup_writes, dispatch_seconds, wall_start)
+
+    def _report(
+        self,
+        setup_writes: Dict[str, int],
+        dispatch_seconds: float,
+        wall_start: float,
+    ) -> Dict[str, Any]:
+        stats = self.scheduler_service.get_scheduler_statistics()
+        writes = self.data_service.write_counts
+        hours = self.config.duration_hours
+
+        return {
+            "config": {
+                "channels": self.config.channels,
+                "duration_hours": hours,
+                "start": self.config.start.isoformat(),
+                "seed": self.config.seed,
+                "messages_per_hour": self.config.messages_per_hour,
+                "rest_requests_per_second": self.config.rest_requests_per_second,
+                "api_latency_seconds": self.config.api_latency_seconds,
+                "timer_mix": self.timer_counts,
+            },
+            "dispatch": {
+                "clears_dispatched": self.dispatched,
+                "clears_per_virtual_hour": round(self.dispatched / hours, 2),
+                "clears_per_wall_second": round(
+                    self.dispatched / max(dispatch_seconds, 1e-9), 2
+                ),
+                "peak_concurrency": self.peak_concurrency,
+                "prestages_dispatched": self.prestages_dispatched,
+                "runs_skipped": stats["total_runs_skipped"],
+                "runs_idle": stats["total_runs_idle"],
+            },
+            "lateness_seconds": stats["lateness_seconds"],
+            "duration_seconds": stats["duration_seconds"],
+            "completion_lag_seconds": self._completion_lag.to_dict(),
+            "clears": {
+                "completed": stats["total_tasks_completed"],
+                "failed": stats["total_tasks_failed"],
+                "messages_deleted": stats["total_messages_deleted"],
+                "api_calls": self.rest.total_calls,
+            },
+            "db_writes": {
+                "during_setup": setup_writes,
+                "during_run": {
+                    key: writes[key] - setup_writes.get(key, 0) for key in writes
+                },
+            },
+            "wall_seconds": round(time.perf_counter() - wall_start, 3),
+        }
+
+
+def run_simulation(config: SimulationConfig) -> Dict[str, Any]:
+    return asyncio.run(SchedulerSimulation(config).run())
@@ -0,0 +1,44 @@
+"""
+Utility functions for parsing lists of channels given to subscription commands
+"""
+
+import re
+import discord
+from typing import List, Tuple
+
+CHANNEL_TARGET_PATTERN = re.compile(r"^(?:<#(\d+)>|(\d+))$")
+
+
+def parse_text_channels(
+    targets: str, guild: discord.Guild
+) -> Tuple[List[discord.TextChannel], List[str]]:
+    """
+    Resolve channel mentions or IDs separated by commas or spaces.
+
+    Args:
+        targets: The channel list as typed by the user
+        guild: The guild the channels have to belong to
+
+    Returns:
+        Tuple of (channels, invalid) where invalid holds every entry that is
+        not a text channel of the guild. Duplicates are dropped.
+    """
+    channels: List[discord.TextChannel] = []
+    invalid: List[str] = []
+    seen = set()
+
+    for target in re.split(r"[\s,]+", targets.strip()):
+        if not target:
+            continue
+
+        match = CHANNEL_TARGET_PATTERN.match(target)
+        channel = (
+            guild.get_channel(int(match.group(1) or match.group(2))) if match else None
+        )
+        if not isinstance(channel, discord.TextChannel):
+            invalid.append(target)
+        elif channel.id not in seen:
+            seen.add(channel.id)
+            channels.append(channel)
+
+    return channels, invalid
@@ -1,5 +1,5 @@
 import discord
-from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 from enum import Enum
 from src.localization import get_translator
 from src.utils.logger import logger, LogArea
@@ -14,6 +14,8 @@ class ValidationCheck(Enum):
     BOT_PERMISSIONS = "bot_permissions"
     CHANNEL_SUBSCRIBED = "channel_subscribed"
     CHANNEL_NOT_SUBSCRIBED = "channel_not_subscribed"
+    # Subscribed on its own or cleared as a member of a group
+    CHANNEL_CLEARED = "channel_cleared"
 
 
 class SubscriptionStatus(Enum):
@@ -92,6 +94,20 @@ class CommandValidator:
                 )
                 return False, error_msg, channel
 
+        if ValidationCheck.CHANNEL_CLEARED in checks:
+            config = checks[ValidationCheck.CHANNEL_CLEARED]
+            is_cleared = is_subscribed or (
+                server is not None and server.is_channel_cleared(channel_id)
+            )
+            if not is_cleared:
+                error_msg = await self._get_subscription_error_message(
+                    interaction,
+                    channel,
+                    required=True,
+                    custom_message=config if isinstance(config, str) else None,
+                )
+                return False, error_msg, channel
+
         if ValidationCheck.CHANNEL_NOT_SUBSCRIBED in checks:
             config = checks[ValidationCheck.CHANNEL_NOT_SUBSCRIBED]
             if is_subscribed:
@@ -154,7 +170,24 @@ class CommandValidator:
     async def _check_bot_permissions(
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ) -> Tuple[bool, Optional[str]]:
-        bot_permissions = channel.permissions_for(interaction.guild.me)
+        missing_perms = self.get_missing_bot_permissions(channel)
+
+        if missing_perms:
+            server_id = str(interaction.guild.id)
+            translator = await get_translator(server_id, self.data_service)
+            perms_list = ", ".join(missing_perms)
+            return False, translator.get(
+                "validation.bot_missing_permissions",
+                channel=channel.mention,
+                permissions=perms_list,
+            )
+
+        return True, None
+
+    @staticmethod
+    def get_missing_bot_permissions(channel: discord.TextChannel) -> List[str]:
+        """Names of the permissions the bot lacks to clear a channel"""
+        bot_permissions = channel.permissions_for(channel.guild.me)
 
         required_perms = {
             "view_channel": bot_permissions.view_channel,
@@ -166,24 +199,12 @@ class CommandValidator:
             "send_messages_in_threads": bot_permissions.send_messages_in_threads,
         }
 
-        missing_perms = [
+        return [
             perm.replace("_", " ").title()
             for perm, has_perm in required_perms.items()
             if not has_perm
         ]
 
-        if missing_perms:
-            server_id = str(interaction.guild.id)
-            translator = await get_translator(server_id, self.data_service)
-            perms_list = ", ".join(missing_perms)
-            return False, translator.get(
-                "validation.bot_missing_permissions",
-                channel=channel.mention,
-                permissions=perms_list,
-            )
-
-        return True, None
-
     async def _get_subscription_error_message(
         self,
         interaction: discord.Interaction,
@@ -156,14 +156,12 @@ async def validate_and_add_ignore_target(
 
     if entity_id and entity_type:
         if entity_type == "user":
-            # Check if not already ignored
-            if entity_id not in channel_timer.ignored.users:
-                channel_timer.add_ignored_user(entity_id)
+            # Only added if not already ignored
+            if channel_timer.add_ignored_user(entity_id):
                 return entity_id, entity_type
         else:  # message
-            # Check if not already ignored
-            if entity_id not in channel_timer.ignored.messages:
-                channel_timer.add_ignored_message(entity_id)
+            # Only added if not already ignored
+            if channel_timer.add_ignored_message(entity_id):
                 return entity_id, entity_type
 
     return None, None
@@ -197,14 +195,12 @@ async def validate_and_add_multiple_ignore_targets(
 
     for entity_id, entity_type, _ in validated_targets:
         if entity_type == "user":
-            # Check if not already ignored
-            if entity_id not in channel_timer.ignored.users:
-                channel_timer.add_ignored_user(entity_id)
+            # Only added if not already ignored
+            if channel_timer.add_ignored_user(entity_id):
                 added_targets.append((entity_id, entity_type))
         else:  # message
-            # Check if not already ignored
-            if entity_id not in channel_timer.ignored.messages:
-                channel_timer.add_ignored_message(entity_id)
+            # Only added if not already ignored
+            if channel_timer.add_ignored_message(entity_id):
                 added_targets.append((entity_id, entity_type))
 
     return added_targets
@@ -0,0 +1,61 @@
+"""
+Lean channel history reads for clears, skipping discord.Message construction
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+
+import discord
+
+
+class RawMessage(NamedTuple):
+    """The only parts of a message a clear needs"""
+
+    id: int
+    author_id: int
+
+    @property
+    def created_at(self) -> datetime:
+        return discord.utils.snowflake_time(self.id)
+
+
+def parse_raw_message(data: Dict[str, Any]) -> RawMessage:
+    return RawMessage(int(data["id"]), int(data["author"]["id"]))
+
+
+async def fetch_raw_history_page(
+    channel: discord.abc.Messageable,
+    limit: int = 100,
+    before: Optional[discord.abc.Snowflake] = None,
+    after: Optional[discord.abc.Snowflake] = None,
+) -> List[RawMessage]:
+    """Fetch one page of history with a single API call
+
+    Uses the same endpoint as ``channel.history`` through discord.py's HTTP
+    client, so rate limits are shared, but only keeps ids and author ids.
+    Pages read with ``after`` alone are returned oldest first, like
+    ``history`` does, anything else newest first.
+    """
+    data = await channel._state.http.logs_from(
+        channel.id,
+        limit,
+        before=before.id if before else None,
+        after=after.id if after else None,
+    )
+    messages = [parse_raw_message(raw_message) for raw_message in data]
+    if after and not before:
+        messages.reverse()
+    return messages
+
+
+async def fetch_pinned_message_ids(channel: discord.abc.Messageable) -> Set[int]:
+    """Ids of the channel's pinned messages, one API call per 50 pins"""
+    pinned_ids: Set[int] = set()
+    before = None
+    while True:
+        data = await channel._state.http.pins_from(channel.id, limit=50, before=before)
+        items = data["items"]
+        pinned_ids.update(int(item["message"]["id"]) for item in items)
+        if not data["has_more"] or not items:
+            return pinned_ids
+        before = items[-1]["pinned_at"]
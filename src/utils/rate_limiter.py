@@ -0,0 +1,117 @@
+"""
+Adaptive pacing for request routes whose real limit is only known at runtime
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
+
+from discord.http import Route
+
+
+class BucketState(NamedTuple):
+    """Rate limit headers of the last response, as tracked by discord.py"""
+
+    limit: int
+    remaining: int
+    reset_after: float
+
+
+def read_bucket_state(http: Any, route: Route) -> Optional[BucketState]:
+    """Look up discord.py's view of the bucket a route belongs to
+
+    discord.py keeps the X-RateLimit headers in private per-bucket objects, so
+    this returns ``None`` whenever they are missing or not filled in yet.
+    """
+    bucket_hashes = getattr(http, "_bucket_hashes", None)
+    buckets = getattr(http, "_buckets", None)
+    if bucket_hashes is None or buckets is None:
+        return None
+
+    bucket_hash = bucket_hashes.get(route.key, route.key)
+    ratelimit = buckets.get(f"{bucket_hash}:{route.major_parameters}")
+    if ratelimit is None or not getattr(ratelimit, "dirty", False):
+        return None
+
+    return BucketState(ratelimit.limit, ratelimit.remaining, ratelimit.reset_after)
+
+
+@dataclass
+class _BucketPacing:
+    rate: float
+    next_slot: datetime
+    rate_limited: int = 0
+
+
+class AdaptiveRateLimiter:
+    """Spaces out calls per key with additive increase, multiplicative decrease
+
+    Every successful call raises the allowed rate a little. A 429 halves it and
+    waits out ``retry_after``; an exhausted bucket waits for its reset without
+    slowing down. Callers sharing a key share one budget.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 1.0,
+        max_rate: float = 5.0,
+        min_rate: float = 0.2,
+        increase: float = 0.25,
+        decrease: float = 0.5,
+        clock: Optional[Callable[[], datetime]] = None,
+        sleep: Optional[Callable[[float], Awaitable[None]]] = None,
+    ):
+        self.initial_rate = initial_rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._sleep = sleep or asyncio.sleep
+        self._buckets: Dict[str, _BucketPacing] = {}
+
+    def _bucket(self, key: str) -> _BucketPacing:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _BucketPacing(rate=self.initial_rate, next_slot=self._clock())
+            self._buckets[key] = bucket
+        return bucket
+
+    async def acquire(self, key: str) -> None:
+        """Wait for this caller's turn in the bucket"""
+        bucket = self._bucket(key)
+        now = self._clock()
+        slot = max(now, bucket.next_slot)
+        # Reserve the slot before sleeping so concurrent callers queue up
+        bucket.next_slot = slot + timedelta(seconds=1 / bucket.rate)
+        wait = (slot - now).total_seconds()
+        if wait > 0:
+            await self._sleep(wait)
+
+    def record_success(self, key: str, state: Optional[BucketState] = None) -> None:
+        bucket = self._bucket(key)
+        bucket.rate = min(bucket.rate + self.increase, self.max_rate)
+
+        if state is not None and state.remaining <= 0 and state.reset_after > 0:
+            # Out of tokens for this window: wait for the reset instead of
+            # letting the next call find out with a 429
+            reset_at = self._clock() + timedelta(seconds=state.reset_after)
+            bucket.next_slot = max(bucket.next_slot, reset_at)
+
+    def record_rate_limited(self, key: str, retry_after: float) -> None:
+        bucket = self._bucket(key)
+        bucket.rate = max(bucket.rate * self.decrease, self.min_rate)
+        bucket.rate_limited += 1
+        retry_at = self._clock() + timedelta(seconds=retry_after)
+        bucket.next_slot = max(bucket.next_slot, retry_at)
+
+    def get_rate(self, key: str) -> float:
+        bucket = self._buckets.get(key)
+        return bucket.rate if bucket else self.initial_rate
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        return {
+            key: {"rate": round(bucket.rate, 2), "rate_limited": bucket.rate_limited}
+            for key, bucket in self._buckets.items()
+        }
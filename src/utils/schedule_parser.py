@@ -10,6 +10,10 @@ class ScheduleParseError(ValueError):
     pass
 
 
+# Timezone dependency of fixed-time timers that name no timezone
+SERVER_TIMEZONE = "@server"
+
+
 class ScheduleExpressionParser:
     TIMEZONE_PATTERN = re.compile(r"^(\d{1,2}:\d{2})\s*([A-Z][\w+-]*)?\s*$")
     INTERVAL_PATTERN = re.compile(r"^(?:(\d+)d)?(?:(\d+)h(?:r)?)?(?:(\d+)m)?$")
@@ -29,9 +33,14 @@ class ScheduleExpressionParser:
         get_server_timezone_func: Optional[
             Callable[[str, Optional[str]], Optional[str]]
         ] = None,
+        clock: Optional[Callable[[], datetime]] = None,
     ) -> None:
         self.timezone_resolver = timezone_resolver
         self.get_server_timezone = get_server_timezone_func
+        self.clock = clock or (lambda: datetime.now(pytz.UTC))
+
+    def _now(self, timezone) -> datetime:
+        return self.clock().astimezone(timezone)
 
     def parse_schedule_expression(
         self, timer_string: str, server_id: str = None
@@ -49,7 +58,7 @@ class ScheduleExpressionParser:
 
             total_minutes = hours * 60
             delta = timedelta(hours=hours)
-            next_run = datetime.now(pytz.UTC) + delta
+            next_run = self._now(pytz.UTC) + delta
             trigger = IntervalTrigger(minutes=total_minutes)
             return trigger, next_run
 
@@ -74,6 +83,21 @@ class ScheduleExpressionParser:
             "Use '1d2h3m' for intervals, '24' for hours, '1/2 HH:MM TIMEZONE' for fractional time, 'HH:MM TIMEZONE' for daily schedules, or 'Mon 15:30 EST' for weekly."
         )
 
+    def get_timezone_dependency(self, timer_string: str) -> Optional[str]:
+        """What a timer's fire times depend on besides the timer itself
+
+        None for intervals, SERVER_TIMEZONE for fixed times without a timezone,
+        otherwise the timezone abbreviation as typed.
+        """
+        timer_string = timer_string.strip()
+        if match := self.FRACTION_TIME_PATTERN.match(timer_string):
+            return match.group(4) or SERVER_TIMEZONE
+        if match := self.WEEKLY_PATTERN.match(timer_string):
+            return match.group(3) or SERVER_TIMEZONE
+        if match := self.TIMEZONE_PATTERN.match(timer_string):
+            return match.group(2) or SERVER_TIMEZONE
+        return None
+
     def _parse_fractional_time_schedule(
         self, match: re.Match, server_id: str = None
     ) -> Tuple[CronTrigger, datetime]:
@@ -138,7 +162,7 @@ class ScheduleExpressionParser:
         trigger = CronTrigger(hour=hours_str, minute=minute, timezone=timezone)
 
         # Calculate next run time
-        now = datetime.now(timezone)
+        now = self._now(timezone)
         next_run = None
 
         # Find the next run time from the list of hours
@@ -190,7 +214,7 @@ class ScheduleExpressionParser:
             raise ScheduleParseError(f"Invalid timezone mapping for '{timezone_abbr}'")
 
         # Calculate next run time
-        now = datetime.now(timezone)
+        now = self._now(timezone)
         next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
         if next_run <= now:
@@ -217,7 +241,7 @@ class ScheduleExpressionParser:
             raise ScheduleParseError("Timer interval must be at least 1 minute.")
 
         delta = timedelta(days=days, hours=hours, minutes=minutes)
-        next_run = datetime.now(pytz.UTC) + delta
+        next_run = self._now(pytz.UTC) + delta
 
         trigger = IntervalTrigger(minutes=total_minutes)
         return trigger, next_run
@@ -265,7 +289,7 @@ class ScheduleExpressionParser:
 
         # Calculate next run time
         next_run = self._find_next_weekly_run(
-            datetime.now(timezone), day_parts, hour, minute, timezone
+            self._now(timezone), day_parts, hour, minute, timezone
         )
 
         return trigger, next_run
@@ -0,0 +1,634 @@
+"""
+Columnar next-fire-time computation for many clear schedules at once
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone, tzinfo
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.cron.expressions import AllExpression, RangeExpression
+from apscheduler.triggers.interval import IntervalTrigger
+
+KIND_INTERVAL = 0
+KIND_CRON = 1
+KIND_FALLBACK = 2
+
+US_PER_SECOND = 1_000_000
+SECONDS_PER_DAY = 86400
+NO_TRANSITION = np.iinfo(np.int64).max
+NO_PREVIOUS_TRANSITION = np.iinfo(np.int64).min
+# Next fire time of a row whose trigger never fires again
+NO_FIRE_TIME = np.iinfo(np.int64).min
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# Lookup table for counting set bits one byte at a time
+_POPCOUNT_8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.int64)
+    return (
+        _POPCOUNT_8[values & 0xFF]
+        + _POPCOUNT_8[(values >> 8) & 0xFF]
+        + _POPCOUNT_8[(values >> 16) & 0xFF]
+    )
+
+
+def _lowest_bit_index(values: np.ndarray) -> np.ndarray:
+    """Index of the lowest set bit, -1 where no bit is set"""
+    lowest = values & -values
+    index = np.full(values.shape, -1, dtype=np.int64)
+    present = lowest > 0
+    index[present] = np.log2(lowest[present]).astype(np.int64)
+    return index
+
+
+def _highest_bit_index(values: np.ndarray) -> np.ndarray:
+    """Index of the highest set bit, -1 where no bit is set"""
+    index = np.full(values.shape, -1, dtype=np.int64)
+    present = values > 0
+    index[present] = np.floor(np.log2(values[present])).astype(np.int64)
+    return index
+
+
+def _to_epoch_us(value: datetime) -> int:
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def _from_epoch_us(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=int(value))
+
+
+def _utc_offset_us(tz: tzinfo, moment: datetime) -> int:
+    return moment.astimezone(tz).utcoffset() // timedelta(microseconds=1)
+
+
+def _find_offset_change(tz: tzinfo, start: datetime, end: datetime) -> datetime:
+    """Binary search for the first second in (start, end] with a new UTC offset"""
+    offset = _utc_offset_us(tz, start)
+    low, high = start, end
+    while high - low > timedelta(seconds=1):
+        middle = low + (high - low) / 2
+        if _utc_offset_us(tz, middle) == offset:
+            low = middle
+        else:
+            high = middle
+    # Offsets change on whole seconds, the only one left in (low, high]
+    return high.replace(microsecond=0)
+
+
+def _next_transition_us(tz: tzinfo, now: datetime, horizon_days: int = 8) -> int:
+    previous = now
+    for day in range(1, horizon_days + 1):
+        probe = now + timedelta(days=day)
+        if _utc_offset_us(tz, probe) != _utc_offset_us(tz, previous):
+            return _to_epoch_us(_find_offset_change(tz, previous, probe))
+        previous = probe
+    return NO_TRANSITION
+
+
+def _previous_transition_us(tz: tzinfo, now: datetime, earliest: datetime) -> int:
+    # Offsets never change twice within a week, so weekly probes are enough
+    later = now
+    while later > earliest:
+        probe = max(later - timedelta(days=7), earliest - timedelta(seconds=1))
+        if _utc_offset_us(tz, probe) != _utc_offset_us(tz, later):
+            return _to_epoch_us(_find_offset_change(tz, probe, later))
+        later = probe
+    return NO_PREVIOUS_TRANSITION
+
+
+def _count_fires(
+    trigger: BaseTrigger, after: datetime, until: datetime
+) -> Tuple[int, Optional[datetime]]:
+    """Fire times in (after, until] and the first one past it
+
+    Steps on UTC instants, local arithmetic drops the fold of the second pass
+    through a repeated hour and would find that pass again.
+    """
+    count = 0
+    fire_time = trigger.get_next_fire_time(None, after + timedelta(microseconds=1))
+    while fire_time is not None and fire_time.timestamp() <= until.timestamp():
+        count += 1
+        fire_time = trigger.get_next_fire_time(
+            None, fire_time.astimezone(dt_timezone.utc) + timedelta(microseconds=1)
+        )
+    return count, fire_time
+
+
+def _field_values(field, low: int, high: int) -> Optional[List[int]]:
+    """Expand a cron field into its values, None if it uses anything fancier"""
+    values = set()
+    for expression in field.expressions:
+        if isinstance(expression, RangeExpression):
+            first = expression.first
+            last = expression.last if expression.last is not None else first
+        elif type(expression) is AllExpression:
+            first, last = low, high
+        else:
+            return None
+        step = expression.step or 1
+        values.update(range(first, last + 1, step))
+    return sorted(values)
+
+
+class ScheduleTable:
+    """Next fire times for many clear schedules computed in one vectorized pass
+
+    Interval rows keep their interval and the stored next run time as anchor.
+    Cron rows keep the minute, an hour bitmask and a weekday bitmask in the
+    trigger's timezone. Results are worked out with the UTC offset in effect
+    on each side of the surrounding offset changes. Rows whose first fire after
+    a change falls near it, catch-up windows reaching back across two changes,
+    and cron triggers using fields the table does not model go through
+    APScheduler.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[Hashable],
+        kind: np.ndarray,
+        interval_us: np.ndarray,
+        anchor_us: np.ndarray,
+        minute: np.ndarray,
+        hour_mask: np.ndarray,
+        weekday_mask: np.ndarray,
+        tz_index: np.ndarray,
+        timezones: Sequence[tzinfo],
+        triggers: Optional[Sequence[Optional[BaseTrigger]]] = None,
+    ) -> None:
+        self.keys = list(keys)
+        self.kind = np.asarray(kind, dtype=np.int8)
+        self.interval_us = np.asarray(interval_us, dtype=np.int64)
+        self.anchor_us = np.asarray(anchor_us, dtype=np.int64)
+        self.minute = np.asarray(minute, dtype=np.int64)
+        self.hour_mask = np.asarray(hour_mask, dtype=np.int64)
+        self.weekday_mask = np.asarray(weekday_mask, dtype=np.int64)
+        self.tz_index = np.asarray(tz_index, dtype=np.int64)
+        self.timezones = list(timezones)
+        self.triggers = list(triggers) if triggers is not None else None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_triggers(
+        cls, entries: Iterable[Tuple[Hashable, BaseTrigger, datetime]]
+    ) -> "ScheduleTable":
+        """Build a table from (key, trigger, stored next run time) entries"""
+        keys, triggers = [], []
+        kind, interval_us, anchor_us = [], [], []
+        minute, hour_mask, weekday_mask, tz_index = [], [], [], []
+        timezones: List[tzinfo] = []
+        tz_positions: Dict[str, int] = {}
+
+        for key, trigger, anchor in entries:
+            keys.append(key)
+            triggers.append(trigger)
+            anchor_us.append(_to_epoch_us(anchor))
+            row = (KIND_FALLBACK, 0, 0, 0, 0, 0)
+
+            if isinstance(trigger, IntervalTrigger):
+                row = (
+                    KIND_INTERVAL,
+                    trigger.interval // timedelta(microseconds=1),
+                    0,
+                    0,
+                    0,
+                    0,
+                )
+            elif isinstance(trigger, CronTrigger):
+                fields = {field.name: field for field in trigger.fields}
+                minutes = _field_values(fields["minute"], 0, 59)
+                hours = _field_values(fields["hour"], 0, 23)
+                weekdays = _field_values(fields["day_of_week"], 0, 6)
+                simple = (
+                    all(
+                        fields[name].is_default
+                        for name in ("year", "month", "day", "week", "second")
+                    )
+                    and trigger.start_date is None
+                    and trigger.end_date is None
+                    and not trigger.jitter
+                    and minutes is not None
+                    and len(minutes) == 1
+                    and hours
+                    and weekdays
+                )
+                if simple:
+                    zone_name = str(trigger.timezone)
+                    if zone_name not in tz_positions:
+                        tz_positions[zone_name] = len(timezones)
+                        timezones.append(trigger.timezone)
+                    row = (
+                        KIND_CRON,
+                        0,
+                        minutes[0],
+                        sum(1 << hour for hour in hours),
+                        sum(1 << day for day in weekdays),
+                        tz_positions[zone_name],
+                    )
+
+            kind.append(row[0])
+            interval_us.append(row[1])
+            minute.append(row[2])
+            hour_mask.append(row[3])
+            weekday_mask.append(row[4])
+            tz_index.append(row[5])
+
+        return cls(
+            keys,
+            kind,
+            interval_us,
+            anchor_us,
+            minute,
+            hour_mask,
+            weekday_mask,
+            tz_index,
+            timezones,
+            triggers,
+        )
+
+    def _trigger(self, row: int) -> BaseTrigger:
+        if self.triggers is not None and self.triggers[row] is not None:
+            return self.triggers[row]
+        if self.kind[row] == KIND_INTERVAL:
+            return IntervalTrigger(
+                seconds=int(self.interval_us[row]) / US_PER_SECOND,
+                start_date=_from_epoch_us(self.anchor_us[row]),
+                timezone=dt_timezone.utc,
+            )
+        hours = [h for h in range(24) if self.hour_mask[row] >> h & 1]
+        days = [DAY_NAMES[d] for d in range(7) if self.weekday_mask[row] >> d & 1]
+        return CronTrigger(
+            day_of_week=",".join(days),
+            hour=",".join(map(str, hours)),
+            minute=int(self.minute[row]),
+            timezone=self.timezones[self.tz_index[row]],
+        )
+
+    def _timezone_columns(self, now: datetime, cron_rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-row UTC offsets and the offset changes surrounding ``now``"""
+        zones = len(self.timezones)
+        columns = {
+            "offset": np.zeros(zones, dtype=np.int64),
+            "next_offset": np.zeros(zones, dtype=np.int64),
+            "next_transition": np.full(zones, NO_TRANSITION, dtype=np.int64),
+            "previous_transition": np.full(
+                zones, NO_PREVIOUS_TRANSITION, dtype=np.int64
+            ),
+            "previous_offset": np.zeros(zones, dtype=np.int64),
+            # The change before the previous one
+            "earlier_transition": np.full(
+                zones, NO_PREVIOUS_TRANSITION, dtype=np.int64
+            ),
+        }
+
+        for position in np.unique(self.tz_index[cron_rows]):
+            tz = self.timezones[position]
+            rows = cron_rows & (self.tz_index == position)
+            earliest = _from_epoch_us(
+                min(self.anchor_us[rows].min(), _to_epoch_us(now))
+            )
+            columns["offset"][position] = _utc_offset_us(tz, now)
+            next_transition = _next_transition_us(tz, now)
+            columns["next_transition"][position] = next_transition
+            columns["next_offset"][position] = (
+                _utc_offset_us(tz, _from_epoch_us(next_transition))
+                if next_transition != NO_TRANSITION
+                else columns["offset"][position]
+            )
+            previous_transition = _previous_transition_us(tz, now, earliest)
+            columns["previous_transition"][position] = previous_transition
+            columns["previous_offset"][position] = columns["offset"][position]
+            if previous_transition != NO_PREVIOUS_TRANSITION:
+                before = _from_epoch_us(previous_transition - 1)
+                columns["previous_offset"][position] = _utc_offset_us(tz, before)
+                columns["earlier_transition"][position] = _previous_transition_us(
+                    tz, before, earliest
+                )
+
+        return {name: values[self.tz_index] for name, values in columns.items()}
+
+    @staticmethod
+    def _fires_before(
+        local_s: np.ndarray,
+        minute_s: np.ndarray,
+        hour_mask: np.ndarray,
+        weekday_mask: np.ndarray,
+    ) -> np.ndarray:
+        """Cron fire times strictly before each local timestamp, counted from a Monday"""
+        day = local_s // SECONDS_PER_DAY
+        second_of_day = local_s - day * SECONDS_PER_DAY
+        # 1970-01-01 was a Thursday
+        week, weekday = np.divmod(day + 3, 7)
+
+        per_day = _popcount(hour_mask)
+        per_week = per_day * _popcount(weekday_mask)
+        earlier_days = _popcount(weekday_mask & ((1 << weekday) - 1))
+
+        hours_passed = np.clip(-((minute_s - second_of_day) // 3600), 0, 24)
+        today = np.where(
+            (weekday_mask >> weekday) & 1,
+            _popcount(hour_mask & ((1 << hours_passed) - 1)),
+            0,
+        )
+        return week * per_week + earlier_days * per_day + today
+
+    @staticmethod
+    def _next_cron_fire(
+        now_us: np.ndarray,
+        offset: np.ndarray,
+        minute_s: np.ndarray,
+        hour_mask: np.ndarray,
+        weekday_mask: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """First cron fire strictly after ``now_us`` assuming a fixed UTC offset"""
+        local_s = (now_us + offset) // US_PER_SECOND
+        day = local_s // SECONDS_PER_DAY
+        second_of_day = local_s - day * SECONDS_PER_DAY
+        weekday = (day + 3) % 7
+        # First hour whose fire time today lies after now
+        first_hour = (second_of_day - minute_s) // 3600 + 1
+
+        fire_day = np.full(local_s.shape, -1, dtype=np.int64)
+        fire_hour = np.zeros(local_s.shape, dtype=np.int64)
+        for ahead in range(8):
+            lowest = np.minimum(first_hour if ahead == 0 else 0, 24)
+            # Clear the bits of hours that have already passed
+            hours = hour_mask & ~((1 << lowest) - 1)
+            runs_today = (weekday_mask >> ((weekday + ahead) % 7)) & 1
+            found = (fire_day < 0) & (runs_today == 1) & (hours > 0)
+            fire_day[found] = day[found] + ahead
+            fire_hour[found] = _lowest_bit_index(hours[found])
+
+        fire_local_s = fire_day * SECONDS_PER_DAY + fire_hour * 3600 + minute_s
+        return fire_local_s * US_PER_SECOND - offset, fire_day >= 0
+
+    @staticmethod
+    def _previous_cron_fire(
+        before_us: np.ndarray,
+        offset: np.ndarray,
+        minute_s: np.ndarray,
+        hour_mask: np.ndarray,
+        weekday_mask: np.ndarray,
+    ) -> np.ndarray:
+        """Last cron fire strictly before ``before_us`` assuming a fixed UTC offset
+
+        ``NO_FIRE_TIME`` where the pattern did not fire in the week before.
+        """
+        # Latest local second a fire may fall on
+        local_s = -(-(before_us + offset) // US_PER_SECOND) - 1
+        day = local_s // SECONDS_PER_DAY
+        second_of_day = local_s - day * SECONDS_PER_DAY
+        weekday = (day + 3) % 7
+        last_hour = (second_of_day - minute_s) // 3600
+
+        fire_day = np.full(local_s.shape, -1, dtype=np.int64)
+        fire_hour = np.zeros(local_s.shape, dtype=np.int64)
+        for back in range(8):
+            highest = np.clip(last_hour if back == 0 else 23, -1, 23)
+            # Clear the bits of hours that are still to come
+            hours = hour_mask & ((1 << (highest + 1)) - 1)
+            runs_today = (weekday_mask >> ((weekday - back) % 7)) & 1
+            found = (fire_day < 0) & (runs_today == 1) & (hours > 0)
+            fire_day[found] = day[found] - back
+            fire_hour[found] = _highest_bit_index(hours[found])
+
+        fire_local_s = fire_day * SECONDS_PER_DAY + fire_hour * 3600 + minute_s
+        return np.where(
+            fire_day >= 0, fire_local_s * US_PER_SECOND - offset, NO_FIRE_TIME
+        )
+
+    def next_fire_times(self, now: datetime) -> Tuple[np.ndarray, np.ndarray]:
+        """Return next fire times (epoch microseconds) and runs missed since the anchor
+
+        The next fire time is the first one strictly after ``now``, or
+        ``NO_FIRE_TIME`` for a trigger that never fires again. Missed runs
+        are the fire times after the anchor that are not after ``now``, matching
+        the interval catch-up used when jobs are restored on startup.
+        """
+        now_us = _to_epoch_us(now)
+        size = len(self.keys)
+        next_us = np.zeros(size, dtype=np.int64)
+        missed = np.zeros(size, dtype=np.int64)
+
+        interval_rows = self.kind == KIND_INTERVAL
+        if interval_rows.any():
+            anchor = self.anchor_us[interval_rows]
+            interval = self.interval_us[interval_rows]
+            elapsed = now_us - anchor
+            overdue = elapsed > 0
+            intervals_missed = np.where(overdue, elapsed // interval, 0)
+            missed[interval_rows] = intervals_missed
+            next_us[interval_rows] = np.where(
+                overdue, anchor + (intervals_missed + 1) * interval, anchor
+            )
+
+        cron_rows = self.kind == KIND_CRON
+        fallback = self.kind == KIND_FALLBACK
+        # Rows whose missed run count holds but whose next fire time does not
+        next_fallback = np.zeros(size, dtype=bool)
+        if cron_rows.any():
+            zone = {
+                name: values[cron_rows]
+                for name, values in self._timezone_columns(now, cron_rows).items()
+            }
+            offset = zone["offset"]
+            anchor = self.anchor_us[cron_rows]
+            pattern = (
+                self.minute[cron_rows] * 60,
+                self.hour_mask[cron_rows],
+                self.weekday_mask[cron_rows],
+            )
+            now_column = np.full(anchor.shape, now_us, dtype=np.int64)
+
+            cron_next, found = self._next_cron_fire(now_column, offset, *pattern)
+            local_now = (now_us + offset) // US_PER_SECOND
+            local_anchor = (anchor + offset) // US_PER_SECOND
+            cron_missed = self._fires_before(
+                local_now + 1, *pattern
+            ) - self._fires_before(local_anchor + 1, *pattern)
+
+            # The fixed offset only holds between the surrounding transitions.
+            # A catch-up window reaching back across the previous one is
+            # counted on either side of it, one reaching further back is left
+            # to the trigger itself
+            rows = np.flatnonzero(cron_rows)
+            full = ~found | (anchor < zone["earlier_transition"])
+            fallback[rows[full]] = True
+            across = ~full & (anchor < zone["previous_transition"])
+            if across.any():
+                transition = zone["previous_transition"][across]
+                previous_offset = zone["previous_offset"][across]
+                across_pattern = tuple(column[across] for column in pattern)
+                first, first_fallback = self._first_fire_from(
+                    transition, previous_offset, offset[across], across_pattern
+                )
+                # Where APScheduler lands after the change depends on where
+                # its search starts, which is just after the last fire before
+                search_from = np.maximum(
+                    anchor[across],
+                    self._previous_cron_fire(
+                        transition, previous_offset, *across_pattern
+                    ),
+                )
+                for index, row in zip(
+                    np.flatnonzero(first_fallback), rows[across][first_fallback]
+                ):
+                    fire_time = self._trigger(row).get_next_fire_time(
+                        None, _from_epoch_us(search_from[index] + 1)
+                    )
+                    first[index] = (
+                        _to_epoch_us(fire_time)
+                        if fire_time is not None
+                        else NO_FIRE_TIME
+                    )
+
+                # Fires before the change, the first one from it on, and the
+                # rest with the offset in effect now
+                before = self._fires_before(
+                    (transition + previous_offset) // US_PER_SECOND, *across_pattern
+                ) - self._fires_before(
+                    (anchor[across] + previous_offset) // US_PER_SECOND + 1,
+                    *across_pattern,
+                )
+                fired = (first != NO_FIRE_TIME) & (first <= now_us)
+                after = self._fires_before(
+                    local_now[across] + 1, *across_pattern
+                ) - self._fires_before(
+                    (first + offset[across]) // US_PER_SECOND + 1, *across_pattern
+                )
+                cron_missed[across] = before + np.where(fired, 1 + after, 0)
+
+            # Nothing fires before the next transition, so the next fire is
+            # the first one from the transition on
+            crossing = cron_next >= zone["next_transition"]
+            if crossing.any():
+                cron_next[crossing], first_fallback = self._first_fire_from(
+                    zone["next_transition"][crossing],
+                    offset[crossing],
+                    zone["next_offset"][crossing],
+                    tuple(column[crossing] for column in pattern),
+                )
+                next_fallback[rows[crossing][first_fallback]] = True
+
+            next_us[cron_rows] = cron_next
+            missed[cron_rows] = np.maximum(cron_missed, 0)
+
+        for row in np.flatnonzero(fallback):
+            fire_time, count = self._fallback_row(row, now)
+            next_us[row] = (
+                _to_epoch_us(fire_time) if fire_time is not None else NO_FIRE_TIME
+            )
+            missed[row] = count
+
+        after_now = now + timedelta(microseconds=1)
+        for row in np.flatnonzero(next_fallback & ~fallback):
+            fire_time = self._trigger(row).get_next_fire_time(None, after_now)
+            next_us[row] = (
+                _to_epoch_us(fire_time) if fire_time is not None else NO_FIRE_TIME
+            )
+
+        return next_us, missed
+
+    def _first_fire_from(
+        self,
+        transition: np.ndarray,
+        offset_before: np.ndarray,
+        offset_after: np.ndarray,
+        pattern: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """First cron fire at or after a transition, searched from before it
+
+        Uses the offset after the change. Returns which rows are left to the
+        trigger instead: a wall clock time inside the skipped or repeated hour
+        shows up as a fire just after the change under either offset, and
+        APScheduler 3 skips the fire in the first hour of the next local day
+        when its search starts before the change.
+        """
+        later, later_found = self._next_cron_fire(
+            transition - 1, offset_after, *pattern
+        )
+        earlier, _ = self._next_cron_fire(transition - 1, offset_before, *pattern)
+        change = np.abs(offset_after - offset_before)
+
+        transition_day = (transition + offset_before) // US_PER_SECOND // SECONDS_PER_DAY
+        later_local = (later + offset_after) // US_PER_SECOND
+        first_hour_next_day = (
+            later_local // SECONDS_PER_DAY == transition_day + 1
+        ) & (later_local % SECONDS_PER_DAY < 3600)
+
+        fallback = (
+            ~later_found
+            | (later < transition + change)
+            | (earlier < transition + change)
+            | first_hour_next_day
+        )
+        return later, fallback
+
+    def _fallback_row(self, row: int, now: datetime) -> Tuple[Optional[datetime], int]:
+        trigger = self._trigger(row)
+        after_now = now + timedelta(microseconds=1)
+        anchor = _from_epoch_us(self.anchor_us[row])
+
+        if isinstance(trigger, IntervalTrigger):
+            step = trigger.interval
+            if anchor >= now:
+                return anchor, 0
+            count = (now - anchor) // step
+            return anchor + step * (count + 1), count
+
+        count, _ = _count_fires(trigger, anchor, now)
+        return trigger.get_next_fire_time(None, after_now), count
+
+    def as_datetimes(
+        self, now: datetime
+    ) -> Dict[Hashable, Tuple[Optional[datetime], int]]:
+        """Next fire time and missed run count per key, None if it never fires again"""
+        next_us, missed = self.next_fire_times(now)
+        return {
+            key: (
+                _from_epoch_us(next_us[row])
+                if next_us[row] != NO_FIRE_TIME
+                else None,
+                int(missed[row]),
+            )
+            for row, key in enumerate(self.keys)
+        }
+
+    def verify(
+        self, now: datetime, rows: Optional[Iterable[int]] = None
+    ) -> List[Tuple[Hashable, datetime, datetime]]:
+        """Compare next fire times with APScheduler, returning any mismatches"""
+        next_us, _ = self.next_fire_times(now)
+        after_now = now + timedelta(microseconds=1)
+        mismatches = []
+
+        for row in rows if rows is not None else range(len(self.keys)):
+            if self.kind[row] == KIND_INTERVAL:
+                anchor = _from_epoch_us(self.anchor_us[row])
+                trigger = IntervalTrigger(
+                    seconds=int(self.interval_us[row]) / US_PER_SECOND,
+                    start_date=anchor,
+                    timezone=dt_timezone.utc,
+                )
+                expected = (
+                    anchor
+                    if anchor >= now
+                    else trigger.get_next_fire_time(None, after_now)
+                )
+            else:
+                expected = self._trigger(row).get_next_fire_time(None, after_now)
+
+            actual = (
+                _from_epoch_us(next_us[row]) if next_us[row] != NO_FIRE_TIME else None
+            )
+            expected_us = _to_epoch_us(expected) if expected is not None else NO_FIRE_TIME
+            if expected_us != next_us[row]:
+                mismatches.append((self.keys[row], actual, expected))
+
+        return mismatches
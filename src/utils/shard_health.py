@@ -0,0 +1,136 @@
+"""
+Shard-wide view of how Discord answers, used to back off during incidents
+"""
+
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Deque, Dict, NamedTuple, Optional
+
+from src.models import HealthMode, HealthModeChange
+from src.utils.logger import logger, LogArea
+
+
+class _ResponseSample(NamedTuple):
+    at: datetime
+    requests: int
+    errors: int
+
+
+class ShardHealthMonitor:
+    """Picks a health mode from the share of 5xx and 429 responses
+
+    Responses are counted over a sliding window. A rising error rate moves
+    straight to the mode it calls for, while recovery steps back one mode at a
+    time, each after the rate stayed below that mode for ``recovery_interval``.
+    Fewer than ``min_requests`` responses in the window count as healthy, so a
+    shard that stopped sending requests still finds its way back.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        min_requests: int = 20,
+        slow_rate: float = 0.1,
+        defer_rate: float = 0.25,
+        shed_rate: float = 0.5,
+        recovery_interval: float = 120.0,
+        clock: Optional[Callable[[], datetime]] = None,
+        on_mode_change: Optional[Callable[[HealthMode, HealthMode], None]] = None,
+    ):
+        self.window = timedelta(seconds=window_seconds)
+        self.min_requests = min_requests
+        self.thresholds = {
+            HealthMode.SLOWED: slow_rate,
+            HealthMode.DEFERRING: defer_rate,
+            HealthMode.SHEDDING: shed_rate,
+        }
+        self.recovery_interval = timedelta(seconds=recovery_interval)
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._on_mode_change = on_mode_change
+        self._samples: Deque[_ResponseSample] = deque()
+        self._requests = 0
+        self._errors = 0
+        self.mode = HealthMode.NORMAL
+        self.mode_changes = 0
+        self.last_change: Optional[HealthModeChange] = None
+        # Since when the error rate allows a milder mode than the current one
+        self._healthy_since: Optional[datetime] = None
+
+    def record_responses(
+        self, requests: int, server_errors: int = 0, rate_limited: int = 0
+    ) -> HealthMode:
+        """Count responses, of which ``server_errors`` were 5xx and ``rate_limited`` 429"""
+        errors = server_errors + rate_limited
+        requests = max(requests, errors)
+        if requests:
+            self._samples.append(_ResponseSample(self._clock(), requests, errors))
+            self._requests += requests
+            self._errors += errors
+        return self.evaluate()
+
+    def error_rate(self) -> float:
+        self._expire()
+        if self._requests < self.min_requests:
+            return 0.0
+        return self._errors / self._requests
+
+    def evaluate(self) -> HealthMode:
+        """Move to the mode the current error rate calls for"""
+        rate = self.error_rate()
+        target = HealthMode.NORMAL
+        for mode, threshold in self.thresholds.items():
+            if rate >= threshold:
+                target = mode
+
+        if target.level > self.mode.level:
+            self._healthy_since = None
+            self._change_mode(target, rate)
+        elif target.level < self.mode.level:
+            now = self._clock()
+            if self._healthy_since is None:
+                self._healthy_since = now
+            elif now - self._healthy_since >= self.recovery_interval:
+                # Each milder mode has to prove itself for a full interval
+                self._healthy_since = now
+                self._change_mode(list(HealthMode)[self.mode.level - 1], rate)
+        else:
+            self._healthy_since = None
+        return self.mode
+
+    def get_status(self) -> Dict[str, Any]:
+        mode = self.evaluate()
+        return {
+            "mode": mode.value,
+            "error_rate": round(self.error_rate(), 3),
+            "requests": self._requests,
+            "errors": self._errors,
+            "window_seconds": int(self.window.total_seconds()),
+            "mode_changes": self.mode_changes,
+            "last_change": self.last_change,
+        }
+
+    def _expire(self) -> None:
+        cutoff = self._clock() - self.window
+        while self._samples and self._samples[0].at < cutoff:
+            sample = self._samples.popleft()
+            self._requests -= sample.requests
+            self._errors -= sample.errors
+
+    def _change_mode(self, mode: HealthMode, rate: float) -> None:
+        previous = self.mode
+        self.mode = mode
+        self.mode_changes += 1
+        self.last_change = HealthModeChange(previous, mode, self._clock(), rate)
+
+        message = (
+            f"Shard health {previous.value} -> {mode.value}: "
+            f"{rate:.0%} of {self._requests} responses in the last "
+            f"{int(self.window.total_seconds())}s were 5xx or 429"
+        )
+        if mode.level > previous.level:
+            logger.warning(LogArea.SCHEDULER, message)
+        else:
+            logger.info(LogArea.SCHEDULER, message)
+
+        if self._on_mode_change:
+            self._on_mode_change(previous, mode)
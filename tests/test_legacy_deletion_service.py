@@ -0,0 +1,227 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import discord
+import pytest
+
+from src.models import ClearCheckpoint, ClearOutcome, IgnoreFilter, Server
+from src.services.clear_job_scheduler_service import SchedulerService
+from src.services.legacy_deletion_service import LegacyDeletionService
+from src.simulation import (
+    FakeClock,
+    FakeGuild,
+    FakeRestBudget,
+    FakeTextChannel,
+    SimulatedDataService,
+)
+from src.simulation.fake_discord import FakeResponse
+from src.utils.rate_limiter import AdaptiveRateLimiter
+
+START = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+
+class LegacySetup:
+    """A subscribed channel full of old messages and a legacy queue to clear it"""
+
+    def __init__(self, message_count: int):
+        self.clock = FakeClock(START)
+        guild = FakeGuild(id=1)
+        self.channel = FakeTextChannel(
+            100,
+            guild,
+            self.clock,
+            FakeRestBudget(self.clock, 50, 0.1),
+            messages_per_hour=0,
+        )
+        self.channel.prefill(message_count, timedelta(days=60))
+        # Newest first, the order the legacy pass deletes in
+        self.message_ids = sorted(self.channel._messages, reverse=True)
+
+        self.data_service = SimulatedDataService()
+        server = Server(str(guild.id), guild.name)
+        server.add_channel(str(self.channel.id), "1h", START)
+        self.data_service.add_simulated_server(server)
+        self.scheduler_service = SchedulerService(
+            self.data_service, clock=self.clock.now, sleep=self.clock.sleep
+        )
+        self.finished = []
+
+    def new_service(self) -> LegacyDeletionService:
+        """A fresh queue, like the one a restarted shard builds"""
+        service = LegacyDeletionService(
+            self.data_service,
+            self.scheduler_service,
+            AdaptiveRateLimiter(clock=self.clock.now, sleep=self.clock.sleep),
+            clock=self.clock.now,
+            sleep=self.clock.sleep,
+        )
+        service.register_finished_callback(
+            lambda channel, checkpoint, result: self.finished.append(result)
+        )
+        return service
+
+    def fail_deletes(self, message_id: int, errors) -> None:
+        """Raise ``errors`` in turn on the next deletes of one message"""
+        errors = list(errors)
+        get_partial_message = self.channel.get_partial_message
+
+        class FailingMessage:
+            def __init__(self, message):
+                self.message = message
+
+            async def delete(self):
+                if errors:
+                    raise errors.pop(0)
+                await self.message.delete()
+
+        def partial_message(requested_id):
+            message = get_partial_message(requested_id)
+            return FailingMessage(message) if requested_id == message_id else message
+
+        self.channel.get_partial_message = partial_message
+
+    def checkpoint(self, before_id: int, deleted_count: int = 0) -> ClearCheckpoint:
+        return ClearCheckpoint(
+            channel_id=str(self.channel.id),
+            guild_id=str(self.channel.guild.id),
+            before_id=before_id,
+            started_at=START,
+            updated_at=START,
+            deleted_count=deleted_count,
+        )
+
+    async def run(self, service: LegacyDeletionService, checkpoint: ClearCheckpoint):
+        service.enqueue(self.channel, checkpoint, IgnoreFilter())
+        result = await self.clock.run_until_complete(
+            service.wait_for_channel(checkpoint.channel_id)
+        )
+        await service.stop()
+        return result
+
+
+def test_pass_resumes_behind_its_checkpoint():
+    setup = LegacySetup(30)
+    # The ten newest messages were handled before the restart
+    resume_at = setup.message_ids[9]
+
+    async def scenario():
+        return await setup.run(
+            setup.new_service(), setup.checkpoint(resume_at, deleted_count=10)
+        )
+
+    result = asyncio.run(scenario())
+
+    assert result.outcome == ClearOutcome.COMPLETED
+    assert result.deleted_count == 30
+    assert result.single_deleted_count == 20
+    assert sorted(setup.channel._messages, reverse=True) == setup.message_ids[:10]
+    assert setup.finished == [result]
+
+
+def test_stopped_pass_saves_its_checkpoint_and_resumes_from_it():
+    setup = LegacySetup(30)
+    newest = setup.message_ids[0] + 1
+
+    async def scenario():
+        service = setup.new_service()
+        service.enqueue(setup.channel, setup.checkpoint(newest), IgnoreFilter())
+        # Stop the shard once a few messages are gone
+        while setup.channel.deleted_count < 12:
+            await setup.clock.settle()
+            setup.clock.advance_to(setup.clock.next_wakeup())
+        await service.stop()
+
+        saved = await setup.data_service.get_clear_checkpoints()
+        assert len(saved) == 1
+        assert saved[0].deleted_count == setup.channel.deleted_count
+        assert saved[0].before_id == setup.message_ids[saved[0].deleted_count - 1]
+
+        restarted = setup.new_service()
+        restarted.mark_stored(saved[0].channel_id)
+        return await setup.run(restarted, saved[0])
+
+    result = asyncio.run(scenario())
+
+    assert result.outcome == ClearOutcome.COMPLETED
+    assert result.deleted_count == 30
+    assert setup.channel.message_count == 0
+    assert asyncio.run(setup.data_service.get_clear_checkpoints()) == []
+
+
+def _server_error():
+    return discord.DiscordServerError(FakeResponse(503, "Service Unavailable"), "")
+
+
+def _client_error(status: int, reason: str, code: int = 0):
+    errors = {403: discord.Forbidden, 404: discord.NotFound}
+    return errors.get(status, discord.HTTPException)(
+        FakeResponse(status, reason), {"code": code, "message": reason}
+    )
+
+
+@pytest.mark.parametrize(
+    "errors, deleted",
+    [
+        ([_server_error(), _server_error()], 30),
+        ([discord.RateLimited(1.0)] * 3, 30),
+        ([_client_error(404, "Not Found", 10008)], 29),
+        ([_client_error(400, "Bad Request")], 29),
+    ],
+)
+def test_delete_errors_that_finish_the_pass(errors, deleted):
+    """Retried errors lose no message, the others only skip the failing one"""
+    setup = LegacySetup(30)
+    setup.fail_deletes(setup.message_ids[5], errors)
+
+    async def scenario():
+        return await setup.run(
+            setup.new_service(), setup.checkpoint(setup.message_ids[0] + 1)
+        )
+
+    result = asyncio.run(scenario())
+
+    assert result.outcome == ClearOutcome.COMPLETED
+    assert result.deleted_count == deleted
+    assert setup.channel.message_count == 30 - deleted
+    assert asyncio.run(setup.data_service.get_clear_checkpoints()) == []
+
+
+def test_repeated_server_errors_stop_the_pass_before_the_message():
+    setup = LegacySetup(30)
+    setup.fail_deletes(setup.message_ids[5], [_server_error()] * 3)
+
+    async def scenario():
+        result = await setup.run(
+            setup.new_service(), setup.checkpoint(setup.message_ids[0] + 1)
+        )
+        saved = await setup.data_service.get_clear_checkpoints()
+        saved_before_id = saved[0].before_id
+        resumed = await setup.run(setup.new_service(), saved[0])
+        return result, saved_before_id, resumed
+
+    result, saved_before_id, resumed = asyncio.run(scenario())
+
+    assert result.outcome == ClearOutcome.TRANSIENT_ERROR
+    assert result.deleted_count == 5
+    # The failing message is the first one the resumed pass reads
+    assert saved_before_id == setup.message_ids[4]
+    assert resumed.outcome == ClearOutcome.COMPLETED
+    assert resumed.deleted_count == 30
+    assert setup.channel.message_count == 0
+
+
+def test_lost_access_ends_the_pass_and_drops_its_checkpoint():
+    setup = LegacySetup(30)
+    setup.fail_deletes(setup.message_ids[5], [_client_error(403, "Forbidden", 50013)])
+
+    async def scenario():
+        service = setup.new_service()
+        result = await setup.run(service, setup.checkpoint(setup.message_ids[0] + 1))
+        return result, service.has_pending(result.channel_id)
+
+    result, pending = asyncio.run(scenario())
+
+    assert result.outcome == ClearOutcome.CHANNEL_UNAVAILABLE
+    assert result.deleted_count == 5
+    assert not pending
+    assert setup.channel.message_count == 25
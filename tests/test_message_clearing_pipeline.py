@@ -0,0 +1,186 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import discord
+import pytest
+
+from src.models import ClearOutcome, ClearResult, IgnoreFilter
+from src.services.clear_job_scheduler_service import SchedulerService
+from src.services.message_clearing_service import MessageService
+from src.simulation import (
+    FakeClock,
+    FakeGuild,
+    FakeRestBudget,
+    FakeTextChannel,
+    SimulatedDataService,
+)
+from src.simulation.fake_discord import FakeResponse
+from src.utils.message_history import RawMessage
+
+
+def test_failed_consumer_does_not_leave_producer_blocked():
+    """A consumer failing while the page queue is full ends the producer too"""
+
+    async def scenario():
+        clock = FakeClock(datetime(2026, 1, 5, tzinfo=timezone.utc))
+        guild = FakeGuild(id=1)
+        channel = FakeTextChannel(
+            100, guild, clock, FakeRestBudget(clock, 50, 0.1), messages_per_hour=0
+        )
+        data_service = SimulatedDataService()
+        service = MessageService(
+            data_service,
+            SchedulerService(data_service, clock=clock.now, sleep=clock.sleep),
+            clock=clock.now,
+            sleep=clock.sleep,
+        )
+        staged = [
+            RawMessage(id=message_id, author_id=1000) for message_id in range(1, 301)
+        ]
+
+        async def failing_consumer(channel, pages, result):
+            # Let the producer fill the queue and block on the next page
+            while not pages.full():
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            raise discord.DiscordServerError(
+                FakeResponse(503, "Service Unavailable"), ""
+            )
+
+        with pytest.raises(discord.DiscordServerError):
+            await service._run_deletion_pass(
+                channel,
+                IgnoreFilter(),
+                ClearResult(channel_id="100", guild_id="1"),
+                failing_consumer,
+                staged_messages=staged,
+                queue_pages=1,
+                after=discord.Object(id=0),
+            )
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+        current = asyncio.current_task()
+        return [task for task in asyncio.all_tasks() if task is not current]
+
+    assert asyncio.run(scenario()) == []
+
+
+def _clearing_service(clock: FakeClock) -> MessageService:
+    data_service = SimulatedDataService()
+    return MessageService(
+        data_service,
+        SchedulerService(data_service, clock=clock.now, sleep=clock.sleep),
+        clock=clock.now,
+        sleep=clock.sleep,
+    )
+
+
+def _server_error():
+    raise discord.DiscordServerError(FakeResponse(503, "Service Unavailable"), "")
+
+
+def _rate_limited():
+    raise discord.RateLimited(2.0)
+
+
+def _bad_request():
+    raise discord.HTTPException(FakeResponse(400, "Bad Request"), "")
+
+
+@pytest.mark.parametrize(
+    "failures, attempts, deleted, rate_limited, outcome",
+    [
+        ([_server_error], 2, 1, 0, ClearOutcome.COMPLETED),
+        ([_rate_limited, _rate_limited], 3, 1, 2, ClearOutcome.COMPLETED),
+        ([_server_error] * 3, 3, 0, 0, ClearOutcome.TRANSIENT_ERROR),
+        ([_rate_limited] * 3, 3, 0, 3, ClearOutcome.TRANSIENT_ERROR),
+        ([_bad_request], 1, 0, 0, ClearOutcome.COMPLETED),
+    ],
+)
+def test_single_delete_retries_only_what_can_succeed(
+    failures, attempts, deleted, rate_limited, outcome
+):
+    """429s and server errors are retried, other rejections skip the message"""
+    failures = list(failures)
+    calls = []
+
+    class FlakyMessage:
+        async def delete(self):
+            calls.append(1)
+            if failures:
+                failures.pop(0)()
+
+    async def scenario():
+        clock = FakeClock(datetime(2026, 1, 5, tzinfo=timezone.utc))
+        channel = FakeTextChannel(
+            100,
+            FakeGuild(id=1),
+            clock,
+            FakeRestBudget(clock, 50, 0.1),
+            messages_per_hour=0,
+        )
+        channel.get_partial_message = lambda message_id: FlakyMessage()
+        result = ClearResult(channel_id="100", guild_id="1")
+        await clock.run_until_complete(
+            _clearing_service(clock)._delete_single_message(
+                channel, RawMessage(id=5, author_id=1000), result
+            )
+        )
+        return result
+
+    result = asyncio.run(scenario())
+    assert len(calls) == attempts
+    assert result.deleted_count == deleted
+    assert result.rate_limited == rate_limited
+    assert result.outcome == outcome
+
+
+def test_rejected_bulk_delete_only_single_deletes_the_bad_messages():
+    """Halving a rejected batch leaves few messages, deleted one at a time"""
+    single_deleted = []
+    in_flight = []
+
+    async def scenario():
+        clock = FakeClock(datetime(2026, 1, 5, tzinfo=timezone.utc))
+        channel = FakeTextChannel(
+            100,
+            FakeGuild(id=1),
+            clock,
+            FakeRestBudget(clock, 50, 0.1),
+            messages_per_hour=0,
+        )
+        channel.prefill(100, timedelta(days=1))
+        message_ids = sorted(channel._messages, reverse=True)
+        channel.bulk_rejected_ids = {message_ids[10], message_ids[70]}
+        get_partial_message = channel.get_partial_message
+
+        class TrackedMessage:
+            def __init__(self, message_id):
+                self.message = get_partial_message(message_id)
+
+            async def delete(self):
+                in_flight.append(self.message.id)
+                assert len(in_flight) == 1
+                await self.message.delete()
+                in_flight.remove(self.message.id)
+                single_deleted.append(self.message.id)
+
+        channel.get_partial_message = TrackedMessage
+        batch = [RawMessage(id=message_id, author_id=1000) for message_id in message_ids]
+        result = ClearResult(channel_id="100", guild_id="1")
+        await clock.run_until_complete(
+            _clearing_service(clock)._bulk_delete_messages(channel, batch, result)
+        )
+        return channel, result
+
+    channel, result = asyncio.run(scenario())
+
+    # Halving stops at pairs, so a refused id may take one neighbour along
+    assert channel.bulk_rejected_ids <= set(single_deleted)
+    assert len(single_deleted) <= 2 * len(channel.bulk_rejected_ids)
+    assert result.single_deleted_count == len(single_deleted)
+    assert result.bulk_deleted_count == 100 - len(single_deleted)
+    assert result.deleted_count == 100
+    assert result.bulk_delete_failures == 1
+    assert channel.message_count == 0
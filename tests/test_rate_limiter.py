@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.utils.rate_limiter import AdaptiveRateLimiter, BucketState
+
+
+class ManualClock:
+    """Clock whose sleeps return at once after moving time forward"""
+
+    def __init__(self):
+        self.start = self.now = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        self.sleeps = []
+        # Seconds since the start at which each sleep ended
+        self.wakeups = []
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += timedelta(seconds=seconds)
+        self.wakeups.append((self.now - self.start).total_seconds())
+
+
+def _limiter(clock: ManualClock, **kwargs) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_successes_raise_the_rate_up_to_the_maximum():
+    limiter = _limiter(ManualClock(), initial_rate=1.0, max_rate=2.0, increase=0.25)
+
+    for expected in (1.25, 1.5, 1.75, 2.0, 2.0):
+        limiter.record_success("guild")
+        assert limiter.get_rate("guild") == expected
+
+
+def test_rate_limit_halves_the_rate_down_to_the_minimum():
+    limiter = _limiter(ManualClock(), initial_rate=1.0, min_rate=0.2)
+
+    for expected in (0.5, 0.25, 0.2):
+        limiter.record_rate_limited("guild", 0)
+        assert limiter.get_rate("guild") == expected
+    assert limiter.get_statistics() == {"guild": {"rate": 0.2, "rate_limited": 3}}
+
+
+def test_acquire_spaces_calls_by_the_current_rate():
+    clock = ManualClock()
+    limiter = _limiter(clock, initial_rate=2.0)
+
+    async def scenario():
+        for _ in range(3):
+            await limiter.acquire("guild")
+
+    asyncio.run(scenario())
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_concurrent_callers_queue_for_their_slots():
+    clock = ManualClock()
+    limiter = _limiter(clock, initial_rate=1.0)
+
+    async def scenario():
+        await asyncio.gather(*(limiter.acquire("guild") for _ in range(3)))
+
+    asyncio.run(scenario())
+    assert clock.wakeups == [1.0, 2.0]
+
+
+def test_acquire_waits_out_retry_after():
+    clock = ManualClock()
+    limiter = _limiter(clock, initial_rate=4.0)
+
+    async def scenario():
+        await limiter.acquire("guild")
+        limiter.record_rate_limited("guild", 3.0)
+        await limiter.acquire("guild")
+
+    asyncio.run(scenario())
+    assert clock.sleeps == [3.0]
+    assert limiter.get_rate("guild") == 2.0
+
+
+def test_exhausted_bucket_waits_for_reset_without_slowing_down():
+    clock = ManualClock()
+    limiter = _limiter(clock, initial_rate=4.0, max_rate=4.0)
+
+    async def scenario():
+        await limiter.acquire("guild")
+        limiter.record_success(
+            "guild", BucketState(limit=5, remaining=0, reset_after=2.0)
+        )
+        await limiter.acquire("guild")
+
+    asyncio.run(scenario())
+    assert clock.sleeps == [2.0]
+    assert limiter.get_rate("guild") == 4.0
+
+
+def test_keys_keep_separate_budgets():
+    limiter = _limiter(ManualClock(), initial_rate=1.0)
+
+    limiter.record_rate_limited("slow", 1.0)
+
+    assert limiter.get_rate("slow") == pytest.approx(0.5)
+    assert limiter.get_rate("fast") == 1.0
@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from src.utils.schedule_table import ScheduleTable
+
+UTC = timezone.utc
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def _apscheduler_reference(trigger, anchor: datetime, now: datetime):
+    """Next fire time after ``now`` and fires in (anchor, now], straight from the trigger"""
+    step = timedelta(microseconds=1)
+    expected = trigger.get_next_fire_time(None, now + step)
+    count = 0
+    fire_time = trigger.get_next_fire_time(None, anchor + step)
+    while fire_time is not None and fire_time.timestamp() <= now.timestamp():
+        count += 1
+        fire_time = trigger.get_next_fire_time(None, fire_time.astimezone(UTC) + step)
+    return expected, count
+
+
+def _timestamp(value):
+    return value.timestamp() if value is not None else None
+
+
+@pytest.mark.parametrize(
+    "zone, hour, anchor, now, expected_next",
+    [
+        (
+            "Australia/Sydney",
+            2,
+            _utc(2026, 4, 4, 10),
+            _utc(2026, 4, 5),
+            _utc(2026, 4, 5, 16, 30),
+        ),
+        (
+            "America/New_York",
+            1,
+            _utc(2026, 10, 31, 10),
+            _utc(2026, 11, 1, 12),
+            _utc(2026, 11, 2, 6, 30),
+        ),
+        (
+            "Europe/Copenhagen",
+            2,
+            _utc(2026, 10, 24, 10),
+            _utc(2026, 10, 25, 12),
+            _utc(2026, 10, 26, 1, 30),
+        ),
+    ],
+)
+def test_catch_up_across_repeated_hour(zone, hour, anchor, now, expected_next):
+    """Both passes through the repeated hour count once, and the count ends"""
+    trigger = CronTrigger(hour=hour, minute=30, timezone=ZoneInfo(zone))
+    table = ScheduleTable.from_triggers([("job", trigger, anchor)])
+
+    assert table.as_datetimes(now) == {"job": (expected_next, 2)}
+
+
+@pytest.mark.parametrize(
+    "zone, transition",
+    [
+        ("Europe/Copenhagen", _utc(2026, 3, 29, 1)),
+        ("Europe/Copenhagen", _utc(2026, 10, 25, 1)),
+        ("America/New_York", _utc(2026, 3, 8, 7)),
+        ("America/New_York", _utc(2026, 11, 1, 6)),
+        ("Australia/Sydney", _utc(2026, 4, 4, 16)),
+        ("Australia/Sydney", _utc(2026, 10, 3, 16)),
+        ("America/Santiago", _utc(2026, 9, 6, 4)),
+    ],
+)
+def test_cron_rows_match_apscheduler_around_transitions(zone, transition):
+    tz = ZoneInfo(zone)
+    triggers = [
+        CronTrigger(hour=hours, minute=minute, day_of_week=days, timezone=tz)
+        for hours in ("0", "1", "2", "3", "23", "0,12", "1,2,3")
+        for minute in (0, 30, 59)
+        for days in ("*", "mon,wed,fri", "sun")
+    ]
+
+    for now_delta in (
+        timedelta(hours=-30),
+        timedelta(minutes=-20),
+        timedelta(0),
+        timedelta(minutes=50),
+        timedelta(days=1),
+        timedelta(days=4),
+    ):
+        now = transition + now_delta
+        for back in (timedelta(hours=1), timedelta(days=2), timedelta(days=9)):
+            entries = [(key, trigger, now - back) for key, trigger in enumerate(triggers)]
+            results = ScheduleTable.from_triggers(entries).as_datetimes(now)
+
+            for key, trigger, anchor in entries:
+                expected_next, expected_missed = _apscheduler_reference(
+                    trigger, anchor, now
+                )
+                next_fire, missed = results[key]
+                assert (_timestamp(next_fire), missed) == (
+                    _timestamp(expected_next),
+                    expected_missed,
+                ), (str(trigger), now, anchor)
+
+
+def test_verify_finds_no_mismatches():
+    now = _utc(2026, 3, 28, 23, 30)
+    entries = [
+        (
+            f"{zone}-{hours}",
+            CronTrigger(hour=hours, minute=15, timezone=ZoneInfo(zone)),
+            now - timedelta(days=3),
+        )
+        for zone in ("UTC", "Europe/Copenhagen", "Asia/Kolkata")
+        for hours in ("0", "2", "5,17", "*")
+    ]
+    entries.append(
+        ("interval", IntervalTrigger(hours=5, timezone=UTC), now - timedelta(hours=12))
+    )
+
+    assert ScheduleTable.from_triggers(entries).verify(now) == []
+
+
+def test_interval_rows_count_missed_runs():
+    now = _utc(2026, 1, 5, 12)
+    trigger = IntervalTrigger(hours=5, timezone=UTC)
+    table = ScheduleTable.from_triggers(
+        [
+            ("overdue", trigger, now - timedelta(hours=12)),
+            ("upcoming", trigger, now + timedelta(hours=1)),
+        ]
+    )
+
+    assert table.as_datetimes(now) == {
+        "overdue": (now + timedelta(hours=3), 2),
+        "upcoming": (now + timedelta(hours=1), 0),
+    }
+
+
+def test_finished_trigger_has_no_next_fire_time():
+    now = _utc(2026, 1, 5, 12)
+    trigger = CronTrigger(hour=9, minute=0, end_date=_utc(2026, 1, 4), timezone=UTC)
+    table = ScheduleTable.from_triggers([("ended", trigger, _utc(2026, 1, 1, 12))])
+
+    assert table.as_datetimes(now) == {"ended": (None, 2)}
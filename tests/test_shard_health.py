@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+
+from src.models import HealthMode
+from src.utils.shard_health import ShardHealthMonitor
+
+
+class SteppedClock:
+    def __init__(self):
+        self.now = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+def _monitor(clock: SteppedClock, changes=None) -> ShardHealthMonitor:
+    return ShardHealthMonitor(
+        window_seconds=60,
+        min_requests=20,
+        recovery_interval=120,
+        clock=clock,
+        on_mode_change=(
+            (lambda previous, mode: changes.append((previous, mode)))
+            if changes is not None
+            else None
+        ),
+    )
+
+
+def test_few_responses_count_as_healthy():
+    monitor = _monitor(SteppedClock())
+
+    assert monitor.record_responses(10, server_errors=10) == HealthMode.NORMAL
+    assert monitor.error_rate() == 0.0
+
+
+def test_rising_error_rate_jumps_straight_to_its_mode():
+    changes = []
+    monitor = _monitor(SteppedClock(), changes)
+
+    assert monitor.record_responses(100, server_errors=30, rate_limited=25) == (
+        HealthMode.SHEDDING
+    )
+    assert changes == [(HealthMode.NORMAL, HealthMode.SHEDDING)]
+    assert monitor.last_change.error_rate == 0.55
+
+
+def test_each_threshold_picks_its_mode():
+    for errors, mode in (
+        (5, HealthMode.NORMAL),
+        (10, HealthMode.SLOWED),
+        (25, HealthMode.DEFERRING),
+        (50, HealthMode.SHEDDING),
+    ):
+        monitor = _monitor(SteppedClock())
+        assert monitor.record_responses(100, rate_limited=errors) == mode
+
+
+def test_recovery_steps_back_one_mode_per_interval():
+    clock = SteppedClock()
+    changes = []
+    monitor = _monitor(clock, changes)
+    monitor.record_responses(100, server_errors=60)
+
+    # The errors age out of the window, the mode holds until the rate has
+    # stayed low for a full recovery interval
+    clock.advance(61)
+    assert monitor.evaluate() == HealthMode.SHEDDING
+    clock.advance(119)
+    assert monitor.evaluate() == HealthMode.SHEDDING
+    clock.advance(1)
+    assert monitor.evaluate() == HealthMode.DEFERRING
+    clock.advance(120)
+    assert monitor.evaluate() == HealthMode.SLOWED
+    clock.advance(120)
+    assert monitor.evaluate() == HealthMode.NORMAL
+
+    assert changes == [
+        (HealthMode.NORMAL, HealthMode.SHEDDING),
+        (HealthMode.SHEDDING, HealthMode.DEFERRING),
+        (HealthMode.DEFERRING, HealthMode.SLOWED),
+        (HealthMode.SLOWED, HealthMode.NORMAL),
+    ]
+
+
+def test_new_errors_during_recovery_restart_the_interval():
+    clock = SteppedClock()
+    monitor = _monitor(clock)
+    monitor.record_responses(100, server_errors=30)
+    assert monitor.mode == HealthMode.DEFERRING
+
+    clock.advance(61)
+    monitor.evaluate()
+    clock.advance(100)
+    # Back at the current mode's rate, so the healthy stretch starts over
+    monitor.record_responses(100, server_errors=30)
+    clock.advance(61)
+    monitor.evaluate()
+    clock.advance(100)
+    assert monitor.evaluate() == HealthMode.DEFERRING
+    clock.advance(20)
+    assert monitor.evaluate() == HealthMode.SLOWED